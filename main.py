@@ -10,7 +10,12 @@ from src.document_chunking.application.chunking_service import (
 )
 from src.document_extraction.application.extraction_service import extract_markdown
 from src.knowledge_embedding.application.embed_pipeline import embed_chunks
-from src.knowledge_store.application.upsert_service import main_upsert
+from src.knowledge_embedding.domain.services import deterministic_chunk_id
+from src.knowledge_embedding.infrastructure.embedding_cache import RunEmbeddingStore
+from src.knowledge_store.application.upsert_service import (
+    main_upsert,
+    plan_incremental_upsert,
+)
 from src.knowledge_store.infrastructure.milvus_store import MilvusStore
 from src.shared.config import ChunkingSettings, EmbeddingSettings, MilvusSettings
 
@@ -26,13 +31,18 @@ def run_pipeline(
     milvus_settings: MilvusSettings,
     chunking_settings: ChunkingSettings,
     embedding_settings: EmbeddingSettings,
+    extraction_profile: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """Run extraction → chunking → embedding and optionally upsert.
 
     Callers must supply document identifiers plus concrete settings objects for
     Milvus, chunking, and embedding so configuration is explicit at the entry
-    point. When `skip_if_unchanged` is true and Milvus already stores a row with
-    the same identifiers, the pipeline short-circuits and returns an empty list.
+    point. When Milvus already stores a row with the same identifiers, or the
+    same content under another name (whose rows are then copied), the pipeline
+    short-circuits and returns an empty list. With incremental upserts
+    enabled only chunks that are not stored yet are embedded and returned.
+    `extraction_profile` (fast | balanced | accurate) is passed to extraction;
+    None uses EXTRACTION_PROFILE.
     """
     if not source:
         raise ValueError("`source` is required to run the pipeline.")
@@ -45,14 +55,16 @@ def run_pipeline(
     if milvus_settings.is_configured():
         milvus_ready = milvus_settings.ensure_ready()
 
+    store: Optional[MilvusStore] = None
+    workspace_id = ""
     if milvus_ready is not None:
+        workspace_id = milvus_ready.partition_key_value or ""
         try:
             store = MilvusStore(milvus_ready)
-            workspace_id = milvus_ready.partition_key_value or None
             if store.document_exists(
                 doc_name=doc_name,
                 doc_hash=doc_hash,
-                workspace_id=workspace_id,
+                workspace_id=workspace_id or None,
             ):
                 logger.info(
                     "Document '%s' already ingested with matching hash; skipping pipeline.",
@@ -62,16 +74,76 @@ def run_pipeline(
         except Exception as exc:  # pragma: no cover - defensive: continue when Milvus check fails
             logger.warning("Milvus preflight check failed; continuing pipeline: %s", exc)
 
-    markdown = extract_markdown(source)
-
+    if store is not None:
+        # Same content under a new name: reuse the stored chunks and vectors
+        # instead of paying for extraction, OCR and embeddings again.
+        try:
+            copied = store.copy_document(
+                doc_hash=doc_hash,
+                doc_name=doc_name,
+                workspace_id=workspace_id or None,
+                chunk_id=deterministic_chunk_id,
+                source=source,
+            )
+        except Exception as exc:  # pragma: no cover - defensive: fall back to the full pipeline
+            logger.warning("Copying stored chunks failed; running full pipeline: %s", exc)
+            copied = 0
+        if copied:
+            logger.info(
+                "Document '%s' matches stored content; copied %d chunks without re-ingesting.",
+                doc_name,
+                copied,
+            )
+            return []
+
+    markdown = extract_markdown(source, profile=extraction_profile)
+
+    # Shared by chunking and embedding so sentence windows are only paid for once.
+    embedding_store = RunEmbeddingStore()
     chunks = generate_document_chunks(
         markdown,
         source=source,
         doc_name=doc_name,
         doc_hash=doc_hash,
         settings=chunking_settings,
+        embedding_store=embedding_store,
+    )
+
+    if milvus_ready is not None and milvus_ready.incremental_upsert:
+        store = store or MilvusStore(milvus_ready)
+        # Only chunks whose content-derived id is not stored yet are embedded.
+        plan = plan_incremental_upsert(
+            store,
+            chunks,
+            doc_name=doc_name,
+            workspace_id=workspace_id,
+        )
+        embedded_chunks = embed_chunks(
+            plan.new_chunks,
+            settings=embedding_settings,
+            embedding_store=embedding_store,
+            workspace_id=workspace_id,
+        )
+        summary = store.sync_document(
+            embedded_chunks,
+            refresh=plan.refresh_rows,
+            delete_ids=plan.removed_ids,
+        )
+        logger.info(
+            "Incremental upsert for '%s': %d inserted, %d kept, %d deleted.",
+            doc_name,
+            summary["inserted"],
+            summary["refreshed"],
+            summary["deleted"],
+        )
+        return embedded_chunks
+
+    embedded_chunks = embed_chunks(
+        chunks,
+        settings=embedding_settings,
+        embedding_store=embedding_store,
+        workspace_id=workspace_id,
     )
-    embedded_chunks = embed_chunks(chunks, settings=embedding_settings)
 
     if milvus_ready is not None:
         main_upsert(embedded_chunks, settings=milvus_ready)
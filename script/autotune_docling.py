@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Find the fastest Docling thread count and page batch sizes for this host.
+
+Every PDF in the source directory (default: data/) is converted with OCR and
+picture description turned off, so only the local layout/table models run
+and no Mistral API calls are made. The sweep runs in two passes:
+
+1. thread counts (1, 2, 4, ... up to every core) with the default batches;
+2. at the fastest thread count, page batch sizes for the standard pipeline
+   and per-stage batch sizes for the threaded pipeline.
+
+Models are loaded before timing, each candidate is timed over ROUNDS
+conversions, and the median seconds per page is compared. The fastest
+configuration is written as EXTRACTION_* variables to the tuning file that
+`src/shared/config.py` loads (EXTRACTION_TUNING_PATH, default
+.cache/docling_tuning.env). Values set in the environment or .env still win.
+
+Usage:
+  python script/autotune_docling.py [source_dir] [pages]
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from docling.datamodel.base_models import InputFormat
+from docling.document_converter import DocumentConverter, PdfFormatOption
+
+from src.document_extraction.infrastructure.pipeline_option import (
+    DoclingRuntime,
+    apply_page_batch_size,
+    build_pdf_pipeline_options,
+    pdf_pipeline_cls,
+)
+
+PAGES: int = 20  # Pages converted per PDF and round.
+ROUNDS: int = 3
+BATCH_SIZES: Tuple[int, ...] = (1, 2, 4, 8, 16)
+
+
+def thread_counts(cores: int) -> List[int]:
+    counts = []
+    count = 1
+    while count < cores:
+        counts.append(count)
+        count *= 2
+    counts.append(cores)
+    return counts
+
+
+def build_converter(runtime: DoclingRuntime) -> DocumentConverter:
+    options = build_pdf_pipeline_options("autotune-placeholder", do_ocr=False, runtime=runtime)
+    # Only the local models are measured; nothing is sent to Mistral.
+    options.do_picture_description = False
+    options.generate_picture_images = False
+    apply_page_batch_size(runtime)
+    converter = DocumentConverter(
+        allowed_formats=[InputFormat.PDF],
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=pdf_pipeline_cls(runtime), pipeline_options=options
+            )
+        },
+    )
+    converter.initialize_pipeline(InputFormat.PDF)
+    return converter
+
+
+def seconds_per_page(runtime: DoclingRuntime, pdfs: List[Path], pages: int) -> float:
+    converter = build_converter(runtime)
+    # Warm-up conversion, not timed.
+    converter.convert(str(pdfs[0]), page_range=(1, 1))
+    timings: List[float] = []
+    for _ in range(ROUNDS):
+        converted = 0
+        start = time.perf_counter()
+        for pdf in pdfs:
+            result = converter.convert(str(pdf), page_range=(1, pages))
+            converted += len(result.pages)
+        timings.append((time.perf_counter() - start) / max(1, converted))
+    return statistics.median(timings)
+
+
+def describe(runtime: DoclingRuntime) -> str:
+    if runtime.threaded:
+        batches = (
+            f"layout={runtime.layout_batch_size} table={runtime.table_batch_size}"
+        )
+    else:
+        batches = f"page batch={runtime.page_batch_size}"
+    return f"{runtime.pdf_pipeline:9} threads={runtime.num_threads:<3} {batches}"
+
+
+def measure(
+    candidates: List[DoclingRuntime], pdfs: List[Path], pages: int
+) -> List[Tuple[float, DoclingRuntime]]:
+    results = []
+    for runtime in candidates:
+        elapsed = seconds_per_page(runtime, pdfs, pages)
+        print(f"{describe(runtime):48} {elapsed * 1000:10.1f} ms/page")
+        results.append((elapsed, runtime))
+    return results
+
+
+def write_tuning(path: Path, runtime: DoclingRuntime, elapsed: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [
+        f"# Written by script/autotune_docling.py: {elapsed * 1000:.1f} ms/page",
+        f"# on {os.cpu_count()} cores ({time.strftime('%Y-%m-%d %H:%M:%S')}).",
+        f"EXTRACTION_NUM_THREADS={runtime.num_threads}",
+        f"EXTRACTION_PDF_PIPELINE={runtime.pdf_pipeline}",
+        f"EXTRACTION_PAGE_BATCH_SIZE={runtime.page_batch_size}",
+        f"EXTRACTION_LAYOUT_BATCH_SIZE={runtime.layout_batch_size}",
+        f"EXTRACTION_TABLE_BATCH_SIZE={runtime.table_batch_size}",
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def main(argv: List[str]) -> int:
+    source_dir = Path(argv[1]) if len(argv) > 1 else PROJECT_ROOT / "data"
+    pages = int(argv[2]) if len(argv) > 2 else PAGES
+    pdfs = sorted(path for path in source_dir.iterdir() if path.suffix.lower() == ".pdf")
+    if not pdfs:
+        print(f"No PDFs found in {source_dir}", file=sys.stderr)
+        return 1
+
+    cores = os.cpu_count() or 1
+    base = replace(DoclingRuntime.from_settings(), pdf_pipeline="standard")
+    print(f"PDFs: {len(pdfs)} from {source_dir}, {pages} pages each, {cores} cores")
+
+    print("\nThreads")
+    results = measure(
+        [replace(base, num_threads=threads) for threads in thread_counts(cores)],
+        pdfs,
+        pages,
+    )
+    threads = min(results, key=lambda result: result[0])[1].num_threads
+
+    print("\nBatch sizes")
+    candidates = [
+        replace(base, num_threads=threads, page_batch_size=size) for size in BATCH_SIZES
+    ] + [
+        replace(
+            base,
+            num_threads=threads,
+            pdf_pipeline="threaded",
+            layout_batch_size=size,
+            table_batch_size=size,
+        )
+        for size in BATCH_SIZES
+    ]
+    results += measure(candidates, pdfs, pages)
+
+    elapsed, fastest = min(results, key=lambda result: result[0])
+    tuning_path = Path(os.getenv("EXTRACTION_TUNING_PATH", ".cache/docling_tuning.env"))
+    write_tuning(tuning_path, fastest, elapsed)
+    print(f"\nFastest: {describe(fastest)} ({elapsed * 1000:.1f} ms/page)")
+    print(f"Written to {tuning_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Measure per-document converter overhead with and without converter reuse.
+
+"fresh" rebuilds the pipeline options and a new DocumentConverter for every
+file (the previous behaviour); "pooled" reuses the process-wide converter.
+Both initialize the pipeline for the file's format, which is where Docling
+loads its layout/table models and the Mistral clients are created.
+
+Usage:
+  python script/benchmark_converter_pool.py [source_dir] [files]
+
+Files in `source_dir` (default: data/) are cycled until `files` (default 500)
+documents have been processed. Set CONVERT = True to also run full
+conversions; this calls the Mistral APIs and is billed.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import time
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from docling.datamodel.base_models import InputFormat
+from docling.document_converter import DocumentConverter
+
+from src.document_extraction.domain.ocr_policy import OcrPolicyDecider
+from src.document_extraction.infrastructure.converter_pool import (
+    build_document_converter,
+    clear_document_converters,
+    get_document_converter,
+)
+
+FILES: int = 500
+CONVERT: bool = False  # Full conversions call Mistral OCR/vision and cost money.
+
+_FORMATS: Dict[str, InputFormat] = {
+    ".pdf": InputFormat.PDF,
+    ".png": InputFormat.IMAGE,
+    ".jpg": InputFormat.IMAGE,
+    ".jpeg": InputFormat.IMAGE,
+    ".tif": InputFormat.IMAGE,
+    ".tiff": InputFormat.IMAGE,
+    ".pptx": InputFormat.PPTX,
+    ".docx": InputFormat.DOCX,
+    ".html": InputFormat.HTML,
+    ".md": InputFormat.MD,
+    ".csv": InputFormat.CSV,
+    ".adoc": InputFormat.ASCIIDOC,
+}
+
+
+def sample_files(source_dir: Path, count: int) -> List[Path]:
+    files = sorted(
+        path for path in source_dir.iterdir() if path.suffix.lower() in _FORMATS
+    )
+    if not files:
+        raise SystemExit(f"No supported documents found in {source_dir}")
+    return list(islice(cycle(files), count))
+
+
+def run_batch(
+    files: List[Path],
+    converter_for: Callable[[str, bool], DocumentConverter],
+    mistral_key: str,
+) -> List[float]:
+    policy = OcrPolicyDecider()
+    timings: List[float] = []
+    for path in files:
+        start = time.perf_counter()
+        converter = converter_for(mistral_key, policy.should_ocr(path))
+        converter.initialize_pipeline(_FORMATS[path.suffix.lower()])
+        if CONVERT:
+            converter.convert(str(path))
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label: str, timings: List[float]) -> None:
+    first, rest = timings[0], timings[1:] or [0.0]
+    p95 = sorted(rest)[int(len(rest) * 0.95) - 1] if len(rest) > 1 else rest[0]
+    print(
+        f"{label:8} {len(timings):6d} {sum(timings):10.2f}s {first:10.3f}s "
+        f"{statistics.mean(rest) * 1000:12.1f}ms {p95 * 1000:10.1f}ms"
+    )
+
+
+def main(argv: List[str]) -> int:
+    source_dir = Path(argv[1]) if len(argv) > 1 else PROJECT_ROOT / "data"
+    count = int(argv[2]) if len(argv) > 2 else FILES
+    mistral_key = os.getenv("MISTRAL_KEY") or ""
+    if CONVERT and not mistral_key:
+        print("MISTRAL_KEY is required when CONVERT = True.", file=sys.stderr)
+        return 1
+    # Initialization never calls the API, so a placeholder key is enough.
+    mistral_key = mistral_key or "benchmark-placeholder"
+
+    files = sample_files(source_dir, count)
+    print(f"Documents: {len(files)} from {source_dir} (convert={CONVERT})")
+    header = (
+        f"{'Mode':8} {'Docs':>6} {'Total':>11} {'Startup':>11} "
+        f"{'Mean/doc':>14} {'p95/doc':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    fresh = run_batch(
+        files,
+        lambda key, do_ocr: build_document_converter(key, do_ocr=do_ocr),
+        mistral_key,
+    )
+    report("fresh", fresh)
+
+    clear_document_converters()
+    pooled = run_batch(
+        files,
+        lambda key, do_ocr: get_document_converter(key, do_ocr=do_ocr),
+        mistral_key,
+    )
+    report("pooled", pooled)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
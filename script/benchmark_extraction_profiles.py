@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Compare extraction profiles (fast / balanced / accurate) on sample documents.
+
+Every supported file in the source directory (default: data/) is extracted
+with each profile through `run_extraction`. The table reports wall time,
+markdown size, tables, picture descriptions and the estimated Mistral cost
+per file and profile. The OCR and picture-description caches are disabled so
+every profile pays for its own calls, and each profile's converters are
+initialized before timing so model loading is not counted.
+
+Full extractions call the Mistral OCR/vision APIs and are billed; MISTRAL_KEY
+is required.
+
+Usage:
+  python script/benchmark_extraction_profiles.py [source_dir] [profiles]
+
+`profiles` is a comma-separated list (default: fast,accurate).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Settings are read at import time: turn the result caches off first.
+os.environ["MISTRAL_OCR_CACHE_PATH"] = "off"
+os.environ["MISTRAL_PICTURE_CACHE_PATH"] = "off"
+
+from docling.datamodel.base_models import InputFormat
+
+from src.cost_management.infrastructure.mistral_cost_tracker import (
+    mistral_cost_tracker,
+)
+from src.document_extraction.domain.ocr_policy import OcrPolicyDecider
+from src.document_extraction.infrastructure.converter_pool import get_document_converter
+from src.document_extraction.infrastructure.docling_extractor import run_extraction
+from src.document_extraction.infrastructure.pipeline_option import get_extraction_profile
+
+PROFILES: str = "fast,accurate"
+
+_FORMATS: Dict[str, InputFormat] = {
+    ".pdf": InputFormat.PDF,
+    ".png": InputFormat.IMAGE,
+    ".jpg": InputFormat.IMAGE,
+    ".jpeg": InputFormat.IMAGE,
+    ".tif": InputFormat.IMAGE,
+    ".tiff": InputFormat.IMAGE,
+    ".pptx": InputFormat.PPTX,
+    ".docx": InputFormat.DOCX,
+    ".html": InputFormat.HTML,
+    ".md": InputFormat.MD,
+    ".csv": InputFormat.CSV,
+    ".adoc": InputFormat.ASCIIDOC,
+}
+_TABLE_RULE = re.compile(r"^\|(?:\s*:?-+:?\s*\|)+\s*$", re.MULTILINE)
+_DESCRIPTION = "<!-- image description:"
+
+
+def warm_up(files: List[Path], profile: str, mistral_key: str) -> None:
+    policy = OcrPolicyDecider()
+    for path in files:
+        converter = get_document_converter(
+            mistral_key,
+            do_ocr=policy.should_ocr(path),
+            profile=get_extraction_profile(profile),
+        )
+        converter.initialize_pipeline(_FORMATS[path.suffix.lower()])
+
+
+def extract(path: Path, profile: str) -> Dict[str, float]:
+    start = time.perf_counter()
+    # run_extraction prints its run report; keep the benchmark table readable.
+    with contextlib.redirect_stdout(io.StringIO()):
+        markdown = run_extraction(str(path), profile=profile)
+    elapsed = time.perf_counter() - start
+    return {
+        "seconds": elapsed,
+        "chars": len(markdown),
+        "tables": len(_TABLE_RULE.findall(markdown)),
+        "descriptions": markdown.count(_DESCRIPTION),
+        "cost": mistral_cost_tracker.report()["total_cost_usd"],
+    }
+
+
+def main(argv: List[str]) -> int:
+    source_dir = Path(argv[1]) if len(argv) > 1 else PROJECT_ROOT / "data"
+    profiles = [name.strip() for name in (argv[2] if len(argv) > 2 else PROFILES).split(",")]
+    for profile in profiles:
+        get_extraction_profile(profile)  # Fail fast on unknown names.
+
+    mistral_key = os.getenv("MISTRAL_KEY")
+    if not mistral_key:
+        print("MISTRAL_KEY is required; extractions call the Mistral APIs.", file=sys.stderr)
+        return 1
+
+    files = sorted(
+        path for path in source_dir.iterdir() if path.suffix.lower() in _FORMATS
+    )
+    if not files:
+        print(f"No supported documents found in {source_dir}", file=sys.stderr)
+        return 1
+
+    for profile in profiles:
+        warm_up(files, profile, mistral_key)
+
+    header = (
+        f"{'File':36} {'Profile':9} {'Seconds':>9} {'Chars':>9} "
+        f"{'Tables':>7} {'Pictures':>9} {'Cost $':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    totals: Dict[str, Dict[str, float]] = {profile: {} for profile in profiles}
+    for path in files:
+        for profile in profiles:
+            stats = extract(path, profile)
+            for name, value in stats.items():
+                totals[profile][name] = totals[profile].get(name, 0.0) + value
+            print(
+                f"{path.name[:36]:36} {profile:9} {stats['seconds']:9.2f} {stats['chars']:9d} "
+                f"{stats['tables']:7d} {stats['descriptions']:9d} {stats['cost']:10.4f}"
+            )
+
+    print("-" * len(header))
+    for profile in profiles:
+        stats = totals[profile]
+        print(
+            f"{'TOTAL':36} {profile:9} {stats['seconds']:9.2f} {int(stats['chars']):9d} "
+            f"{int(stats['tables']):7d} {int(stats['descriptions']):9d} {stats['cost']:10.4f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Compare image payload encodings for OCR and picture-description calls.
+
+Pages of a PDF are rendered with pypdfium2 (Docling's PDF backend) at the
+scales the pipeline uses: 1.0 for page OCR and 2.0 for picture crops. Every
+other PNG/JPEG in the source directory is treated as a picture. Each image is
+encoded with the previous default (lossless PNG at rendered size) and with
+the configured OCR/picture encodings, and the base64 payload size and encode
+time are reported. No API calls are made.
+
+Usage:
+  python script/benchmark_image_encoding.py [path/to/file.pdf] [pages]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pypdfium2 as pdfium
+from PIL import Image
+
+from src.document_extraction.infrastructure.adapter.utils import (
+    ImageEncoding,
+    _image_to_data_url,
+)
+from src.shared.config import ExtractionSettings
+
+PAGES: int = 20
+
+
+def render_pages(path: Path, pages: int, scale: float) -> List[Image.Image]:
+    pdf = pdfium.PdfDocument(str(path))
+    try:
+        count = min(pages, len(pdf))
+        return [pdf[index].render(scale=scale).to_pil() for index in range(count)]
+    finally:
+        pdf.close()
+
+
+def load_pictures(source_dir: Path) -> List[Image.Image]:
+    pictures: List[Image.Image] = []
+    for path in sorted(source_dir.iterdir()):
+        if path.suffix.lower() in {".png", ".jpg", ".jpeg"}:
+            with Image.open(path) as image:
+                image.load()
+                pictures.append(image)
+    return pictures
+
+
+def measure(images: List[Image.Image], encoding: ImageEncoding) -> Tuple[float, float]:
+    """Return (KiB per image, ms per image) for base64 payloads."""
+
+    total_bytes = 0
+    start = time.perf_counter()
+    for image in images:
+        total_bytes += len(_image_to_data_url(image, encoding, use="benchmark"))
+    elapsed = time.perf_counter() - start
+    count = max(1, len(images))
+    return total_bytes / 1024 / count, elapsed * 1000 / count
+
+
+def report(label: str, images: List[Image.Image], encodings: Dict[str, ImageEncoding]) -> None:
+    if not images:
+        print(f"{label}: no images")
+        return
+    width, height = images[0].size
+    print(f"\n{label}: {len(images)} images (first {width}x{height})")
+    header = f"{'Encoding':34} {'KiB/img':>10} {'ms/img':>10} {'vs PNG':>8}"
+    print(header)
+    print("-" * len(header))
+    baseline = None
+    for name, encoding in encodings.items():
+        kib, ms = measure(images, encoding)
+        baseline = baseline or kib
+        print(f"{name:34} {kib:10.1f} {ms:10.1f} {kib / baseline:8.0%}")
+
+
+def main(argv: List[str]) -> int:
+    pdf_path = Path(argv[1]) if len(argv) > 1 else PROJECT_ROOT / "data" / "Cryptography.pdf"
+    pages = int(argv[2]) if len(argv) > 2 else PAGES
+    settings = ExtractionSettings()
+
+    ocr_encoding = ImageEncoding(
+        format=settings.ocr_image_format,
+        quality=settings.ocr_image_quality,
+        max_long_edge=settings.ocr_image_max_edge,
+    )
+    picture_encoding = ImageEncoding(
+        format=settings.picture_image_format,
+        quality=settings.picture_image_quality,
+        max_long_edge=settings.picture_image_max_edge,
+    )
+
+    ocr_pages = render_pages(pdf_path, pages, scale=1.0)
+    report(
+        "OCR page images (scale 1.0)",
+        ocr_pages,
+        {
+            "png (previous)": ImageEncoding(),
+            f"configured {ocr_encoding.format} q{ocr_encoding.quality} <= {ocr_encoding.max_long_edge}px": ocr_encoding,
+            "webp q90": ImageEncoding(format="WEBP", quality=90, max_long_edge=ocr_encoding.max_long_edge),
+        },
+    )
+
+    pictures = render_pages(pdf_path, pages, scale=2.0) + load_pictures(pdf_path.parent)
+    report(
+        "Picture crops (scale 2.0 pages + image files)",
+        pictures,
+        {
+            "png (previous)": ImageEncoding(),
+            f"configured {picture_encoding.format} q{picture_encoding.quality} <= {picture_encoding.max_long_edge}px": picture_encoding,
+            "webp q80 <= 1024px": ImageEncoding(format="WEBP", quality=80, max_long_edge=1024),
+        },
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
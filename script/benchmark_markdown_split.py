@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Compare the LangChain structural splitter with the single-pass scanner.
+
+Usage:
+  python script/benchmark_markdown_split.py [path/to/file.md | path/to/dir] [target_mb]
+
+Without a path a synthetic corpus of `target_mb` megabytes (default 50) is
+generated with headers, lists, long paragraphs, fenced code and tables.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.document_chunking.infrastructure.markdown_splitter import (
+    split_markdown_structure,
+)
+from src.document_chunking.infrastructure.markdown_structure import (
+    split_markdown_sections,
+)
+from src.shared.config import ChunkingSettings
+
+TARGET_MB: float = 50.0
+
+_SECTION_TEMPLATE = """# Report {index}
+
+Overview for report {index}. Revenue grew in every region this quarter! Did the new pricing help?
+Teams shipped {index} features and closed several long-standing issues.
+
+## Highlights
+
+- Item one for report {index}
+- Item two with **bold** text and `inline code`
+- Item three links to [the docs](https://example.com/{index})
+
+### Details
+
+{long_paragraph}
+
+```python
+# this comment is not a header
+def total(values):
+    return sum(value * {index} for value in values)
+```
+
+| Region | Revenue | Growth |
+|--------|--------:|:------:|
+| North  | {index}  | 4%     |
+| South  | 120     | 2%     |
+
+#### Notes
+
+Closing remarks for report {index}.
+"""
+
+_LONG_SENTENCE = "The pipeline splits long sections along paragraph boundaries before semantic chunking. "
+
+
+def synthetic_corpus(target_mb: float) -> str:
+    target = int(target_mb * 1024 * 1024)
+    parts: List[str] = []
+    size = 0
+    index = 0
+    while size < target:
+        # Every fourth section is long enough to trigger sub-splitting.
+        repeats = 60 if index % 4 == 0 else 8
+        section = _SECTION_TEMPLATE.format(
+            index=index, long_paragraph=_LONG_SENTENCE * repeats
+        )
+        parts.append(section)
+        size += len(section)
+        index += 1
+    return "\n".join(parts)
+
+
+def load_corpus(path: Path) -> str:
+    if path.is_dir():
+        files = sorted(path.rglob("*.md"))
+        return "\n\n".join(file.read_text(encoding="utf-8") for file in files)
+    return path.read_text(encoding="utf-8")
+
+
+def measure(
+    label: str,
+    split: Callable[[str], List[Dict[str, Any]]],
+    text: str,
+) -> List[Dict[str, Any]]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    sections = split(text)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    megabytes = len(text.encode("utf-8")) / (1024 * 1024)
+    print(
+        f"{label:14} {len(sections):10d} {elapsed:10.2f}s "
+        f"{megabytes / elapsed if elapsed else 0.0:10.1f} MB/s {peak / (1024 * 1024):10.1f} MB"
+    )
+    return sections
+
+
+def main(argv: List[str]) -> int:
+    target_mb = float(argv[2]) if len(argv) > 2 else TARGET_MB
+    text = load_corpus(Path(argv[1])) if len(argv) > 1 else synthetic_corpus(target_mb)
+
+    settings = ChunkingSettings()
+    chunk_size = settings.presplit_min_chars
+    chunk_overlap = settings.presplit_overlap_chars
+
+    print(
+        f"Corpus: {len(text.encode('utf-8')) / (1024 * 1024):.1f} MB, "
+        f"chunk_size={chunk_size}, chunk_overlap={chunk_overlap}"
+    )
+    header = f"{'Splitter':14} {'Sections':>10} {'Time':>11} {'Throughput':>15} {'Peak mem':>13}"
+    print(header)
+    print("-" * len(header))
+
+    legacy = measure(
+        "langchain",
+        lambda md: split_markdown_structure(
+            md, chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        ),
+        text,
+    )
+    single_pass = measure(
+        "single-pass",
+        lambda md: split_markdown_sections(
+            md,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            header_depth=settings.markdown_header_depth,
+        ),
+        text,
+    )
+
+    for label, sections in (("langchain", legacy), ("single-pass", single_pass)):
+        sizes = [len(section["text"]) for section in sections] or [0]
+        print(
+            f"{label:14} mean section {sum(sizes) / len(sizes):8.0f} chars, "
+            f"max {max(sizes)} chars"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Measure sentence-segmentation throughput on a large Thai document.
+
+Compares the regex splitter with the pythainlp-backed Thai segmenter, cold
+(paragraph cache cleared) and warm (every paragraph already memoized).
+
+Usage:
+  python script/benchmark_thai_segmentation.py [path/to/thai.md] [repeat]
+
+Without a file a synthetic mixed Thai/English document is generated.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.document_chunking.infrastructure.sentence_segmenter import (
+    RegexSentenceSegmenter,
+    ScriptAwareSentenceSegmenter,
+    ThaiSentenceSegmenter,
+)
+from src.shared.config import ChunkingSettings
+
+_THAI_PARAGRAPHS = [
+    "บริษัทได้เปิดตัวผลิตภัณฑ์ใหม่ในไตรมาสที่ผ่านมา ยอดขายเพิ่มขึ้นอย่างต่อเนื่อง "
+    "ทีมงานจึงวางแผนขยายตลาดไปยังภูมิภาคอื่น",
+    "ผู้ใช้งานสามารถส่งคำถามผ่านระบบแชทได้ตลอดเวลา ระบบจะค้นหาเอกสารที่เกี่ยวข้อง "
+    "แล้วสรุปคำตอบให้อย่างรวดเร็ว",
+    "การประชุมครั้งนี้มีวัตถุประสงค์เพื่อทบทวนงบประมาณ และกำหนดเป้าหมายสำหรับปีถัดไป",
+]
+_ENGLISH_PARAGRAPH = (
+    "The quarterly report is attached. Revenue grew in every region! "
+    "Did the new pricing help?"
+)
+
+PARAGRAPHS: int = 2000  # Size of the synthetic document when no file is given.
+REPEAT: int = 3  # Warm passes to average over.
+
+
+def synthetic_document(paragraphs: int) -> str:
+    blocks: List[str] = []
+    for index in range(paragraphs):
+        if index % 10 == 9:
+            blocks.append(_ENGLISH_PARAGRAPH)
+        else:
+            base = _THAI_PARAGRAPHS[index % len(_THAI_PARAGRAPHS)]
+            # Vary the text so the paragraph cache only helps on repeated passes.
+            blocks.append(f"{base} รายการที่ {index}")
+    return "\n\n".join(blocks)
+
+
+def timed(split: Callable[[str], List[str]], text: str) -> tuple[int, float]:
+    start = time.perf_counter()
+    segments = split(text)
+    return len(segments), time.perf_counter() - start
+
+
+def report(label: str, segments: int, seconds: float) -> None:
+    rate = segments / seconds if seconds > 0 else float("inf")
+    print(f"{label:28} {segments:10d} {seconds:10.3f}s {rate:14.1f}/s")
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) > 1:
+        text = Path(argv[1]).read_text(encoding="utf-8")
+    else:
+        text = synthetic_document(PARAGRAPHS)
+    repeat = int(argv[2]) if len(argv) > 2 else REPEAT
+
+    settings = ChunkingSettings()
+    thai = ThaiSentenceSegmenter(
+        engine=settings.thai_sentence_engine,
+        max_chars=settings.max_sentence_chars,
+    )
+    auto = ScriptAwareSentenceSegmenter(thai=thai)
+    regex = RegexSentenceSegmenter()
+
+    print(f"Document: {len(text):,} chars, engine={thai.engine}")
+    header = f"{'Segmenter':28} {'Segments':>10} {'Time':>11} {'Throughput':>16}"
+    print(header)
+    print("-" * len(header))
+
+    report("regex", *timed(regex.split, text))
+
+    ThaiSentenceSegmenter.cache_clear()
+    # The first call also pays for loading the pythainlp models.
+    report("auto (cold)", *timed(auto.split, text))
+
+    segments, total = 0, 0.0
+    for _ in range(max(1, repeat)):
+        segments, seconds = timed(auto.split, text)
+        total += seconds
+    report("auto (warm, mean)", segments, total / max(1, repeat))
+
+    print(f"Paragraph cache: {ThaiSentenceSegmenter.cache_info()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
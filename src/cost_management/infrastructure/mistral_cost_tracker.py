@@ -47,6 +47,21 @@ class OcrUsage:
     estimated_cost_usd: float = 0.0
 
 
+@dataclass
+class OcrCacheUsage:
+    hits: int = 0
+    misses: int = 0
+    estimated_savings_usd: float = 0.0
+
+
+@dataclass
+class PictureCacheUsage:
+    requested: int = 0
+    duplicates: int = 0
+    cache_hits: int = 0
+    decorative: int = 0
+
+
 def _as_int(value: Any) -> int:
     if value is None:
         return 0
@@ -82,6 +97,8 @@ class MistralCostTracker:
         self._lock = Lock()
         self._chat_usage: Dict[str, ChatUsage] = {}
         self._ocr_usage: Dict[str, OcrUsage] = {}
+        self._ocr_cache_usage: Dict[str, OcrCacheUsage] = {}
+        self._picture_cache_usage: Dict[str, PictureCacheUsage] = {}
         self._chat_pricing: Dict[str, ChatPricing] = dict(chat_pricing or {})
         self._ocr_pricing: Dict[str, OcrPricing] = dict(ocr_pricing or {})
 
@@ -182,6 +199,75 @@ class MistralCostTracker:
             if pricing:
                 stats.estimated_cost_usd += pricing.per_page_usd * pages
 
+    def record_ocr_cache(self, model: str, *, hits: int, misses: int) -> None:
+        """Record OCR cache lookups; each hit is a page not sent to the API."""
+
+        if hits <= 0 and misses <= 0:
+            return
+
+        with self._lock:
+            stats = self._ocr_cache_usage.setdefault(model, OcrCacheUsage())
+            stats.hits += max(0, hits)
+            stats.misses += max(0, misses)
+
+            pricing = self._ocr_pricing.get(model) or self._ocr_pricing.get("*")
+            if pricing:
+                stats.estimated_savings_usd += pricing.per_page_usd * max(0, hits)
+
+    def record_picture_cache(
+        self, model: str, *, requested: int, duplicates: int, cache_hits: int
+    ) -> None:
+        """Record a description batch: images requested, repeats and cache hits."""
+
+        if requested <= 0:
+            return
+
+        with self._lock:
+            stats = self._picture_cache_usage.setdefault(model, PictureCacheUsage())
+            stats.requested += requested
+            stats.duplicates += max(0, duplicates)
+            stats.cache_hits += max(0, cache_hits)
+
+    def record_picture_skips(self, model: str, decorative: int) -> None:
+        """Record pictures skipped as decorative before reaching the vision model."""
+
+        if decorative <= 0:
+            return
+
+        with self._lock:
+            stats = self._picture_cache_usage.setdefault(model, PictureCacheUsage())
+            stats.decorative += decorative
+
+    def usage_snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Return the raw usage counters, e.g. to hand them back from a worker process."""
+
+        with self._lock:
+            return {
+                "chat": {model: asdict(usage) for model, usage in self._chat_usage.items()},
+                "ocr": {model: asdict(usage) for model, usage in self._ocr_usage.items()},
+                "ocr_cache": {
+                    model: asdict(usage) for model, usage in self._ocr_cache_usage.items()
+                },
+                "picture_cache": {
+                    model: asdict(usage) for model, usage in self._picture_cache_usage.items()
+                },
+            }
+
+    def merge_usage(self, snapshot: Mapping[str, Mapping[str, Mapping[str, Any]]]) -> None:
+        """Add the counters of a `usage_snapshot()` to this tracker."""
+
+        with self._lock:
+            for section, usage_type, usage_by_model in (
+                ("chat", ChatUsage, self._chat_usage),
+                ("ocr", OcrUsage, self._ocr_usage),
+                ("ocr_cache", OcrCacheUsage, self._ocr_cache_usage),
+                ("picture_cache", PictureCacheUsage, self._picture_cache_usage),
+            ):
+                for model, counters in snapshot.get(section, {}).items():
+                    stats = usage_by_model.setdefault(model, usage_type())
+                    for name, value in counters.items():
+                        setattr(stats, name, getattr(stats, name) + value)
+
     # --- reporting --------------------------------------------------------------------
     def report(self) -> Dict[str, Any]:
         with self._lock:
@@ -221,15 +307,29 @@ class MistralCostTracker:
                 usage["estimated_cost_usd"] for usage in chat_report.values()
             ) + sum(usage["estimated_cost_usd"] for usage in ocr_report.values())
 
+            ocr_cache_report = {
+                model: asdict(usage)
+                for model, usage in sorted(self._ocr_cache_usage.items())
+            }
+
+            picture_cache_report = {
+                model: asdict(usage)
+                for model, usage in sorted(self._picture_cache_usage.items())
+            }
+
             return {
                 "chat": chat_report,
                 "ocr": ocr_report,
+                "ocr_cache": ocr_cache_report,
+                "picture_cache": picture_cache_report,
                 "total_cost_usd": total_cost,
             }
 
     def format_report(self) -> str:
         report = self.report()
-        if not report["chat"] and not report["ocr"]:
+        if not any(
+            report[section] for section in ("chat", "ocr", "ocr_cache", "picture_cache")
+        ):
             return "Mistral API usage: no tracked calls."
 
         lines = ["Mistral API usage:"]
@@ -266,6 +366,24 @@ class MistralCostTracker:
         else:
             lines.append("- OCR models: none")
 
+        if report["ocr_cache"]:
+            lines.append("- OCR cache:")
+            for model, stats in report["ocr_cache"].items():
+                lookups = stats["hits"] + stats["misses"]
+                hit_rate = stats["hits"] / lookups if lookups else 0.0
+                lines.append(
+                    f"  • {model}: {stats['hits']} hits, {stats['misses']} misses ({hit_rate:.1%} hit rate) => ${stats['estimated_savings_usd']:.6f} saved"
+                )
+
+        if report["picture_cache"]:
+            lines.append("- Picture descriptions:")
+            for model, stats in report["picture_cache"].items():
+                sent = stats["requested"] - stats["duplicates"] - stats["cache_hits"]
+                total = stats["requested"] + stats["decorative"]
+                lines.append(
+                    f"  • {model}: {total} pictures, {stats['decorative']} decorative, {stats['duplicates']} duplicates, {stats['cache_hits']} cache hits => {sent} described"
+                )
+
         lines.append(f"- Total estimated cost: ${report['total_cost_usd']:.6f}")
         return "\n".join(lines)
 
@@ -273,6 +391,8 @@ class MistralCostTracker:
         with self._lock:
             self._chat_usage.clear()
             self._ocr_usage.clear()
+            self._ocr_cache_usage.clear()
+            self._picture_cache_usage.clear()
 
     # --- helpers ----------------------------------------------------------------------
     @staticmethod
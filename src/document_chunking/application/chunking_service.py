@@ -2,31 +2,40 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List
-
-from langchain_core.embeddings import Embeddings
+from typing import Iterable, List, Optional
 
 from src.document_chunking.domain.models import DocumentChunk, DocumentMetadata
 from src.document_chunking.domain.services import (
     SectionSemanticChunks,
     build_document_chunks,
 )
-from src.document_chunking.infrastructure.markdown_splitter import (
-    split_markdown_structure,
+from src.document_chunking.infrastructure.markdown_structure import (
+    split_markdown_sections,
 )
-from src.document_chunking.infrastructure.semantic_chunker import (
-    SemanticChunkerAdapter,
+from src.document_chunking.infrastructure.native_semantic_chunker import (
+    NativeSemanticChunker,
 )
-from src.knowledge_embedding.infrastructure.openai_client import (
-    OpenAIEmbedder,
-    OpenAIEmbeddings,
+from src.knowledge_embedding.infrastructure.embedding_cache import (
+    BatchEmbedder,
+    CachedEmbedder,
+    RunEmbeddingStore,
+    open_embedding_cache,
 )
+from src.knowledge_embedding.infrastructure.openai_client import OpenAIEmbedder
 from src.shared.config import ChunkingSettings
 
 
-def _default_embeddings(settings: ChunkingSettings) -> Embeddings:
-    embedder = OpenAIEmbedder(settings.embedding)
-    return OpenAIEmbeddings(embedder)
+def _default_embedder(
+    settings: ChunkingSettings,
+    embedding_store: Optional[RunEmbeddingStore] = None,
+) -> BatchEmbedder:
+    embedder: BatchEmbedder = OpenAIEmbedder(settings.embedding)
+    cache = open_embedding_cache(settings.embedding)
+    if cache is not None or embedding_store is not None:
+        embedder = CachedEmbedder(
+            embedder, cache, run_store=embedding_store, stage="chunking"
+        )
+    return embedder
 
 
 def generate_document_chunks(
@@ -36,35 +45,46 @@ def generate_document_chunks(
     doc_name: str,
     doc_hash: str,
     settings: ChunkingSettings,
+    embedding_store: Optional[RunEmbeddingStore] = None,
 ) -> List[DocumentChunk]:
-    """Split markdown into semantic chunks with normalized metadata."""
+    """Split markdown into semantic chunks with normalized metadata.
+
+    Sentence-window embeddings are written to `embedding_store` when given so the
+    embedding stage can reuse them instead of paying for the same text twice.
+    """
 
     if not doc_name:
         raise ValueError("doc_name is required to generate document chunks")
     if not doc_hash:
         raise ValueError("doc_hash is required to generate document chunks")
 
-    base_sections = split_markdown_structure(
+    base_sections = split_markdown_sections(
         markdown,
         chunk_size=settings.presplit_min_chars,
         chunk_overlap=settings.presplit_overlap_chars,
+        header_depth=settings.markdown_header_depth,
     )
     if not base_sections:
         return []
 
     document = DocumentMetadata(doc_name=doc_name, doc_hash=doc_hash, source=source)
 
-    embed_backend = _default_embeddings(settings)
-    chunker = SemanticChunkerAdapter(embed_backend, settings)
+    chunker = NativeSemanticChunker(_default_embedder(settings, embedding_store), settings)
+
+    # Collect every section's sentence windows first, embed them together in a few
+    # large batches, then split each section from the precomputed vectors.
+    plan = chunker.plan_sections(base_sections)
+    window_vectors = chunker.embed_windows(plan)
+    semantic_splits = chunker.split_planned(plan, window_vectors)
 
     section_chunks: List[SectionSemanticChunks] = []
-    for header_index, chunk in enumerate(base_sections):
-        section_meta = dict(chunk.get("meta") or {})
-        semantic_docs = chunker.split(chunk.get("text", ""), section_meta)
+    for header_index, (chunk, semantic_docs) in enumerate(
+        zip(base_sections, semantic_splits)
+    ):
         section_chunks.append(
             SectionSemanticChunks(
                 header_index=header_index,
-                section_metadata=section_meta,
+                section_metadata=dict(chunk.get("meta") or {}),
                 semantic_chunks=semantic_docs,
             )
         )
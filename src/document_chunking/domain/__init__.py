@@ -1,11 +1,18 @@
 """Domain entities for document chunking."""
 
 from .models import DocumentChunk, DocumentMetadata
-from .services import SectionSemanticChunks, build_document_chunks
+from .services import (
+    SectionSemanticChunks,
+    build_document_chunks,
+    chunk_content_key,
+    normalize_chunk_text,
+)
 
 __all__ = [
     "DocumentChunk",
     "DocumentMetadata",
     "SectionSemanticChunks",
     "build_document_chunks",
+    "chunk_content_key",
+    "normalize_chunk_text",
 ]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import unicodedata
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List
 
@@ -17,6 +19,22 @@ class SectionSemanticChunks:
     semantic_chunks: List[Dict[str, Any]]  # each element: {"text": str, "metadata": Dict}
 
 
+def normalize_chunk_text(text: str) -> str:
+    """Return `text` in NFC form with whitespace runs collapsed to single spaces."""
+
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def chunk_content_key(text: str, occurrence: int = 0) -> str:
+    """Return a stable key for a chunk's content within one document.
+
+    `occurrence` distinguishes repeated copies of the same text (0 for the first).
+    """
+
+    digest = hashlib.sha256(normalize_chunk_text(text).encode("utf-8")).hexdigest()
+    return f"{digest[:32]}-{occurrence}"
+
+
 def _merge_small_chunks(
     semantic_chunks: Iterable[Dict[str, Any]],
     *,
@@ -92,7 +110,12 @@ def build_document_chunks(
             )
 
     total_chunks = len(prepared)
+    occurrences: Dict[str, int] = {}
     for index, chunk in enumerate(prepared):
+        normalized = normalize_chunk_text(chunk.text)
+        occurrence = occurrences.get(normalized, 0)
+        occurrences[normalized] = occurrence + 1
+        chunk.metadata.setdefault("chunk_key", chunk_content_key(chunk.text, occurrence))
         chunk.chunk_index = index
         chunk.total_chunks = total_chunks
         chunk.metadata.setdefault("doc_name", document.doc_name)
@@ -107,4 +130,6 @@ def build_document_chunks(
 __all__ = [
     "SectionSemanticChunks",
     "build_document_chunks",
+    "chunk_content_key",
+    "normalize_chunk_text",
 ]
@@ -0,0 +1,246 @@
+"""Single-pass structural splitter for Markdown documents.
+
+Scans the document line by line once, tracking the ATX header tree (H1–H6),
+fenced code blocks and pipe tables. Sections are cut at headers up to
+`header_depth` and oversized sections are packed block by block, so code
+fences and tables are never cut in half.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+
+MAX_HEADER_DEPTH = 6
+
+_ATX_HEADING = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_FENCE_OPEN = re.compile(r"^ {0,3}(`{3,}|~{3,})(.*)$")
+_TABLE_DELIMITER = re.compile(r"^ {0,3}\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$")
+
+
+@dataclass
+class _Block:
+    text: str
+    # Fences and tables are emitted whole even when longer than the chunk size.
+    atomic: bool = False
+
+
+@dataclass
+class _Section:
+    headers: List[str]
+    blocks: List[_Block] = field(default_factory=list)
+
+    def text(self) -> str:
+        return "\n\n".join(block.text for block in self.blocks).strip()
+
+
+def _closes_fence(line: str, fence: str) -> bool:
+    stripped = line.strip()
+    if len(line) - len(line.lstrip(" ")) > 3 or not stripped:
+        return False
+    return (
+        stripped[0] == fence[0]
+        and len(stripped) >= len(fence)
+        and stripped == stripped[0] * len(stripped)
+    )
+
+
+def _opens_fence(line: str) -> Optional[str]:
+    match = _FENCE_OPEN.match(line)
+    if match is None:
+        return None
+    fence, info = match.groups()
+    if fence[0] == "`" and "`" in info:
+        return None
+    return fence
+
+
+def _opens_table(line: str, following: Optional[str]) -> bool:
+    return (
+        following is not None
+        and "|" in line
+        and "-" in following
+        and _TABLE_DELIMITER.match(following) is not None
+        and ("|" in following or line.strip().startswith("|"))
+    )
+
+
+def _scan_sections(md_text: str, header_depth: int) -> List[_Section]:
+    lines = md_text.split("\n")
+    count = len(lines)
+    headers = [""] * MAX_HEADER_DEPTH
+    sections = [_Section(headers=list(headers))]
+    paragraph: List[str] = []
+
+    def flush_paragraph() -> None:
+        if paragraph:
+            sections[-1].blocks.append(_Block("\n".join(paragraph)))
+            paragraph.clear()
+
+    index = 0
+    while index < count:
+        line = lines[index].rstrip()
+
+        if not line.strip():
+            flush_paragraph()
+            index += 1
+            continue
+
+        fence = _opens_fence(line)
+        if fence is not None:
+            flush_paragraph()
+            end = index + 1
+            while end < count and not _closes_fence(lines[end], fence):
+                end += 1
+            # An unclosed fence runs to the end of the document, as in CommonMark.
+            end = min(end + 1, count)
+            block = "\n".join(part.rstrip() for part in lines[index:end])
+            sections[-1].blocks.append(_Block(block, atomic=True))
+            index = end
+            continue
+
+        following = lines[index + 1] if index + 1 < count else None
+        if _opens_table(line, following):
+            flush_paragraph()
+            end = index + 2
+            while end < count and lines[end].strip() and "|" in lines[end]:
+                end += 1
+            block = "\n".join(part.rstrip() for part in lines[index:end])
+            sections[-1].blocks.append(_Block(block, atomic=True))
+            index = end
+            continue
+
+        heading = _ATX_HEADING.match(line)
+        if heading is not None:
+            flush_paragraph()
+            level = len(heading.group(1))
+            headers[level - 1] = (heading.group(2) or "").strip()
+            for deeper in range(level, MAX_HEADER_DEPTH):
+                headers[deeper] = ""
+            if level <= header_depth:
+                # Split headers are stripped from the section body.
+                sections.append(_Section(headers=list(headers)))
+            else:
+                sections[-1].blocks.append(_Block(line))
+            index += 1
+            continue
+
+        paragraph.append(line)
+        index += 1
+
+    flush_paragraph()
+    return sections
+
+
+def _split_long_line(line: str, chunk_size: int) -> List[str]:
+    pieces: List[str] = []
+    rest = line
+    while len(rest) > chunk_size:
+        cut = rest.rfind(" ", 0, chunk_size + 1)
+        if cut <= 0:
+            cut = chunk_size
+        pieces.append(rest[:cut].rstrip())
+        rest = rest[cut:].lstrip()
+    if rest:
+        pieces.append(rest)
+    return pieces
+
+
+def _pack(
+    units: Sequence[str], *, chunk_size: int, chunk_overlap: int, separator: str
+) -> List[str]:
+    """Greedily join `units` into pieces of at most `chunk_size` characters.
+
+    Each new piece starts with trailing units of the previous one totalling at
+    most `chunk_overlap` characters. A single unit larger than `chunk_size`
+    becomes a piece of its own.
+    """
+
+    pieces: List[str] = []
+    current: Deque[str] = deque()
+    total = 0
+    sep_len = len(separator)
+
+    for unit in units:
+        length = len(unit)
+        if current and total + sep_len + length > chunk_size:
+            pieces.append(separator.join(current))
+            while current and (
+                total > chunk_overlap or total + sep_len + length > chunk_size
+            ):
+                total -= len(current.popleft()) + (sep_len if current else 0)
+        total += length + (sep_len if current else 0)
+        current.append(unit)
+
+    if current:
+        pieces.append(separator.join(current))
+    return pieces
+
+
+def _pack_blocks(
+    blocks: Sequence[_Block], *, chunk_size: int, chunk_overlap: int
+) -> List[str]:
+    units: List[str] = []
+    for block in blocks:
+        if len(block.text) <= chunk_size or block.atomic:
+            units.append(block.text)
+            continue
+        lines: List[str] = []
+        for line in block.text.split("\n"):
+            lines.extend(_split_long_line(line, chunk_size))
+        units.extend(
+            _pack(lines, chunk_size=chunk_size, chunk_overlap=chunk_overlap, separator="\n")
+        )
+    return _pack(units, chunk_size=chunk_size, chunk_overlap=chunk_overlap, separator="\n\n")
+
+
+def split_markdown_sections(
+    md_text: str,
+    *,
+    chunk_size: int,
+    chunk_overlap: int,
+    header_depth: int = 3,
+) -> List[Dict[str, Any]]:
+    """Split Markdown into header sections in a single scan.
+
+    Returns `{"text", "meta"}` dicts where `meta` holds `h1`..`h{header_depth}`.
+    Sections of at least `max(2 * chunk_size, chunk_size + chunk_overlap)`
+    characters, or the whole document when it has no split headers, are packed
+    into pieces of about `chunk_size` characters along block boundaries.
+    """
+
+    chunk_size = max(1, chunk_size)
+    chunk_overlap = max(0, chunk_overlap)
+    header_depth = min(max(1, header_depth), MAX_HEADER_DEPTH)
+
+    sections = _scan_sections(md_text, header_depth)
+    any_header = any(any(section.headers[:header_depth]) for section in sections)
+    threshold = max(chunk_size * 2, chunk_size + chunk_overlap)
+
+    out: List[Dict[str, Any]] = []
+    for section in sections:
+        section_text = section.text()
+        if not section_text:
+            continue
+
+        meta = {
+            f"h{level + 1}": section.headers[level] for level in range(header_depth)
+        }
+        if any_header and len(section_text) < threshold:
+            out.append({"text": section_text, "meta": meta})
+            continue
+
+        for piece in _pack_blocks(
+            section.blocks, chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        ):
+            text = piece.strip()
+            if text:
+                out.append({"text": text, "meta": dict(meta)})
+
+    return out
+
+
+__all__ = ["MAX_HEADER_DEPTH", "split_markdown_sections"]
@@ -0,0 +1,248 @@
+"""Vectorized semantic chunker that embeds every section in one pass.
+
+Mirrors the splitting rules of LangChain's `SemanticChunker` (sentence windows,
+adjacent cosine distances, percentile / standard_deviation / interquartile /
+gradient breakpoints, `min_chunk_size` merging) but embeds the windows of all
+sections together and keeps the vectors in a single float32 matrix.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from src.document_chunking.infrastructure.sentence_segmenter import (
+    SentenceSegmenter,
+    build_sentence_segmenter,
+)
+from src.shared.config import ChunkingSettings
+
+
+BREAKPOINT_DEFAULTS: Dict[str, float] = {
+    "percentile": 95,
+    "standard_deviation": 3,
+    "interquartile": 1.5,
+    "gradient": 95,
+}
+
+# Upper bound on unique windows sent per embed_batch call; each call is further
+# split into token-budgeted requests by the embedder.
+_WINDOWS_PER_PASS = 8192
+
+
+class VectorEmbedder(Protocol):
+    def embed_batch(self, texts: List[str]) -> List[np.ndarray]: ...
+
+
+@dataclass
+class _SectionPlan:
+    sentences: List[str]
+    metadata: Dict[str, Any]
+    # Row range of this section's sentence windows in the shared matrix.
+    row_start: int = 0
+    row_count: int = 0
+
+
+@dataclass
+class SemanticSplitPlan:
+    """Sentence windows of a whole document, collected before any embedding."""
+
+    sections: List[_SectionPlan]
+    windows: List[str]
+
+    def unique_windows(self) -> Tuple[List[str], np.ndarray]:
+        """Return distinct window texts and, per window row, its index among them."""
+
+        positions: Dict[str, int] = {}
+        rows = np.empty(len(self.windows), dtype=np.int64)
+        for row, window in enumerate(self.windows):
+            rows[row] = positions.setdefault(window, len(positions))
+        return list(positions), rows
+
+
+def _sentence_windows(sentences: Sequence[str], buffer_size: int) -> List[str]:
+    count = len(sentences)
+    return [
+        " ".join(sentences[max(0, i - buffer_size) : min(count, i + buffer_size + 1)])
+        for i in range(count)
+    ]
+
+
+def adjacent_cosine_distances(matrix: np.ndarray) -> np.ndarray:
+    """Return `1 - cos(row_i, row_i+1)` for every adjacent pair of rows."""
+
+    if matrix.shape[0] < 2:
+        return np.zeros(0, dtype=np.float64)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    unit = matrix / norms
+    similarities = np.einsum("ij,ij->i", unit[:-1], unit[1:])
+    return 1.0 - similarities.astype(np.float64)
+
+
+class NativeSemanticChunker:
+    """Split markdown sections at semantic breakpoints using batched embeddings."""
+
+    def __init__(
+        self,
+        embedder: VectorEmbedder,
+        settings: ChunkingSettings,
+        *,
+        segmenter: Optional[SentenceSegmenter] = None,
+    ) -> None:
+        threshold_type = settings.semantic_breakpoint_type
+        if threshold_type not in BREAKPOINT_DEFAULTS:
+            raise ValueError(
+                f"Got unexpected `breakpoint_threshold_type`: {threshold_type}"
+            )
+
+        self._embedder = embedder
+        self.buffer_size = max(1, settings.semantic_buffer_size)
+        self.breakpoint_threshold_type = threshold_type
+        self.breakpoint_threshold_amount = (
+            settings.semantic_breakpoint_amount
+            if settings.semantic_breakpoint_amount is not None
+            else BREAKPOINT_DEFAULTS[threshold_type]
+        )
+        min_size = settings.min_chars_per_subchunk
+        self.min_chunk_size: Optional[int] = min_size if min_size > 0 else None
+        self._segmenter = segmenter or build_sentence_segmenter(settings)
+
+    # --- public API -------------------------------------------------------------------
+    def split(self, text: str, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return self.split_sections([{"text": text, "meta": metadata}])[0]
+
+    def split_sections(
+        self, sections: Sequence[Mapping[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Split every section, embedding all sentence windows together.
+
+        Returns one list of `{"text", "metadata"}` dicts per input section, in
+        input order; the output is identical to calling `split` per section.
+        """
+
+        plan = self.plan_sections(sections)
+        return self.split_planned(plan, self.embed_windows(plan))
+
+    def plan_sections(self, sections: Sequence[Mapping[str, Any]]) -> SemanticSplitPlan:
+        """Segment every section and collect its sentence windows without embedding."""
+
+        plans = [
+            _SectionPlan(
+                sentences=self._segmenter.split(section.get("text", "") or ""),
+                metadata=dict(section.get("meta") or section.get("metadata") or {}),
+            )
+            for section in sections
+        ]
+
+        windows: List[str] = []
+        for plan in plans:
+            if not self._needs_embeddings(plan.sentences):
+                continue
+            plan.row_start = len(windows)
+            plan.row_count = len(plan.sentences)
+            windows.extend(_sentence_windows(plan.sentences, self.buffer_size))
+        return SemanticSplitPlan(sections=plans, windows=windows)
+
+    def embed_windows(self, plan: SemanticSplitPlan) -> np.ndarray:
+        """Embed the plan's windows in a few large passes into one float32 matrix.
+
+        Identical windows (repeated boilerplate across sections) are embedded once
+        and fanned back out to every row that uses them.
+        """
+
+        unique, rows = plan.unique_windows()
+        if not unique:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        parts = [
+            self._embed(unique[start : start + _WINDOWS_PER_PASS])
+            for start in range(0, len(unique), _WINDOWS_PER_PASS)
+        ]
+        matrix = parts[0] if len(parts) == 1 else np.vstack(parts)
+        return matrix[rows]
+
+    def split_planned(
+        self, plan: SemanticSplitPlan, matrix: np.ndarray
+    ) -> List[List[Dict[str, Any]]]:
+        """Split each planned section using precomputed window vectors."""
+
+        if matrix.shape[0] != len(plan.windows):
+            raise RuntimeError("Embedding matrix does not match the planned windows")
+        distances = adjacent_cosine_distances(matrix)
+
+        results: List[List[Dict[str, Any]]] = []
+        for section in plan.sections:
+            if section.row_count:
+                # Pairs straddling two sections are ignored by slicing per section.
+                section_distances = distances[
+                    section.row_start : section.row_start + section.row_count - 1
+                ]
+                texts = self._group_sentences(section.sentences, section_distances)
+            else:
+                texts = section.sentences
+            results.append(
+                [
+                    {"text": text, "metadata": dict(section.metadata)}
+                    for text in texts
+                    if text.strip()
+                ]
+            )
+        return results
+
+    # --- helpers ----------------------------------------------------------------------
+    def _needs_embeddings(self, sentences: Sequence[str]) -> bool:
+        if len(sentences) <= 1:
+            return False
+        # np.gradient needs at least two distances.
+        if self.breakpoint_threshold_type == "gradient" and len(sentences) == 2:
+            return False
+        return True
+
+    def _embed(self, windows: List[str]) -> np.ndarray:
+        vectors = self._embedder.embed_batch(windows)
+        if len(vectors) != len(windows):
+            raise RuntimeError("Embedding count mismatch with sentence windows")
+        return np.vstack(vectors).astype(np.float32, copy=False)
+
+    def _breakpoints(self, distances: np.ndarray) -> np.ndarray:
+        amount = self.breakpoint_threshold_amount
+        kind = self.breakpoint_threshold_type
+        values = distances
+        if kind == "percentile":
+            threshold = np.percentile(distances, amount)
+        elif kind == "standard_deviation":
+            threshold = np.mean(distances) + amount * np.std(distances)
+        elif kind == "interquartile":
+            q1, q3 = np.percentile(distances, [25, 75])
+            threshold = np.mean(distances) + amount * (q3 - q1)
+        else:
+            values = np.gradient(distances, np.arange(len(distances)))
+            threshold = np.percentile(values, amount)
+        return np.flatnonzero(values > threshold)
+
+    def _group_sentences(
+        self, sentences: List[str], distances: np.ndarray
+    ) -> List[str]:
+        chunks: List[str] = []
+        start = 0
+        for index in self._breakpoints(distances):
+            combined = " ".join(sentences[start : index + 1])
+            if self.min_chunk_size is not None and len(combined) < self.min_chunk_size:
+                continue
+            chunks.append(combined)
+            start = int(index) + 1
+
+        if start < len(sentences):
+            chunks.append(" ".join(sentences[start:]))
+        return chunks
+
+
+__all__ = [
+    "BREAKPOINT_DEFAULTS",
+    "NativeSemanticChunker",
+    "SemanticSplitPlan",
+    "adjacent_cosine_distances",
+]
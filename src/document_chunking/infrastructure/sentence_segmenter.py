@@ -0,0 +1,172 @@
+"""Pluggable sentence segmentation for semantic chunking.
+
+The regex segmenter reproduces LangChain's `(?<=[.?!])\\s+` split. Thai has no
+sentence-final punctuation, so paragraphs written mostly in Thai script are
+routed to a pythainlp-based segmenter instead.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import List, Protocol, Tuple
+
+from src.shared.config import ChunkingSettings
+
+
+SENTENCE_SPLIT_REGEX = r"(?<=[.?!])\s+"
+
+_THAI_CHAR = re.compile(r"[\u0e00-\u0e7f]")
+_OTHER_LETTER = re.compile(r"[^\W\d_\u0e00-\u0e7f]")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+class SentenceSegmenter(Protocol):
+    def split(self, text: str) -> List[str]: ...
+
+
+def thai_ratio(text: str) -> float:
+    """Return the share of letters in `text` that belong to the Thai block."""
+
+    thai = len(_THAI_CHAR.findall(text))
+    letters = thai + len(_OTHER_LETTER.findall(text))
+    if not letters:
+        return 0.0
+    return thai / letters
+
+
+def detect_script(text: str, *, thai_threshold: float = 0.3) -> str:
+    """Classify `text` as `"thai"` or `"default"` by its share of Thai letters."""
+
+    if not _THAI_CHAR.search(text):
+        return "default"
+    return "thai" if thai_ratio(text) >= thai_threshold else "default"
+
+
+class RegexSentenceSegmenter:
+    """Split on sentence-final punctuation followed by whitespace."""
+
+    def __init__(self, pattern: str = SENTENCE_SPLIT_REGEX) -> None:
+        self._pattern = re.compile(pattern)
+
+    def split(self, text: str) -> List[str]:
+        return self._pattern.split(text)
+
+
+@lru_cache(maxsize=8192)
+def _thai_paragraph_sentences(
+    paragraph: str, engine: str, max_chars: int
+) -> Tuple[str, ...]:
+    # Imported lazily: pythainlp loads its CRF model and dictionaries on first use.
+    from pythainlp.tokenize import sent_tokenize, word_tokenize
+
+    sentences: List[str] = []
+    for sentence in sent_tokenize(paragraph, engine=engine):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) <= max_chars:
+            sentences.append(sentence)
+            continue
+
+        # Unbroken runs of Thai are wrapped on word boundaries so no segment can
+        # outgrow the embedding or storage limits on its own.
+        current = ""
+        for word in word_tokenize(sentence, engine="newmm", keep_whitespace=True):
+            if current and len(current) + len(word) > max_chars:
+                sentences.append(current.strip())
+                current = ""
+            current += word
+        if current.strip():
+            sentences.append(current.strip())
+    return tuple(sentences)
+
+
+class ThaiSentenceSegmenter:
+    """Segment Thai text with pythainlp, memoizing results per paragraph."""
+
+    def __init__(self, *, engine: str = "crfcut", max_chars: int = 1000) -> None:
+        self.engine = engine
+        self.max_chars = max(1, max_chars)
+
+    def split(self, text: str) -> List[str]:
+        sentences: List[str] = []
+        for paragraph in _PARAGRAPH_BREAK.split(text):
+            paragraph = paragraph.strip()
+            if paragraph:
+                sentences.extend(
+                    _thai_paragraph_sentences(paragraph, self.engine, self.max_chars)
+                )
+        return sentences or [text]
+
+    @staticmethod
+    def cache_info():
+        return _thai_paragraph_sentences.cache_info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        _thai_paragraph_sentences.cache_clear()
+
+
+class ScriptAwareSentenceSegmenter:
+    """Route each paragraph to the Thai or default segmenter by script.
+
+    Text without any Thai characters goes to the default segmenter unchanged, so
+    non-Thai documents split exactly as before.
+    """
+
+    def __init__(
+        self,
+        *,
+        default: SentenceSegmenter | None = None,
+        thai: SentenceSegmenter | None = None,
+        thai_threshold: float = 0.3,
+    ) -> None:
+        self._default = default or RegexSentenceSegmenter()
+        self._thai = thai or ThaiSentenceSegmenter()
+        self.thai_threshold = thai_threshold
+
+    def split(self, text: str) -> List[str]:
+        if not _THAI_CHAR.search(text):
+            return self._default.split(text)
+
+        sentences: List[str] = []
+        for paragraph in _PARAGRAPH_BREAK.split(text):
+            if not paragraph.strip():
+                continue
+            if detect_script(paragraph, thai_threshold=self.thai_threshold) == "thai":
+                sentences.extend(self._thai.split(paragraph))
+            else:
+                sentences.extend(
+                    piece for piece in self._default.split(paragraph.strip()) if piece
+                )
+        return sentences or [text]
+
+
+def build_sentence_segmenter(settings: ChunkingSettings) -> SentenceSegmenter:
+    """Return the segmenter selected by `settings.sentence_segmenter`."""
+
+    mode = (settings.sentence_segmenter or "auto").lower()
+    thai = ThaiSentenceSegmenter(
+        engine=settings.thai_sentence_engine,
+        max_chars=settings.max_sentence_chars,
+    )
+    if mode == "regex":
+        return RegexSentenceSegmenter()
+    if mode == "thai":
+        return thai
+    if mode == "auto":
+        return ScriptAwareSentenceSegmenter(thai=thai)
+    raise ValueError(f"Unknown sentence segmenter: {settings.sentence_segmenter}")
+
+
+__all__ = [
+    "RegexSentenceSegmenter",
+    "SENTENCE_SPLIT_REGEX",
+    "ScriptAwareSentenceSegmenter",
+    "SentenceSegmenter",
+    "ThaiSentenceSegmenter",
+    "build_sentence_segmenter",
+    "detect_script",
+    "thai_ratio",
+]
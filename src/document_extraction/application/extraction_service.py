@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from src.document_extraction.infrastructure.docling_extractor import run_extraction
 
 
-def extract_markdown(source: str) -> str:
-    """Return the Markdown representation of the provided document source."""
-    return run_extraction(source)
+def extract_markdown(source: str, *, profile: Optional[str] = None) -> str:
+    """Return the Markdown representation of the provided document source.
+
+    `profile` selects the speed/quality trade-off: "fast" for bulk backfills,
+    "accurate" for curated documents, "balanced" in between. None uses the
+    EXTRACTION_PROFILE setting.
+    """
+    return run_extraction(source, profile=profile)
 
 
 __all__ = ["extract_markdown"]
@@ -1,7 +1,11 @@
 """Domain services supporting document extraction."""
 
-from .ocr_policy import OcrPolicyDecider
+from .ocr_policy import OcrPagePlan, OcrPolicyDecider, text_layer_pages
+from .picture_filter import DecorativePictureFilter
 
 __all__ = [
+    "DecorativePictureFilter",
+    "OcrPagePlan",
     "OcrPolicyDecider",
+    "text_layer_pages",
 ]
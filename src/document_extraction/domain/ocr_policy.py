@@ -1,58 +1,135 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import FrozenSet
 
-from pypdf import PdfReader
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
 
 
-class OcrPolicyDecider:
-    """Decide whether to enable OCR for a given document path."""
+@dataclass(frozen=True)
+class OcrPagePlan:
+    """Which pages of a document need OCR (0-based page numbers).
+
+    `ocr_all` is set when the document could not be inspected, in which case
+    every page is OCR'd.
+    """
+
+    page_count: int = 0
+    ocr_pages: FrozenSet[int] = field(default_factory=frozenset)
+    ocr_all: bool = False
+
+    @property
+    def needs_ocr(self) -> bool:
+        return self.ocr_all or bool(self.ocr_pages)
+
+    @property
+    def fully_scanned(self) -> bool:
+        return self.ocr_all or (
+            self.page_count > 0 and len(self.ocr_pages) == self.page_count
+        )
+
+
+def _text_layer_usable(textpage: pdfium.PdfTextPage, count: int, unmapped_ratio: float) -> bool:
+    if count == 0 or not textpage.get_text_range().strip():
+        return False
+    # Glyphs without a Unicode mapping (a missing or broken ToUnicode CMap,
+    # common in Thai PDFs) extract as garbage, so OCR the page instead.
+    unmapped = sum(
+        1 for index in range(count) if pdfium_c.FPDFText_HasUnicodeMapError(textpage, index) == 1
+    )
+    return unmapped <= count * unmapped_ratio
+
+
+def _page_needs_ocr(page: pdfium.PdfPage, unmapped_ratio: float) -> bool:
+    textpage = page.get_textpage()
+    try:
+        count = textpage.count_chars()
+        if _text_layer_usable(textpage, count, unmapped_ratio):
+            return False
+    finally:
+        textpage.close()
+    # No usable text: OCR anything drawn on the page (an image, or text
+    # outlined as vector paths). Blank pages are skipped.
+    return pdfium_c.FPDFPage_CountObjects(page) > 0
+
+
+def text_layer_pages(path: str | Path, *, unmapped_ratio: float = 0.5) -> FrozenSet[int]:
+    """Return the (0-based) pages of a PDF that carry a usable text layer."""
+
+    pdf = pdfium.PdfDocument(str(path))
+    try:
+        pages = set()
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                if _text_layer_usable(textpage, textpage.count_chars(), unmapped_ratio):
+                    pages.add(i)
+            finally:
+                textpage.close()
+                page.close()
+        return frozenset(pages)
+    finally:
+        pdf.close()
+
 
+class OcrPolicyDecider:
+    """Decide which pages of a document need OCR."""
 
-    def __init__(self, *, sample_pages: int = 5, char_threshold: int = 200) -> None:
-        self.sample_pages = sample_pages
-        self.char_threshold = char_threshold
+    def __init__(self, *, unmapped_ratio: float = 0.5) -> None:
+        self.unmapped_ratio = unmapped_ratio
 
     def should_ocr(self, path: str | Path) -> bool:
+        return self.plan(path).needs_ocr
+
+    def plan(self, path: str | Path) -> OcrPagePlan:
         suffix = Path(path).suffix.lower()
         if suffix == ".pdf":
-            return self._should_ocr_pdf(path)
-        # Non-PDF formats do not use this toggle; return False by default.
-        return False
+            return self._plan_pdf(path)
+        # Non-PDF formats do not use this toggle; no pages are planned.
+        return OcrPagePlan()
 
-    def _should_ocr_pdf(self, path: str | Path) -> bool:
+    def _plan_pdf(self, path: str | Path) -> OcrPagePlan:
         """
-        Determine the need for OCR by sampling the PDF text layer.
+        Determine the need for OCR by probing every page's text layer.
 
-        Pages with insufficient extracted characters are treated as scanned pages,
-        so the pipeline falls back to OCR to recover text.
+        The probe only counts characters and their Unicode mappings in PDFium's
+        text page; no text is laid out. A page is OCR'd when its text layer is
+        unusable (no characters, or mostly characters without a Unicode mapping)
+        and it draws anything. Pages with a little real text, such as title
+        pages, dividers or slides, keep their text layer.
         """
 
         try:
-            reader = PdfReader(str(path))
+            pdf = pdfium.PdfDocument(str(path))
         except Exception:
-            return True
-
-        num_pages = len(reader.pages)
-        if num_pages == 0:
-            return True
-
-        pages_to_check = min(self.sample_pages, num_pages)
-        total_chars = 0
-        checked = 0
-        for i in range(pages_to_check):
-            try:
-                text = reader.pages[i].extract_text() or ""
-            except Exception:
-                text = ""
-            total_chars += len(text.strip())
-            checked += 1
-
-        if checked == 0:
-            return True
-
-        avg_chars = total_chars / checked
-        return avg_chars < self.char_threshold
+            return OcrPagePlan(ocr_all=True)
 
-
-__all__ = ["OcrPolicyDecider"]
+        try:
+            num_pages = len(pdf)
+            if num_pages == 0:
+                return OcrPagePlan(ocr_all=True)
+
+            ocr_pages = set()
+            for i in range(num_pages):
+                try:
+                    page = pdf[i]
+                except Exception:
+                    ocr_pages.add(i)
+                    continue
+                try:
+                    if _page_needs_ocr(page, self.unmapped_ratio):
+                        ocr_pages.add(i)
+                except Exception:
+                    ocr_pages.add(i)
+                finally:
+                    page.close()
+        finally:
+            pdf.close()
+
+        return OcrPagePlan(page_count=num_pages, ocr_pages=frozenset(ocr_pages))
+
+
+__all__ = ["OcrPagePlan", "OcrPolicyDecider", "text_layer_pages"]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+from PIL import Image
+
+
+class DecorativePictureFilter:
+    """Flag icons, bullets, separators and near-blank pictures as decorative.
+
+    The checks are cheap CPU heuristics run on the cropped picture before any
+    vision-model call. `min_side` is measured in page units, so callers pass
+    the scale the crop was rendered at.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_side: float = 32.0,
+        max_aspect_ratio: float = 8.0,
+        min_entropy_bits: float = 0.25,
+        min_colors: int = 2,
+        sample_size: int = 64,
+    ) -> None:
+        self.min_side = min_side
+        self.max_aspect_ratio = max_aspect_ratio
+        self.min_entropy_bits = min_entropy_bits
+        self.min_colors = min_colors
+        self.sample_size = sample_size
+
+    def classify(self, image: Image.Image, *, scale: float = 1.0) -> Optional[str]:
+        """Return why `image` is decorative, or None when it should be described."""
+
+        width, height = image.size
+        if width <= 0 or height <= 0:
+            return "empty"
+
+        scale = scale if scale > 0 else 1.0
+        if min(width, height) / scale < self.min_side:
+            return f"smaller than {self.min_side:g}px"
+
+        aspect_ratio = max(width, height) / min(width, height)
+        if aspect_ratio > self.max_aspect_ratio:
+            return f"aspect ratio {aspect_ratio:.1f} exceeds {self.max_aspect_ratio:g}"
+
+        # Statistics come from a small thumbnail; they only need to tell flat
+        # artwork from content.
+        sample = image.copy()
+        sample.thumbnail((self.sample_size, self.sample_size), reducing_gap=2.0)
+        sample = sample.convert("RGB")
+
+        # Only flat fills fall under the default of 2: bilevel scans and
+        # black-and-white line art have exactly two colours.
+        colors = sample.getcolors(maxcolors=max(1, self.min_colors))
+        if colors is not None and len(colors) < self.min_colors:
+            return f"{len(colors)} colours"
+
+        histogram = sample.convert("L").histogram()
+        total = sum(histogram)
+        entropy = -sum(
+            (count / total) * math.log2(count / total) for count in histogram if count
+        )
+        if entropy < self.min_entropy_bits:
+            return f"entropy {entropy:.2f} bits"
+
+        return None
+
+
+__all__ = ["DecorativePictureFilter"]
@@ -3,17 +3,31 @@ from .ocr import (
     MistralOcrOptions,
     register_mistral_ocr_plugin,
 )
+from .ocr_failures import OcrPageFailure, ocr_failures_for
+from .ocr_page_plan import (
+    ocr_pages_for,
+    register_ocr_plan,
+    release_ocr_plan,
+)
 from .picture_description import (
     MistralPictureDescriptionModel,
     MistralPictureDescriptionOptions,
     register_mistral_picture_description_plugin,
 )
+from .result_cache import ResultCache, open_result_cache
 
 __all__ = [
     "MistralOcrModel",
     "MistralOcrOptions",
     "MistralPictureDescriptionModel",
     "MistralPictureDescriptionOptions",
+    "OcrPageFailure",
+    "ResultCache",
+    "ocr_failures_for",
+    "ocr_pages_for",
+    "open_result_cache",
     "register_mistral_ocr_plugin",
     "register_mistral_picture_description_plugin",
+    "register_ocr_plan",
+    "release_ocr_plan",
 ]
@@ -0,0 +1,75 @@
+"""Long-lived asyncio loop for concurrent Mistral requests.
+
+Docling calls the enrichment models synchronously, one element batch at a
+time. Rather than building a thread pool per batch, requests are scheduled on
+one background event loop per process, and a bounded semaphore caps how many
+are in flight across every batch and document that shares the engine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from threading import Lock, Thread
+from typing import Awaitable, Callable, Dict, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncRequestEngine:
+    """Run coroutines on a dedicated event-loop thread with bounded concurrency."""
+
+    def __init__(self, name: str, *, concurrency: int) -> None:
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self._loop = asyncio.new_event_loop()
+        self._thread = Thread(
+            target=self._loop.run_forever, name=f"{name}-loop", daemon=True
+        )
+        self._thread.start()
+        self._semaphore = asyncio.run_coroutine_threadsafe(
+            self._make_semaphore(), self._loop
+        ).result()
+
+    async def _make_semaphore(self) -> asyncio.BoundedSemaphore:
+        return asyncio.BoundedSemaphore(self.concurrency)
+
+    async def _guarded(self, func: Callable[[T], Awaitable[R]], item: T) -> R:
+        async with self._semaphore:
+            return await func(item)
+
+    async def _gather(self, func: Callable[[T], Awaitable[R]], items: List[T]) -> List[R]:
+        return list(await asyncio.gather(*(self._guarded(func, item) for item in items)))
+
+    def map(self, func: Callable[[T], Awaitable[R]], items: Iterable[T]) -> List[R]:
+        """Await `func(item)` for every item; results keep the input order.
+
+        Blocks the calling thread. `func` should handle its own errors, as the
+        first exception is re-raised here.
+        """
+
+        items = list(items)
+        if not items:
+            return []
+        return asyncio.run_coroutine_threadsafe(
+            self._gather(func, items), self._loop
+        ).result()
+
+
+_engines: Dict[Tuple[str, int], AsyncRequestEngine] = {}
+_engines_lock = Lock()
+
+
+def get_async_engine(name: str, *, concurrency: int) -> AsyncRequestEngine:
+    """Return the process-wide engine for `name` and concurrency limit."""
+
+    key = (name, max(1, concurrency))
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = AsyncRequestEngine(name, concurrency=key[1])
+            _engines[key] = engine
+        return engine
+
+
+__all__ = ["AsyncRequestEngine", "get_async_engine"]
@@ -0,0 +1,244 @@
+"""Whole-document OCR submission for scanned PDFs.
+
+Instead of rasterizing and uploading every page as a PNG, the original PDF (or
+page-range slices of it) is sent to Mistral OCR and the per-page markdown in
+the response is mapped back onto Docling page numbers.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import logging
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from pypdf import PdfReader, PdfWriter
+
+
+_log = logging.getLogger(__name__)
+
+
+def read_source_pdf(conv_res: Any) -> Optional[bytes]:
+    """Return the bytes of the PDF being converted, or None when unavailable."""
+
+    in_doc = getattr(conv_res, "input", None)
+    backend = getattr(in_doc, "_backend", None)
+    source = getattr(backend, "path_or_stream", None)
+    try:
+        if isinstance(source, io.BytesIO):
+            return source.getvalue()
+        if isinstance(source, Path):
+            return source.read_bytes()
+        file = getattr(in_doc, "file", None)
+        if file is not None and Path(file).is_file():
+            return Path(file).read_bytes()
+    except OSError:
+        _log.warning("Unable to read source PDF for document OCR", exc_info=True)
+    return None
+
+
+def pdf_data_url(pdf_bytes: bytes) -> str:
+    payload = base64.b64encode(pdf_bytes).decode("utf-8")
+    return f"data:application/pdf;base64,{payload}"
+
+
+def build_pdf_slices(
+    pdf_bytes: bytes,
+    page_nos: Sequence[int],
+    *,
+    pages_per_request: int,
+) -> List[Tuple[List[int], bytes]]:
+    """Split the requested pages into standalone PDFs of at most `pages_per_request`.
+
+    Returns `(page_nos, pdf_bytes)` pairs; page `i` of a slice is `page_nos[i]`
+    of the source. The original bytes are reused when they already are the
+    whole request.
+    """
+
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    wanted = [no for no in page_nos if 0 <= no < len(reader.pages)]
+    size = max(1, pages_per_request)
+    if wanted == list(range(len(reader.pages))) and len(wanted) <= size:
+        return [(wanted, pdf_bytes)]
+
+    slices: List[Tuple[List[int], bytes]] = []
+    for start in range(0, len(wanted), size):
+        chunk = wanted[start : start + size]
+        writer = PdfWriter()
+        for page_no in chunk:
+            writer.add_page(reader.pages[page_no])
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        slices.append((chunk, buffer.getvalue()))
+    return slices
+
+
+def _hash_xobjects(digest: Any, resources: Any, depth: int = 0) -> None:
+    xobjects = resources.get("/XObject") if resources is not None else None
+    if xobjects is None or depth > 4:
+        return
+    xobjects = xobjects.get_object()
+    for name in sorted(xobjects):
+        xobject = xobjects[name].get_object()
+        digest.update(str(name).encode("utf-8"))
+        digest.update(xobject.get_data())
+        if xobject.get("/Subtype") == "/Form" and "/Resources" in xobject:
+            _hash_xobjects(digest, xobject["/Resources"].get_object(), depth + 1)
+
+
+def pdf_page_digests(pdf_bytes: bytes, page_nos: Sequence[int]) -> Dict[int, str]:
+    """Fingerprint source pages by their content stream, images and geometry.
+
+    Equal digests mean the page draws the same content, so its OCR output can
+    be reused across documents. Pages that cannot be read are left out.
+    """
+
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    digests: Dict[int, str] = {}
+    for page_no in page_nos:
+        if not 0 <= page_no < len(reader.pages):
+            continue
+        try:
+            page = reader.pages[page_no]
+            digest = hashlib.sha256()
+            digest.update(repr([float(v) for v in page.mediabox]).encode("ascii"))
+            digest.update(str(page.get("/Rotate", 0)).encode("ascii"))
+            contents = page.get_contents()
+            if contents is not None:
+                digest.update(contents.get_data())
+            resources = page.get("/Resources")
+            _hash_xobjects(digest, resources.get_object() if resources is not None else None)
+        except Exception:
+            _log.debug("Unable to fingerprint PDF page %s", page_no, exc_info=True)
+            continue
+        digests[page_no] = digest.hexdigest()
+    return digests
+
+
+@dataclass
+class _Slice:
+    page_nos: List[int]
+    future: Future
+    markdown: Optional[Dict[int, str]] = None
+    failed: bool = False
+
+
+@dataclass
+class DocumentOcrJob:
+    """OCR requests covering one conversion, consumed page batch by page batch."""
+
+    slices: List[_Slice]
+    remaining: Set[int]
+    on_response: Callable[[Any], None]
+    # Markdown already known for some pages (e.g. from the OCR cache).
+    cached: Dict[int, str] = field(default_factory=dict)
+    # Receives each slice's {page_no: markdown} once, e.g. to fill the cache.
+    on_markdown: Optional[Callable[[Dict[int, str]], None]] = None
+    _slice_of: Dict[int, _Slice] = field(default_factory=dict)
+    _lock: Lock = field(default_factory=Lock)
+
+    @classmethod
+    def submit(
+        cls,
+        slices: Sequence[Tuple[List[int], bytes]],
+        send: Callable[[bytes], Future],
+        *,
+        on_response: Callable[[Any], None],
+        cached: Optional[Dict[int, str]] = None,
+        on_markdown: Optional[Callable[[Dict[int, str]], None]] = None,
+    ) -> "DocumentOcrJob":
+        """Start one request per slice; `on_response` runs once per successful reply."""
+
+        parts = [_Slice(page_nos=page_nos, future=send(data)) for page_nos, data in slices]
+        cached = dict(cached or {})
+        remaining = {page_no for page_nos, _ in slices for page_no in page_nos}
+        remaining.update(cached)
+        return cls(
+            slices=parts,
+            remaining=remaining,
+            on_response=on_response,
+            cached=cached,
+            on_markdown=on_markdown,
+        )
+
+    def __post_init__(self) -> None:
+        for part in self.slices:
+            for page_no in part.page_nos:
+                self._slice_of[page_no] = part
+
+    def collect(self, page_nos: Sequence[int]) -> Dict[int, str]:
+        """Return OCR markdown for those of `page_nos` whose request succeeded."""
+
+        found: Dict[int, str] = {}
+        for page_no in page_nos:
+            if page_no in self.cached:
+                found[page_no] = self.cached[page_no]
+                continue
+            part = self._slice_of.get(page_no)
+            if part is None:
+                continue
+            markdown = self._resolve(part)
+            if markdown is not None and page_no in markdown:
+                found[page_no] = markdown[page_no]
+        with self._lock:
+            self.remaining.difference_update(page_nos)
+        return found
+
+    @property
+    def done(self) -> bool:
+        with self._lock:
+            return not self.remaining
+
+    def cancel(self) -> None:
+        """Cancel requests that have not started, e.g. when the conversion is gone."""
+
+        for part in self.slices:
+            part.future.cancel()
+
+    def _resolve(self, part: _Slice) -> Optional[Dict[int, str]]:
+        try:
+            resp = part.future.result()
+        except Exception as exc:  # pragma: no cover - surface SDK failures without crashing pipeline
+            with self._lock:
+                first_failure = not part.failed
+                part.failed = True
+            if first_failure:
+                _log.warning(
+                    "Mistral document OCR failed for pages %s-%s: %s",
+                    part.page_nos[0],
+                    part.page_nos[-1],
+                    exc,
+                )
+            return None
+
+        with self._lock:
+            if part.markdown is None:
+                self.on_response(resp)
+                part.markdown = {}
+                for ocr_page in getattr(resp, "pages", None) or []:
+                    index = getattr(ocr_page, "index", None)
+                    if index is None or not 0 <= index < len(part.page_nos):
+                        continue
+                    part.markdown[part.page_nos[index]] = (
+                        getattr(ocr_page, "markdown", "") or ""
+                    )
+                if self.on_markdown is not None and part.markdown:
+                    try:
+                        self.on_markdown(part.markdown)
+                    except Exception:  # pragma: no cover - caching must not fail OCR
+                        _log.warning("Unable to store document OCR results", exc_info=True)
+            return part.markdown
+
+
+__all__ = [
+    "DocumentOcrJob",
+    "build_pdf_slices",
+    "pdf_data_url",
+    "pdf_page_digests",
+    "read_source_pdf",
+]
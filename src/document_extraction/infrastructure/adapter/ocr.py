@@ -1,20 +1,61 @@
 import logging
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import ClassVar, Iterable, List, Literal, Optional, Type
+from threading import Lock
+from typing import ClassVar, Dict, Iterable, List, Literal, Optional, Tuple, Type
 
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import BoundingRectangle, TextCell
 
 from docling.datamodel.accelerator_options import AcceleratorOptions
-from docling.datamodel.base_models import Page
+from docling.datamodel.base_models import InputFormat, Page
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import OcrOptions
 from docling.models.base_ocr_model import BaseOcrModel
 from docling.utils.profiling import TimeRecorder
 from mistralai import Mistral, models
+from PIL import Image
 
-from src.document_extraction.infrastructure.adapter.utils import _image_to_data_url
-from src.document_extraction.infrastructure.config import OCR_MODEL
+from src.document_extraction.infrastructure.adapter.document_ocr import (
+    DocumentOcrJob,
+    build_pdf_slices,
+    pdf_data_url,
+    pdf_page_digests,
+    read_source_pdf,
+)
+from src.document_extraction.infrastructure.adapter.result_cache import (
+    ResultCache,
+    image_digest,
+    ocr_cache_key,
+    open_result_cache,
+)
+from src.document_extraction.infrastructure.adapter.ocr_failures import (
+    record_ocr_failure,
+)
+from src.document_extraction.infrastructure.adapter.ocr_page_plan import ocr_pages_for
+from src.document_extraction.infrastructure.adapter.resilience import (
+    CircuitOpenError,
+    call_with_retries,
+    mistral_circuit_breaker,
+    mistral_retry_policy,
+)
+from src.document_extraction.infrastructure.adapter.utils import (
+    ImageEncoding,
+    _image_to_data_url,
+)
+from src.document_extraction.infrastructure.config import (
+    OCR_CACHE_MAX_MB,
+    OCR_CACHE_PATH,
+    OCR_CONCURRENCY,
+    OCR_IMAGE_FORMAT,
+    OCR_IMAGE_MAX_EDGE,
+    OCR_IMAGE_QUALITY,
+    OCR_MODEL,
+    OCR_PAGES_PER_REQUEST,
+    OCR_SUBMISSION,
+    OCR_TIMEOUT_SECONDS,
+)
 from src.cost_management.infrastructure.mistral_cost_tracker import (
     mistral_cost_tracker,
 )
@@ -28,6 +69,22 @@ class MistralOcrOptions(OcrOptions):
     api_key: str
     model: str = OCR_MODEL
     lang: List[str] = ["auto"]  # dont use for mistral
+    # Upper bound on OCR requests in flight; Docling's page batch size also caps it.
+    concurrency: int = OCR_CONCURRENCY
+    # "page" uploads one rendered image per page; "document" sends the PDF itself
+    # (sliced into `pages_per_request` pages); "auto" uses "document" for PDFs.
+    submission: Literal["auto", "page", "document"] = OCR_SUBMISSION
+    pages_per_request: int = OCR_PAGES_PER_REQUEST
+    # SQLite file holding OCR markdown per page fingerprint; "off" disables it.
+    cache_path: str = OCR_CACHE_PATH
+    cache_max_mb: int = OCR_CACHE_MAX_MB
+    # Page images are sent as `image_format` (PNG | JPEG | WEBP), downscaled to
+    # `image_max_edge` pixels on the long edge (0 = as rendered).
+    image_format: str = OCR_IMAGE_FORMAT
+    image_quality: int = OCR_IMAGE_QUALITY
+    image_max_edge: int = OCR_IMAGE_MAX_EDGE
+    # Per-request timeout; failed requests are retried (see `resilience`).
+    timeout_seconds: float = OCR_TIMEOUT_SECONDS
 
 
 class MistralOcrModel(BaseOcrModel):
@@ -49,7 +106,33 @@ class MistralOcrModel(BaseOcrModel):
         )
         self.client = Mistral(api_key=options.api_key)
         self.model = options.model
-        self._available = True
+        self._timeout_ms = (
+            int(options.timeout_seconds * 1000) if options.timeout_seconds else None
+        )
+        self.concurrency = max(1, options.concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
+        self.submission = options.submission
+        self.pages_per_request = max(1, options.pages_per_request)
+        # id(conv_res) -> (weak reference to conv_res, job). The reference
+        # guards against a later conversion reusing the id; entries are
+        # dropped when their conversion is garbage-collected.
+        self._document_jobs: Dict[
+            int, Tuple["weakref.ref[ConversionResult]", Optional[DocumentOcrJob]]
+        ] = {}
+        self._image_encoding = ImageEncoding(
+            format=options.image_format,
+            quality=options.image_quality,
+            max_long_edge=options.image_max_edge,
+        )
+        self._cache: Optional[ResultCache] = None
+        if enabled:
+            try:
+                self._cache = open_result_cache(
+                    options.cache_path, max_mb=options.cache_max_mb
+                )
+            except Exception:  # pragma: no cover - OCR still works without the cache
+                _log.warning("Unable to open OCR cache at %s", options.cache_path, exc_info=True)
 
     def _to_docling_format(self, resp: Optional[models.OCRResponse], page: Page) -> List[TextCell]:
         """Convert a Mistral OCR response into Docling text cells."""
@@ -57,8 +140,11 @@ class MistralOcrModel(BaseOcrModel):
             return []
 
         # The SDK returns one OCRPageObject per processed page. We call it per page, so pick the first.
-        page_data = resp.pages[0]
-        page_text = (page_data.markdown or "").strip()
+        return self._markdown_to_cells(resp.pages[0].markdown, page)
+
+    def _markdown_to_cells(self, markdown: Optional[str], page: Page) -> List[TextCell]:
+        """Wrap one page's OCR markdown in a single full-page Docling text cell."""
+        page_text = (markdown or "").strip()
         if not page_text:
             return []
 
@@ -85,6 +171,156 @@ class MistralOcrModel(BaseOcrModel):
             )
         ]
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Created once per model; pooled converters reuse it across documents.
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency,
+                    thread_name_prefix="mistral-ocr",
+                )
+            return self._executor
+
+    def _ocr_request(self, document: Dict[str, str]) -> models.OCRResponse:
+        return call_with_retries(
+            lambda: self.client.ocr.process(
+                model=self.model,
+                document=document,
+                timeout_ms=self._timeout_ms,
+            ),
+            policy=mistral_retry_policy,
+            breaker=mistral_circuit_breaker,
+        )
+
+    def _process_image(self, image: Image.Image) -> models.OCRResponse:
+        return self._ocr_request(
+            {
+                "type": "image_url",
+                "image_url": _image_to_data_url(image, self._image_encoding, use="ocr"),
+            }
+        )
+
+    def _process_document(self, pdf_bytes: bytes) -> models.OCRResponse:
+        return self._ocr_request(
+            {
+                "type": "document_url",
+                "document_url": pdf_data_url(pdf_bytes),
+            }
+        )
+
+    def _record_usage(self, resp: models.OCRResponse) -> None:
+        usage_info = getattr(resp, "usage_info", None)
+        pages_processed = getattr(usage_info, "pages_processed", None)
+        mistral_cost_tracker.record_ocr(self.model, pages_processed)
+
+    def _cached_markdown(self, keys: Dict[int, str]) -> Dict[int, str]:
+        """Look up `{page_no: cache_key}` and return markdown for the hits."""
+
+        if self._cache is None or not keys:
+            return {}
+        try:
+            hits = self._cache.get_many(list(keys.values()))
+        except Exception:  # pragma: no cover - a broken cache only costs money
+            _log.warning("OCR cache lookup failed", exc_info=True)
+            hits = {}
+        found = {page_no: hits[key] for page_no, key in keys.items() if key in hits}
+        mistral_cost_tracker.record_ocr_cache(
+            self.model, hits=len(found), misses=len(keys) - len(found)
+        )
+        return found
+
+    def _store_markdown(self, keys: Dict[int, str], markdown: Dict[int, str]) -> None:
+        if self._cache is None:
+            return
+        entries = {keys[page_no]: text for page_no, text in markdown.items() if page_no in keys}
+        if not entries:
+            return
+        try:
+            self._cache.put_many(entries)
+        except Exception:  # pragma: no cover - a broken cache only costs money
+            _log.warning("OCR cache write failed", exc_info=True)
+
+    def _use_document_submission(self, conv_res: ConversionResult) -> bool:
+        if self.submission == "page":
+            return False
+        return getattr(conv_res.input, "format", None) == InputFormat.PDF
+
+    def _document_job(self, conv_res: ConversionResult) -> Optional[DocumentOcrJob]:
+        """Submit OCR for every planned page of the conversion on its first page batch."""
+
+        key = id(conv_res)
+        with self._executor_lock:
+            entry = self._document_jobs.get(key)
+            if entry is not None and entry[0]() is conv_res:
+                return entry[1]
+
+        job: Optional[DocumentOcrJob] = None
+        pdf_bytes = read_source_pdf(conv_res)
+        planned = ocr_pages_for(conv_res)
+        page_nos = [
+            page.page_no
+            for page in conv_res.pages
+            if planned is None or page.page_no in planned
+        ]
+        if pdf_bytes is not None and page_nos:
+            keys: Dict[int, str] = {}
+            cached: Dict[int, str] = {}
+            slices = []
+            try:
+                if self._cache is not None:
+                    keys = {
+                        page_no: ocr_cache_key(self.model, "pdf-page", digest)
+                        for page_no, digest in pdf_page_digests(pdf_bytes, page_nos).items()
+                    }
+                    cached = self._cached_markdown(keys)
+                uncached = [page_no for page_no in page_nos if page_no not in cached]
+                if uncached:
+                    slices = build_pdf_slices(
+                        pdf_bytes, uncached, pages_per_request=self.pages_per_request
+                    )
+            except Exception:  # pragma: no cover - unreadable PDFs fall back to page images
+                _log.warning("Unable to slice PDF for document OCR", exc_info=True)
+            if slices or cached:
+                executor = self._get_executor()
+                job = DocumentOcrJob.submit(
+                    slices,
+                    lambda data: executor.submit(self._process_document, data),
+                    on_response=self._record_usage,
+                    cached=cached,
+                    on_markdown=lambda markdown: self._store_markdown(keys, markdown),
+                )
+
+        ref = weakref.ref(conv_res)
+        with self._executor_lock:
+            self._document_jobs[key] = (ref, job)
+        # Aborted conversions (timeout, exception) never collect every page;
+        # their job is dropped and cancelled once the conversion is gone.
+        weakref.finalize(conv_res, self._drop_document_job, key, ref)
+        return job
+
+    def _drop_document_job(self, key: int, ref: "weakref.ref[ConversionResult]") -> None:
+        with self._executor_lock:
+            entry = self._document_jobs.get(key)
+            if entry is None or entry[0] is not ref:
+                return
+            del self._document_jobs[key]
+        if entry[1] is not None:
+            entry[1].cancel()
+
+    def _release_document_job(self, conv_res: ConversionResult) -> None:
+        key = id(conv_res)
+        with self._executor_lock:
+            entry = self._document_jobs.get(key)
+            # A None job stays until the conversion is gone, so a document whose
+            # PDF cannot be read is not re-read on every page batch.
+            if (
+                entry is not None
+                and entry[0]() is conv_res
+                and entry[1] is not None
+                and entry[1].done
+            ):
+                del self._document_jobs[key]
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -92,43 +328,100 @@ class MistralOcrModel(BaseOcrModel):
             yield from page_batch
             return
 
-        for page in page_batch:
-            if not self._available:
-                yield page
+        pages = list(page_batch)
+        pending: Dict[int, Future] = {}
+        # OCR markdown already available per page_no (document submission or cache).
+        known_markdown: Dict[int, str] = {}
+        image_keys: Dict[int, str] = {}
+        # Pages outside the OCR plan keep their text layer and are never sent.
+        planned = ocr_pages_for(conv_res)
+        ocr_page_nos = [
+            page.page_no
+            for page in pages
+            if planned is None or page.page_no in planned
+        ]
+        if not ocr_page_nos:
+            yield from pages
+            return
+
+        if self._use_document_submission(conv_res):
+            job = self._document_job(conv_res)
+            if job is not None:
+                with TimeRecorder(conv_res, "ocr"):
+                    known_markdown = job.collect(ocr_page_nos)
+            self._release_document_job(conv_res)
+
+        # Page rendering goes through the PDF backend, which is not thread-safe,
+        # so images are rendered here and only the API calls run concurrently.
+        # Pages already covered by document submission are never rendered.
+        rendered: Dict[int, Image.Image] = {}
+        for index, page in enumerate(pages):
+            if page.page_no in known_markdown or page.page_no not in ocr_page_nos:
                 continue
 
             backend = getattr(page, "_backend", None)
             if backend is None or not backend.is_valid():
-                yield page
                 continue
 
             with TimeRecorder(conv_res, "ocr"):
                 try:
-                    high_res_image = backend.get_page_image(scale=1.0)
+                    rendered[index] = backend.get_page_image(scale=1.0)
                 except Exception:  # pragma: no cover - defensive, follows Docling pattern
                     _log.exception("Mistral OCR failed to render page image")
-                    yield page
                     continue
 
+        if self._cache is not None and rendered:
+            image_keys = {
+                pages[index].page_no: ocr_cache_key(
+                    self.model, "image", image_digest(image)
+                )
+                for index, image in rendered.items()
+            }
+            known_markdown.update(self._cached_markdown(image_keys))
+
+        for index, image in rendered.items():
+            page_no = pages[index].page_no
+            if page_no in known_markdown:
+                continue
+            if mistral_circuit_breaker.state == "open":
+                # Fail fast without queueing; the page is recorded for a later pass.
+                record_ocr_failure(
+                    conv_res, page_no, CircuitOpenError("Mistral API circuit is open")
+                )
+                continue
+            pending[index] = self._get_executor().submit(self._process_image, image)
+
+        for index, page in enumerate(pages):
+            if page.page_no in known_markdown:
+                ocr_cells = self._markdown_to_cells(known_markdown[page.page_no], page)
+                if ocr_cells:
+                    self.post_process_cells(ocr_cells, page)
+                yield page
+                continue
+
+            future = pending.get(index)
+            if future is None:
+                yield page
+                continue
+
+            with TimeRecorder(conv_res, "ocr"):
                 try:
-                    resp = self.client.ocr.process(
-                        model=self.model,
-                        document={
-                            "type": "image_url",
-                            "image_url": _image_to_data_url(high_res_image),
-                        },
-                    )
+                    resp = future.result()
                 except Exception as exc:  # pragma: no cover - surface SDK failures without crashing pipeline
-                    if self._available:
-                        _log.warning("Mistral OCR request failed: %s", exc)
-                    self._available = False
+                    # Only this page loses OCR; later pages are still attempted.
+                    _log.warning(
+                        "Mistral OCR failed for page %s: %s", page.page_no, exc
+                    )
+                    record_ocr_failure(conv_res, page.page_no, exc)
                     yield page
                     continue
-                    
+
                 # Log usage for cost tracking
-                usage_info = getattr(resp, "usage_info", None)
-                pages_processed = getattr(usage_info, "pages_processed", None)
-                mistral_cost_tracker.record_ocr(self.model, pages_processed)
+                self._record_usage(resp)
+                if getattr(resp, "pages", None):
+                    self._store_markdown(
+                        image_keys, {page.page_no: resp.pages[0].markdown or ""}
+                    )
 
                 ocr_cells = self._to_docling_format(resp, page)
                 if ocr_cells:
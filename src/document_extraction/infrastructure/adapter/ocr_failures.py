@@ -0,0 +1,76 @@
+"""Per-page OCR failures, recorded so only those pages need another pass.
+
+Pages whose OCR still fails after retries (or is skipped while the circuit
+breaker is open) keep their text layer, and a record is kept here keyed by
+source file. With the OCR cache enabled, re-running the document only
+sends these pages; every page that succeeded is served from the cache.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path, PurePath
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Union
+
+
+@dataclass(frozen=True)
+class OcrPageFailure:
+    page_no: int  # 0-based, like Docling's Page.page_no
+    error: str
+
+
+_failures: Dict[str, Dict[int, OcrPageFailure]] = {}
+_failures_lock = Lock()
+
+
+def _source_key(path: Union[str, PurePath]) -> str:
+    return str(Path(path).resolve())
+
+
+def record_page_failure(
+    path: Union[str, PurePath], page_no: int, error: BaseException
+) -> None:
+    failure = OcrPageFailure(page_no=page_no, error=f"{type(error).__name__}: {error}")
+    with _failures_lock:
+        _failures.setdefault(_source_key(path), {})[page_no] = failure
+
+
+def restore_ocr_failures(
+    path: Union[str, PurePath], failures: Iterable[OcrPageFailure]
+) -> None:
+    """Add failures recorded elsewhere (e.g. by a worker process) for `path`."""
+
+    with _failures_lock:
+        recorded = _failures.setdefault(_source_key(path), {})
+        for failure in failures:
+            recorded[failure.page_no] = failure
+
+
+def record_ocr_failure(conv_res: Any, page_no: int, error: BaseException) -> None:
+    file = getattr(getattr(conv_res, "input", None), "file", None)
+    if file is not None:
+        record_page_failure(file, page_no, error)
+
+
+def ocr_failures_for(path: Union[str, PurePath]) -> List[OcrPageFailure]:
+    """Return the failed pages of the last conversion of `path`, by page number."""
+
+    with _failures_lock:
+        failures = _failures.get(_source_key(path), {})
+        return [failures[page_no] for page_no in sorted(failures)]
+
+
+def clear_ocr_failures(path: Union[str, PurePath]) -> None:
+    with _failures_lock:
+        _failures.pop(_source_key(path), None)
+
+
+__all__ = [
+    "OcrPageFailure",
+    "clear_ocr_failures",
+    "ocr_failures_for",
+    "record_ocr_failure",
+    "record_page_failure",
+    "restore_ocr_failures",
+]
@@ -0,0 +1,56 @@
+"""Per-document OCR page plans shared with the pooled OCR models.
+
+Pooled converters are keyed by options only, so which pages of a particular
+document need OCR cannot travel in the pipeline options. The extractor
+registers the plan for a source file before converting it, and the OCR model
+looks it up from the conversion's input file.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path, PurePath
+from threading import Lock
+from typing import Any, Dict, FrozenSet, Optional, Union
+
+from src.document_extraction.domain.ocr_policy import OcrPagePlan
+
+
+_plans: Dict[str, OcrPagePlan] = {}
+_plans_lock = Lock()
+
+
+def _plan_key(path: Union[str, PurePath]) -> str:
+    return str(Path(path).resolve())
+
+
+def register_ocr_plan(path: Union[str, PurePath], plan: OcrPagePlan) -> None:
+    """Restrict OCR for `path` to the plan's pages until it is released."""
+
+    if plan.ocr_all or not plan.page_count:
+        # Nothing was inspected (unreadable PDF, non-PDF format): OCR every page.
+        return
+    with _plans_lock:
+        _plans[_plan_key(path)] = plan
+
+
+def release_ocr_plan(path: Union[str, PurePath]) -> None:
+    with _plans_lock:
+        _plans.pop(_plan_key(path), None)
+
+
+def ocr_pages_for(conv_res: Any) -> Optional[FrozenSet[int]]:
+    """Return the pages to OCR for a conversion, or None to OCR every page."""
+
+    file = getattr(getattr(conv_res, "input", None), "file", None)
+    if file is None:
+        return None
+    with _plans_lock:
+        plan = _plans.get(_plan_key(file))
+    return None if plan is None else plan.ocr_pages
+
+
+__all__ = [
+    "ocr_pages_for",
+    "register_ocr_plan",
+    "release_ocr_plan",
+]
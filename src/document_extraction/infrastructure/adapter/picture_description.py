@@ -1,10 +1,10 @@
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, ClassVar, Dict, Iterable, List, Literal, Optional, Type
+from typing import Any, ClassVar, Dict, Iterable, List, Literal, Optional, Sequence, Type
 
-from docling_core.types.doc import NodeItem
-from docling_core.types.doc.document import PictureItem
+from docling_core.types.doc import DoclingDocument, NodeItem
+from docling_core.types.doc.document import PictureItem, PictureMiscData
 
 from docling.datamodel.accelerator_options import AcceleratorOptions
 from docling.datamodel.document import ConversionResult
@@ -16,8 +16,38 @@ from mistralai import Mistral
 from mistralai.types import UNSET, UNSET_SENTINEL
 from PIL import Image
 
-from src.document_extraction.infrastructure.adapter.utils import _image_to_data_url
+from src.document_extraction.domain.picture_filter import DecorativePictureFilter
+from src.document_extraction.infrastructure.adapter.async_engine import (
+    AsyncRequestEngine,
+    get_async_engine,
+)
+from src.document_extraction.infrastructure.adapter.resilience import (
+    acall_with_retries,
+    mistral_circuit_breaker,
+    mistral_retry_policy,
+)
+from src.document_extraction.infrastructure.adapter.result_cache import (
+    ResultCache,
+    image_digest,
+    open_result_cache,
+    picture_description_key,
+)
+from src.document_extraction.infrastructure.adapter.utils import (
+    ImageEncoding,
+    _image_to_data_url,
+)
 from src.document_extraction.infrastructure.config import (
+    PICTURE_CACHE_MAX_MB,
+    PICTURE_CACHE_PATH,
+    PICTURE_CONCURRENCY,
+    PICTURE_FILTER_ENABLED,
+    PICTURE_IMAGE_FORMAT,
+    PICTURE_IMAGE_MAX_EDGE,
+    PICTURE_IMAGE_QUALITY,
+    PICTURE_MAX_ASPECT_RATIO,
+    PICTURE_MIN_COLORS,
+    PICTURE_MIN_ENTROPY_BITS,
+    PICTURE_MIN_SIDE,
     PICTURE_MODEL,
     PICTURE_PROMPT,
 )
@@ -37,10 +67,25 @@ class MistralPictureDescriptionOptions(PictureDescriptionBaseOptions):
     prompt: str = PICTURE_PROMPT
     temperature: float = 0.2
     max_output_tokens: int = 300
-    concurrency: int = 2
+    # Requests in flight across all documents sharing the description engine.
+    concurrency: int = PICTURE_CONCURRENCY
     timeout_seconds: float = 30.0
     base_url: Optional[str] = None
     provenance: str = "mistral-picture-description"
+    # SQLite file holding descriptions per (model, prompt, image); "off" disables it.
+    cache_path: str = PICTURE_CACHE_PATH
+    cache_max_mb: int = PICTURE_CACHE_MAX_MB
+    # Icons, bullets, separators and near-blank pictures are not sent.
+    skip_decorative: bool = PICTURE_FILTER_ENABLED
+    decorative_min_side: float = PICTURE_MIN_SIDE
+    decorative_max_aspect_ratio: float = PICTURE_MAX_ASPECT_RATIO
+    decorative_min_entropy_bits: float = PICTURE_MIN_ENTROPY_BITS
+    decorative_min_colors: int = PICTURE_MIN_COLORS
+    # Pictures are sent as `image_format` (PNG | JPEG | WEBP), downscaled to
+    # `image_max_edge` pixels on the long edge (0 = as rendered).
+    image_format: str = PICTURE_IMAGE_FORMAT
+    image_quality: int = PICTURE_IMAGE_QUALITY
+    image_max_edge: int = PICTURE_IMAGE_MAX_EDGE
 
 
 class MistralPictureDescriptionModel(PictureDescriptionBaseModel):
@@ -77,6 +122,25 @@ class MistralPictureDescriptionModel(PictureDescriptionBaseModel):
             else None
         )
         self._client: Optional[Mistral] = None
+        self._engine: Optional[AsyncRequestEngine] = None
+        self._image_encoding = ImageEncoding(
+            format=self.options.image_format,
+            quality=self.options.image_quality,
+            max_long_edge=self.options.image_max_edge,
+        )
+        self._cache: Optional[ResultCache] = None
+        # Descriptions of the document being enriched, so a picture repeated on
+        # every slide or page is described once even across element batches.
+        self._document_id: Optional[int] = None
+        self._document_descriptions: Dict[str, str] = {}
+        self._decorative_filter: Optional[DecorativePictureFilter] = None
+        if self.options.skip_decorative:
+            self._decorative_filter = DecorativePictureFilter(
+                min_side=self.options.decorative_min_side,
+                max_aspect_ratio=self.options.decorative_max_aspect_ratio,
+                min_entropy_bits=self.options.decorative_min_entropy_bits,
+                min_colors=self.options.decorative_min_colors,
+            )
 
         if self.enabled:
             if not enable_remote_services:
@@ -89,6 +153,19 @@ class MistralPictureDescriptionModel(PictureDescriptionBaseModel):
                 server_url=self.options.base_url,
                 timeout_ms=self._timeout_ms,
             )
+            self._engine = get_async_engine(
+                "picture-description", concurrency=self.concurrency
+            )
+            try:
+                self._cache = open_result_cache(
+                    self.options.cache_path, max_mb=self.options.cache_max_mb
+                )
+            except Exception:  # pragma: no cover - descriptions still work without the cache
+                _log.warning(
+                    "Unable to open picture description cache at %s",
+                    self.options.cache_path,
+                    exc_info=True,
+                )
 
     def prepare_element(
         self,
@@ -107,66 +184,193 @@ class MistralPictureDescriptionModel(PictureDescriptionBaseModel):
                     )
             return None
 
-    def _annotate_images(self, images: Iterable[Image.Image]) -> Iterable[str]:
-        if not self.enabled or self._client is None:
-            return []
+    def __call__(
+        self,
+        doc: DoclingDocument,
+        element_batch: Iterable[ItemAndImageEnrichmentElement],
+    ) -> Iterable[NodeItem]:
+        if id(doc) != self._document_id:
+            self._document_id = id(doc)
+            self._document_descriptions = {}
 
-        def _describe(image: Image.Image) -> str:
-            messages: List[Dict[str, Any]] = [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image_url",
-                            "image_url": {"url": _image_to_data_url(image)},
-                        },
-                        {"type": "text", "text": self.options.prompt},
-                    ],
-                }
-            ]
+        if not self.enabled or self._decorative_filter is None:
+            yield from super().__call__(doc, element_batch)
+            return
 
-            try:
-                response = self._client.chat.complete(
+        kept: List[ItemAndImageEnrichmentElement] = []
+        decorative = 0
+        for element in element_batch:
+            reason = self._decorative_filter.classify(
+                element.image, scale=self.images_scale
+            )
+            if reason is None:
+                kept.append(element)
+                continue
+            # Record the skip on the picture so it is visible downstream.
+            element.item.annotations.append(
+                PictureMiscData(
+                    content={
+                        "decorative": True,
+                        "reason": reason,
+                        "provenance": self.provenance,
+                    }
+                )
+            )
+            decorative += 1
+            yield element.item
+
+        mistral_cost_tracker.record_picture_skips(self.options.model, decorative)
+        yield from super().__call__(doc, kept)
+
+    def describe_images(
+        self, images: Sequence[Image.Image], *, scale: float = 1.0
+    ) -> List[Optional[str]]:
+        """Describe pictures outside a Docling pipeline.
+
+        Applies the decorative filter, deduplication and caches like an
+        enrichment batch; decorative pictures come back as None.
+        """
+
+        described: List[Optional[str]] = [None] * len(images)
+        kept: List[int] = []
+        for index, image in enumerate(images):
+            if self._decorative_filter is None or (
+                self._decorative_filter.classify(image, scale=scale) is None
+            ):
+                kept.append(index)
+        mistral_cost_tracker.record_picture_skips(
+            self.options.model, len(images) - len(kept)
+        )
+        outputs = self._annotate_images([images[index] for index in kept])
+        for index, text in zip(kept, outputs):
+            described[index] = text
+        return described
+
+    async def _describe(self, image: Image.Image) -> str:
+        try:
+            # Encoding is CPU-bound; keep it off the shared event loop.
+            data_url = await asyncio.to_thread(
+                _image_to_data_url, image, self._image_encoding, use="picture_description"
+            )
+        except Exception as exc:  # pragma: no cover - one bad picture must not fail the batch
+            _log.warning("Unable to encode picture for description: %s", exc)
+            return ""
+        messages: List[Dict[str, Any]] = [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": data_url},
+                    },
+                    {"type": "text", "text": self.options.prompt},
+                ],
+            }
+        ]
+
+        try:
+            response = await acall_with_retries(
+                lambda: self._client.chat.complete_async(
                     model=self.options.model,
                     messages=messages,
                     temperature=self.options.temperature,
                     max_tokens=self.options.max_output_tokens,
-                )
-            except Exception as exc:  # pragma: no cover - shielding API errors
-                _log.warning("Mistral picture description failed: %s", exc)
-                return ""
+                ),
+                policy=mistral_retry_policy,
+                breaker=mistral_circuit_breaker,
+            )
+        except Exception as exc:  # pragma: no cover - shielding API errors
+            _log.warning("Mistral picture description failed: %s", exc)
+            return ""
 
-            mistral_cost_tracker.record_chat_completion(
-                self.options.model, getattr(response, "usage", None)
+        mistral_cost_tracker.record_chat_completion(
+            self.options.model, getattr(response, "usage", None)
+        )
+
+        content = response.choices[0].message.content
+        if content in (UNSET, UNSET_SENTINEL) or content is None:
+            content = (
+                response.model_dump()
+                .get("choices", [{}])[0]
+                .get("message", {})
+                .get("content", [])
             )
 
-            content = response.choices[0].message.content
-            if content in (UNSET, UNSET_SENTINEL) or content is None:
-                content = (
-                    response.model_dump()
-                    .get("choices", [{}])[0]
-                    .get("message", {})
-                    .get("content", [])
-                )
+        if isinstance(content, str):
+            return content.strip()
 
-            if isinstance(content, str):
-                return content.strip()
+        texts: List[str] = []
+        if isinstance(content, list):
+            for chunk in content:
+                text_value: Optional[str]
+                if isinstance(chunk, dict):
+                    text_value = chunk.get("text") or chunk.get("content")
+                else:
+                    text_value = getattr(chunk, "text", None)
+                if text_value:
+                    texts.append(text_value.strip())
 
-            texts: List[str] = []
-            if isinstance(content, list):
-                for chunk in content:
-                    text_value: Optional[str]
-                    if isinstance(chunk, dict):
-                        text_value = chunk.get("text") or chunk.get("content")
-                    else:
-                        text_value = getattr(chunk, "text", None)
-                    if text_value:
-                        texts.append(text_value.strip())
+        return "\n".join(texts)
 
-            return "\n".join(texts)
+    def _annotate_images(self, images: Iterable[Image.Image]) -> Iterable[str]:
+        if not self.enabled or self._client is None or self._engine is None:
+            return []
 
-        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
-            yield from executor.map(_describe, images)
+        images = list(images)
+        if not images:
+            return []
+
+        keys = [
+            picture_description_key(
+                self.options.model, self.options.prompt, image_digest(image)
+            )
+            for image in images
+        ]
+        descriptions: Dict[str, str] = {
+            key: self._document_descriptions[key]
+            for key in keys
+            if key in self._document_descriptions
+        }
+        first_seen = [key for key in dict.fromkeys(keys) if key not in descriptions]
+
+        cached: Dict[str, str] = {}
+        if self._cache is not None and first_seen:
+            try:
+                cached = self._cache.get_many(first_seen)
+            except Exception:  # pragma: no cover - a broken cache only costs money
+                _log.warning("Picture description cache lookup failed", exc_info=True)
+        descriptions.update(cached)
+
+        # Only the first copy of each distinct, uncached image is sent.
+        pending: Dict[str, Image.Image] = {}
+        for key, image in zip(keys, images):
+            if key not in descriptions and key not in pending:
+                pending[key] = image
+
+        described: Dict[str, str] = {}
+        if pending:
+            described = dict(
+                zip(pending, self._engine.map(self._describe, pending.values()))
+            )
+        descriptions.update(described)
+
+        # Failed calls return "" and are retried on the next copy or run.
+        fresh = {key: text for key, text in described.items() if text}
+        if self._cache is not None and fresh:
+            try:
+                self._cache.put_many(fresh)
+            except Exception:  # pragma: no cover - a broken cache only costs money
+                _log.warning("Picture description cache write failed", exc_info=True)
+        self._document_descriptions.update(cached)
+        self._document_descriptions.update(fresh)
+
+        mistral_cost_tracker.record_picture_cache(
+            self.options.model,
+            requested=len(images),
+            duplicates=len(images) - len(first_seen),
+            cache_hits=len(cached),
+        )
+        return [descriptions[key] for key in keys]
 
 
 def register_mistral_picture_description_plugin(
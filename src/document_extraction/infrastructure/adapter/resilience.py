@@ -0,0 +1,214 @@
+"""Retries and a shared circuit breaker for Mistral API calls.
+
+Transient failures (timeouts, connection errors, 408/429/5xx) are retried
+with full-jitter exponential backoff. Repeated transient failures open a
+circuit breaker shared by OCR and picture description, so calls fail fast
+while the service is down; after `reset_seconds` one probe call is let
+through (half-open) and its outcome closes or re-opens the circuit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+from src.document_extraction.infrastructure.config import settings
+
+T = TypeVar("T")
+
+_RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the API while the circuit is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def delay(self, attempt: int) -> float:
+        """Full-jitter backoff before retry number `attempt` (1-based)."""
+
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0.0, max(0.0, ceiling))
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, (httpx.TimeoutException, httpx.TransportError)):
+        return True
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and status in _RETRYABLE_STATUS
+
+
+class CircuitBreaker:
+    """Closed -> open after `failure_threshold` consecutive transient failures.
+
+    While open, calls are rejected until `reset_seconds` have passed; then a
+    single probe is allowed (half-open). A successful probe closes the circuit,
+    a failed one re-opens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = max(0.0, reset_seconds)
+        self._clock = clock
+        self._lock = Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probe_in_flight or self._clock() - self._opened_at >= self.reset_seconds:
+                return "half-open"
+            return "open"
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._probe_in_flight or self._clock() - self._opened_at < self.reset_seconds:
+                raise CircuitOpenError("Mistral API circuit is open; skipping call")
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Record that the service answered (including non-retryable errors)."""
+
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probe_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot after a call that never got an answer.
+
+        Used when a call is cancelled or interrupted; the circuit state is
+        unchanged, so the next caller probes again.
+        """
+
+        with self._lock:
+            self._probe_in_flight = False
+
+
+def call_with_retries(
+    func: Callable[[], T],
+    *,
+    policy: RetryPolicy,
+    breaker: Optional[CircuitBreaker] = None,
+) -> T:
+    """Call `func`, retrying transient failures; raises the last error."""
+
+    attempt = 0
+    while True:
+        attempt += 1
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            result = func()
+        except Exception as exc:
+            retryable = is_retryable(exc)
+            if breaker is not None:
+                if retryable:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if not retryable or attempt >= policy.max_attempts:
+                raise
+            time.sleep(policy.delay(attempt))
+            continue
+        except BaseException:
+            # Cancelled or interrupted (CancelledError, KeyboardInterrupt): no
+            # answer to record, but a half-open probe must not stay held.
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+
+async def acall_with_retries(
+    func: Callable[[], Awaitable[T]],
+    *,
+    policy: RetryPolicy,
+    breaker: Optional[CircuitBreaker] = None,
+) -> T:
+    """Async counterpart of `call_with_retries`."""
+
+    attempt = 0
+    while True:
+        attempt += 1
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            result = await func()
+        except Exception as exc:
+            retryable = is_retryable(exc)
+            if breaker is not None:
+                if retryable:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if not retryable or attempt >= policy.max_attempts:
+                raise
+            await asyncio.sleep(policy.delay(attempt))
+            continue
+        except BaseException:
+            # Cancelled or interrupted (CancelledError, KeyboardInterrupt): no
+            # answer to record, but a half-open probe must not stay held.
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+
+mistral_retry_policy = RetryPolicy(
+    max_attempts=max(1, settings.retry_attempts),
+    base_delay=settings.retry_base_delay,
+    max_delay=settings.retry_max_delay,
+)
+
+# Shared by every OCR and picture-description call in the process.
+mistral_circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.breaker_failure_threshold,
+    reset_seconds=settings.breaker_reset_seconds,
+)
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryPolicy",
+    "acall_with_retries",
+    "call_with_retries",
+    "is_retryable",
+    "mistral_circuit_breaker",
+    "mistral_retry_policy",
+]
@@ -0,0 +1,93 @@
+"""Persistent Mistral results keyed by what the model actually sees.
+
+Page-image OCR is keyed by a digest of the rendered pixels, whole-document
+OCR by a digest of each source page (see `pdf_page_digests`), and picture
+descriptions by the prompt and the picture's pixels. Repeated templates,
+cover pages and logos, and documents re-extracted after a chunking or
+configuration change, are then served without another billed request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Mapping, Optional, Sequence
+
+from PIL import Image
+
+from src.shared.sqlite_cache import SqliteLruCache
+
+_DISABLED_PATHS = {"off", "none", "disabled", "false", "0"}
+_BYTES_PER_MB = 1024 * 1024
+
+
+def image_digest(image: Image.Image) -> str:
+    """Hash the decoded pixels of an image (no PNG encoding needed)."""
+
+    digest = hashlib.sha256(f"{image.mode}:{image.width}x{image.height}:".encode("ascii"))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def ocr_cache_key(model: str, kind: str, digest: str) -> str:
+    """Return the cache key for a page digest of `kind` ("image" or "pdf-page")."""
+
+    return f"{model}:{kind}:{digest}"
+
+
+def picture_description_key(model: str, prompt: str, digest: str) -> str:
+    """Return the cache key for describing an image digest with `prompt`."""
+
+    prompt_digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+    return f"{model}:{prompt_digest}:{digest}"
+
+
+class ResultCache:
+    """Store text results in a size-bounded SQLite LRU cache."""
+
+    def __init__(self, path: str | Path, *, max_bytes: int) -> None:
+        self._store = SqliteLruCache(path, max_bytes=max_bytes)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        return {
+            key: blob.decode("utf-8")
+            for key, blob in self._store.get_many(keys).items()
+        }
+
+    def put_many(self, results: Mapping[str, str]) -> None:
+        self._store.put_many(
+            (key, text.encode("utf-8")) for key, text in results.items()
+        )
+
+    def stats(self) -> Dict[str, float]:
+        return self._store.stats()
+
+
+_caches: Dict[str, ResultCache] = {}
+_caches_lock = Lock()
+
+
+def open_result_cache(cache_path: str, *, max_mb: int) -> Optional[ResultCache]:
+    """Return the process-wide cache for `cache_path`, or None if disabled."""
+
+    raw_path = (cache_path or "").strip()
+    if not raw_path or raw_path.lower() in _DISABLED_PATHS:
+        return None
+
+    path = str(Path(raw_path).expanduser().resolve())
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = ResultCache(path, max_bytes=max(0, max_mb) * _BYTES_PER_MB)
+            _caches[path] = cache
+        return cache
+
+
+__all__ = [
+    "ResultCache",
+    "image_digest",
+    "ocr_cache_key",
+    "open_result_cache",
+    "picture_description_key",
+]
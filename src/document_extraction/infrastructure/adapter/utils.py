@@ -1,10 +1,186 @@
 import base64
 import io
+import time
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Dict, Optional
+
 from PIL import Image
 
+_MIME_TYPES = {"PNG": "image/png", "JPEG": "image/jpeg", "WEBP": "image/webp"}
+
+
+@dataclass(frozen=True)
+class ImageEncoding:
+    """How an image is encoded for an API call.
+
+    `format` is PNG, JPEG or WEBP; `quality` applies to the lossy formats, and
+    images whose long edge exceeds `max_long_edge` are downscaled first (0
+    keeps the rendered size).
+    """
+
+    format: str = "PNG"
+    quality: int = 85
+    max_long_edge: int = 0
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+
+
+@dataclass
+class _PayloadUsage:
+    calls: int = 0
+    source_pixels: int = 0
+    sent_pixels: int = 0
+    payload_bytes: int = 0
+    encode_seconds: float = 0.0
+
+
+class ImagePayloadStats:
+    """Per-use totals of encoded image payloads (bytes sent, time spent encoding)."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._usage: Dict[str, _PayloadUsage] = {}
+
+    def record(
+        self, use: str, *, source_pixels: int, sent_pixels: int, payload_bytes: int, seconds: float
+    ) -> None:
+        with self._lock:
+            usage = self._usage.setdefault(use, _PayloadUsage())
+            usage.calls += 1
+            usage.source_pixels += source_pixels
+            usage.sent_pixels += sent_pixels
+            usage.payload_bytes += payload_bytes
+            usage.encode_seconds += seconds
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {use: asdict(usage) for use, usage in sorted(self._usage.items())}
+
+    def merge(self, report: Dict[str, Dict[str, float]]) -> None:
+        """Add the totals of another `report()` (e.g. from a worker process)."""
+
+        with self._lock:
+            for use, totals in report.items():
+                usage = self._usage.setdefault(use, _PayloadUsage())
+                for name, value in totals.items():
+                    setattr(usage, name, getattr(usage, name) + value)
 
-def _image_to_data_url(image: Image.Image) -> str:
+    def format_report(self) -> str:
+        report = self.report()
+        if not report:
+            return "Image payloads: none."
+        lines = ["Image payloads:"]
+        for use, usage in report.items():
+            calls = usage["calls"] or 1
+            lines.append(
+                f"- {use}: {usage['calls']} images, "
+                f"{usage['payload_bytes'] / 1024 / calls:.1f} KiB/call, "
+                f"{usage['encode_seconds'] * 1000 / calls:.1f} ms encode/call, "
+                f"{usage['sent_pixels'] / max(1, usage['source_pixels']):.0%} of rendered pixels sent"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._usage.clear()
+
+
+image_payload_stats = ImagePayloadStats()
+
+
+def _normalize_mode(image: Image.Image) -> Image.Image:
+    """Convert to RGB, RGBA or L, which `reduce`, `resize` and every encoder accept."""
+
+    if image.mode in ("RGB", "RGBA", "L"):
+        return image
+    if image.mode in ("LA", "PA") or (
+        image.mode == "P" and "transparency" in image.info
+    ):
+        return image.convert("RGBA")
+    if image.mode.startswith("I;16"):
+        # 16-bit grey: scale to 8 bits instead of clipping at 255.
+        return image.convert("I").point(lambda value: value / 256).convert("L")
+    if image.mode in ("1", "I", "F"):
+        return image.convert("L")
+    return image.convert("RGB")
+
+
+def _downscale(image: Image.Image, max_long_edge: int) -> Image.Image:
+    long_edge = max(image.size)
+    if not max_long_edge or long_edge <= max_long_edge:
+        return image
+    # Integer box reduction is cheap; the final resize then only touches a
+    # small image.
+    factor = long_edge // max_long_edge
+    if factor >= 2:
+        image = image.reduce(factor)
+    if max(image.size) > max_long_edge:
+        scale = max_long_edge / max(image.size)
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.Resampling.BILINEAR)
+    return image
+
+
+def _flatten_alpha(image: Image.Image) -> Image.Image:
+    if image.mode in ("RGB", "L"):
+        return image
+    if image.mode in ("RGBA", "LA", "PA") or (
+        image.mode == "P" and "transparency" in image.info
+    ):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def encode_image(image: Image.Image, encoding: ImageEncoding) -> EncodedImage:
+    """Downscale and encode `image` as configured by `encoding`."""
+
+    fmt = encoding.format.upper()
+    if fmt == "JPG":
+        fmt = "JPEG"
+    if fmt not in _MIME_TYPES:
+        raise ValueError(f"Unsupported image payload format: {encoding.format}")
+
+    image = _downscale(_normalize_mode(image), encoding.max_long_edge)
     buffer = io.BytesIO()
-    image.save(buffer, format="PNG")
-    payload = base64.b64encode(buffer.getvalue()).decode("utf-8")
-    return f"data:image/png;base64,{payload}"
+    if fmt == "PNG":
+        image.save(buffer, format="PNG")
+    elif fmt == "JPEG":
+        _flatten_alpha(image).save(buffer, format="JPEG", quality=encoding.quality)
+    else:
+        # method=0 is WebP's fastest encoder setting.
+        image.save(buffer, format="WEBP", quality=encoding.quality, method=0)
+    return EncodedImage(
+        data=buffer.getvalue(),
+        mime_type=_MIME_TYPES[fmt],
+        width=image.width,
+        height=image.height,
+    )
+
+
+def _image_to_data_url(
+    image: Image.Image,
+    encoding: Optional[ImageEncoding] = None,
+    *,
+    use: str = "image",
+) -> str:
+    start = time.perf_counter()
+    encoded = encode_image(image, encoding or ImageEncoding())
+    payload = base64.b64encode(encoded.data).decode("utf-8")
+    image_payload_stats.record(
+        use,
+        source_pixels=image.width * image.height,
+        sent_pixels=encoded.width * encoded.height,
+        payload_bytes=len(payload),
+        seconds=time.perf_counter() - start,
+    )
+    return f"data:{encoded.mime_type};base64,{payload}"
@@ -4,8 +4,40 @@ from src.shared.config import ExtractionSettings
 settings = ExtractionSettings()
 
 OCR_MODEL = settings.ocr_model
+OCR_CONCURRENCY = settings.ocr_concurrency
+OCR_SUBMISSION = settings.ocr_submission
+OCR_PAGES_PER_REQUEST = settings.ocr_pages_per_request
+OCR_DIRECT_MARKDOWN = settings.ocr_direct_markdown
+OCR_CACHE_PATH = settings.ocr_cache_path
+EXTRACTION_PROFILE = settings.extraction_profile
+DEVICE = settings.device
+NUM_THREADS = settings.num_threads
+PDF_PIPELINE = settings.pdf_pipeline
+PAGE_BATCH_SIZE = settings.page_batch_size
+LAYOUT_BATCH_SIZE = settings.layout_batch_size
+OCR_BATCH_SIZE = settings.ocr_batch_size
+TABLE_BATCH_SIZE = settings.table_batch_size
+EXTRACTION_WORKERS = settings.extraction_workers
+PARALLEL_MIN_PAGES = settings.parallel_min_pages
+PAGES_PER_RANGE = settings.pages_per_range
+OCR_TIMEOUT_SECONDS = settings.ocr_timeout_seconds
+OCR_CACHE_MAX_MB = settings.ocr_cache_max_mb
+OCR_IMAGE_FORMAT = settings.ocr_image_format
+OCR_IMAGE_QUALITY = settings.ocr_image_quality
+OCR_IMAGE_MAX_EDGE = settings.ocr_image_max_edge
 PICTURE_MODEL = settings.picture_model
 PICTURE_PROMPT = settings.picture_prompt
+PICTURE_CONCURRENCY = settings.picture_concurrency
+PICTURE_CACHE_PATH = settings.picture_cache_path
+PICTURE_IMAGE_FORMAT = settings.picture_image_format
+PICTURE_IMAGE_QUALITY = settings.picture_image_quality
+PICTURE_IMAGE_MAX_EDGE = settings.picture_image_max_edge
+PICTURE_FILTER_ENABLED = settings.picture_filter_enabled
+PICTURE_MIN_SIDE = settings.picture_min_side
+PICTURE_MAX_ASPECT_RATIO = settings.picture_max_aspect_ratio
+PICTURE_MIN_ENTROPY_BITS = settings.picture_min_entropy_bits
+PICTURE_MIN_COLORS = settings.picture_min_colors
+PICTURE_CACHE_MAX_MB = settings.picture_cache_max_mb
 OCR_COST_PER_PAGE = settings.ocr_cost_per_page
 PICTURE_INPUT_COST_PER_MILLION = settings.picture_input_cost_per_million
 PICTURE_OUTPUT_COST_PER_MILLION = settings.picture_output_cost_per_million
@@ -15,8 +47,40 @@ __all__ = [
     "ExtractionSettings",
     "settings",
     "OCR_MODEL",
+    "OCR_CONCURRENCY",
+    "OCR_SUBMISSION",
+    "OCR_PAGES_PER_REQUEST",
+    "OCR_DIRECT_MARKDOWN",
+    "OCR_CACHE_PATH",
+    "EXTRACTION_PROFILE",
+    "DEVICE",
+    "NUM_THREADS",
+    "PDF_PIPELINE",
+    "PAGE_BATCH_SIZE",
+    "LAYOUT_BATCH_SIZE",
+    "OCR_BATCH_SIZE",
+    "TABLE_BATCH_SIZE",
+    "EXTRACTION_WORKERS",
+    "PARALLEL_MIN_PAGES",
+    "PAGES_PER_RANGE",
+    "OCR_TIMEOUT_SECONDS",
+    "OCR_CACHE_MAX_MB",
+    "OCR_IMAGE_FORMAT",
+    "OCR_IMAGE_QUALITY",
+    "OCR_IMAGE_MAX_EDGE",
     "PICTURE_MODEL",
     "PICTURE_PROMPT",
+    "PICTURE_CONCURRENCY",
+    "PICTURE_CACHE_PATH",
+    "PICTURE_IMAGE_FORMAT",
+    "PICTURE_IMAGE_QUALITY",
+    "PICTURE_IMAGE_MAX_EDGE",
+    "PICTURE_FILTER_ENABLED",
+    "PICTURE_MIN_SIDE",
+    "PICTURE_MAX_ASPECT_RATIO",
+    "PICTURE_MIN_ENTROPY_BITS",
+    "PICTURE_MIN_COLORS",
+    "PICTURE_CACHE_MAX_MB",
     "OCR_COST_PER_PAGE",
     "PICTURE_INPUT_COST_PER_MILLION",
     "PICTURE_OUTPUT_COST_PER_MILLION",
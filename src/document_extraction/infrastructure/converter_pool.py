@@ -0,0 +1,160 @@
+"""Long-lived Docling converters shared across documents.
+
+Building a `DocumentConverter` is cheap, but every converter keeps its own
+cache of initialized pipelines (layout/table models, Mistral clients). Reusing
+one converter per OCR decision, extraction profile and options fingerprint
+lets those pipelines be initialized once per process instead of once per
+document.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import asdict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from docling.datamodel.base_models import InputFormat
+from docling.document_converter import (
+    AsciiDocFormatOption,
+    CsvFormatOption,
+    DocumentConverter,
+    HTMLFormatOption,
+    ImageFormatOption,
+    MarkdownFormatOption,
+    PdfFormatOption,
+    PowerpointFormatOption,
+    WordFormatOption,
+)
+
+from src.document_extraction.infrastructure.adapter import (
+    register_mistral_ocr_plugin,
+    register_mistral_picture_description_plugin,
+)
+from src.document_extraction.infrastructure.config import settings
+from src.document_extraction.infrastructure.pipeline_option import (
+    ExtractionProfile,
+    apply_page_batch_size,
+    build_asciidoc_pipeline_options,
+    build_csv_pipeline_options,
+    build_docx_pipeline_options,
+    build_html_pipeline_options,
+    build_image_pipeline_options,
+    build_markdown_pipeline_options,
+    build_pdf_pipeline_options,
+    build_pptx_pipeline_options,
+    get_extraction_profile,
+    pdf_pipeline_cls,
+)
+
+
+ALLOWED_FORMATS = [
+    InputFormat.PDF,
+    InputFormat.IMAGE,
+    InputFormat.DOCX,
+    InputFormat.HTML,
+    InputFormat.PPTX,
+    InputFormat.ASCIIDOC,
+    InputFormat.CSV,
+    InputFormat.MD,
+]
+
+_converters: Dict[Tuple[bool, str, str], DocumentConverter] = {}
+_converters_lock = Lock()
+_plugins_registered = False
+
+
+def options_fingerprint(mistral_key: str) -> str:
+    """Hash every input the pipeline options are built from.
+
+    The options are derived from the API key and `ExtractionSettings`, so equal
+    fingerprints mean equal options without building the option objects.
+    """
+
+    payload = repr((mistral_key, sorted(asdict(settings).items())))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _register_plugins(allow_external_plugins: bool) -> None:
+    global _plugins_registered
+    if _plugins_registered:
+        return
+    register_mistral_ocr_plugin(allow_external_plugins=allow_external_plugins)
+    register_mistral_picture_description_plugin(
+        allow_external_plugins=allow_external_plugins
+    )
+    _plugins_registered = True
+
+
+def build_document_converter(
+    mistral_key: str, *, do_ocr: bool, profile: Optional[ExtractionProfile] = None
+) -> DocumentConverter:
+    """Build a new converter for every supported format (no reuse)."""
+
+    profile = profile or get_extraction_profile()
+    pdf_pipeline_opts = build_pdf_pipeline_options(
+        mistral_key, do_ocr=do_ocr, profile=profile
+    )
+    _register_plugins(pdf_pipeline_opts.allow_external_plugins)
+    apply_page_batch_size()
+
+    return DocumentConverter(
+        allowed_formats=list(ALLOWED_FORMATS),
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=pdf_pipeline_cls(), pipeline_options=pdf_pipeline_opts
+            ),
+            InputFormat.IMAGE: ImageFormatOption(
+                pipeline_options=build_image_pipeline_options(mistral_key, profile=profile)
+            ),
+            InputFormat.PPTX: PowerpointFormatOption(
+                pipeline_options=build_pptx_pipeline_options(mistral_key, profile=profile)
+            ),
+            InputFormat.DOCX: WordFormatOption(
+                pipeline_options=build_docx_pipeline_options(mistral_key, profile=profile)
+            ),
+            InputFormat.HTML: HTMLFormatOption(
+                pipeline_options=build_html_pipeline_options(mistral_key, profile=profile)
+            ),
+            InputFormat.ASCIIDOC: AsciiDocFormatOption(
+                pipeline_options=build_asciidoc_pipeline_options(mistral_key, profile=profile)
+            ),
+            InputFormat.CSV: CsvFormatOption(
+                pipeline_options=build_csv_pipeline_options(mistral_key, profile=profile)
+            ),
+            InputFormat.MD: MarkdownFormatOption(
+                pipeline_options=build_markdown_pipeline_options(mistral_key, profile=profile)
+            ),
+        },
+    )
+
+
+def get_document_converter(
+    mistral_key: str, *, do_ocr: bool, profile: Optional[ExtractionProfile] = None
+) -> DocumentConverter:
+    """Return the process-wide converter for this OCR decision, profile and options."""
+
+    profile = profile or get_extraction_profile()
+    key = (do_ocr, profile.name, options_fingerprint(mistral_key))
+    with _converters_lock:
+        converter = _converters.get(key)
+        if converter is None:
+            converter = build_document_converter(mistral_key, do_ocr=do_ocr, profile=profile)
+            _converters[key] = converter
+        return converter
+
+
+def clear_document_converters() -> None:
+    """Drop every cached converter and the pipelines it initialized."""
+
+    with _converters_lock:
+        _converters.clear()
+
+
+__all__ = [
+    "ALLOWED_FORMATS",
+    "build_document_converter",
+    "clear_document_converters",
+    "get_document_converter",
+    "options_fingerprint",
+]
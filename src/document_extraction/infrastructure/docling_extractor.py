@@ -1,52 +1,81 @@
 from __future__ import annotations
 
+import logging
 import os
 import warnings
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
 
-from docling.document_converter import (
-    AsciiDocFormatOption,
-    CsvFormatOption,
-    DocumentConverter,
-    HTMLFormatOption,
-    ImageFormatOption,
-    MarkdownFormatOption,
-    PdfFormatOption,
-    PowerpointFormatOption,
-    WordFormatOption,
-)
-from docling.datamodel.base_models import InputFormat
 from docling_core.transforms.serializer.markdown import (
     MarkdownDocSerializer,
     MarkdownParams,
 )
-from dotenv import load_dotenv  # type: ignore
 
 from src.cost_management.infrastructure.mistral_cost_tracker import (
     mistral_cost_tracker,
 )
 from src.document_extraction.domain.ocr_policy import OcrPolicyDecider
-from src.document_extraction.infrastructure.adapter import (
-    register_mistral_ocr_plugin,
-    register_mistral_picture_description_plugin,
+from src.document_extraction.infrastructure.adapter.ocr_failures import (
+    clear_ocr_failures,
+    ocr_failures_for,
+)
+from src.document_extraction.infrastructure.adapter.ocr_page_plan import (
+    register_ocr_plan,
+    release_ocr_plan,
+)
+from src.document_extraction.infrastructure.adapter.utils import image_payload_stats
+from src.document_extraction.infrastructure.config import (
+    EXTRACTION_WORKERS,
+    OCR_DIRECT_MARKDOWN,
+    PAGES_PER_RANGE,
+    PARALLEL_MIN_PAGES,
+)
+from src.document_extraction.infrastructure.converter_pool import (
+    get_document_converter,
+)
+from src.document_extraction.infrastructure.parallel_extractor import (
+    get_parallel_extractor,
 )
 from src.document_extraction.infrastructure.pipeline_option import (
-    build_asciidoc_pipeline_options,
-    build_csv_pipeline_options,
-    build_docx_pipeline_options,
-    build_html_pipeline_options,
-    build_image_pipeline_options,
-    build_markdown_pipeline_options,
-    build_pdf_pipeline_options,
-    build_pptx_pipeline_options,
+    get_extraction_profile,
 )
 from src.document_extraction.infrastructure.picture_serializer import (
     CommentPictureSerializer,
 )
+from src.document_extraction.infrastructure.scanned_extractor import (
+    get_scanned_extractor,
+    is_fully_scanned,
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+def _print_run_report(source: str) -> None:
+    failures = ocr_failures_for(source)
+    if failures:
+        # 0-based internally; reported 1-based like page numbers in viewers.
+        pages = ", ".join(str(failure.page_no + 1) for failure in failures)
+        print(
+            f"OCR failed for {len(failures)} page(s) of {source}: {pages}. "
+            "Re-running sends only these pages when the OCR cache is enabled."
+        )
+    print(mistral_cost_tracker.format_report())
+    print(image_payload_stats.format_report())
+
 
+def run_extraction(source: str, *, profile: Optional[str] = None) -> str:
+    """Convert a document into Markdown and return the serialized text.
 
-def run_extraction(source: str) -> str:
-    """Convert a document into Markdown and return the serialized text."""
-    load_dotenv()
+    `profile` names an extraction profile (fast | balanced | accurate, see
+    `pipeline_option`); None uses EXTRACTION_PROFILE.
+
+    Converters (and the Docling pipelines they initialize) are reused across
+    calls; see `converter_pool`. PDFs whose every page needs OCR bypass Docling
+    and use Mistral's OCR markdown directly; see `scanned_extractor`. With
+    EXTRACTION_WORKERS > 1, large PDFs are converted as page ranges in worker
+    processes; see `parallel_extractor`.
+    """
 
     # Suppress benign RuntimeWarnings coming from Docling confidence aggregation
     # (e.g., "Mean of empty slice") when metrics are not applicable for a format.
@@ -54,6 +83,8 @@ def run_extraction(source: str) -> str:
         "ignore", category=RuntimeWarning, message="Mean of empty slice"
     )
 
+    extraction_profile = get_extraction_profile(profile)
+
     mistral_key = os.getenv("MISTRAL_KEY")
     if not mistral_key:
         raise RuntimeError(
@@ -63,75 +94,78 @@ def run_extraction(source: str) -> str:
     # Reset usage tracking for a fresh run and apply any runtime pricing overrides.
     mistral_cost_tracker.reset()
     mistral_cost_tracker.configure_from_environment()
+    image_payload_stats.reset()
 
-    # Decide OCR policy per file/format
+    # Decide OCR per page; pages with a usable text layer are not sent to OCR.
     policy = OcrPolicyDecider()
-    do_ocr = policy.should_ocr(source)
-
-    pdf_pipeline_opts = build_pdf_pipeline_options(
-        mistral_key,
-        do_ocr=do_ocr,
-    )
-    image_pipeline_opts = build_image_pipeline_options(mistral_key)
-    pptx_pipeline_opts = build_pptx_pipeline_options(mistral_key)
-    docx_pipeline_opts = build_docx_pipeline_options(mistral_key)
-    html_pipeline_opts = build_html_pipeline_options(mistral_key)
-    asciidoc_pipeline_opts = build_asciidoc_pipeline_options(mistral_key)
-    csv_pipeline_opts = build_csv_pipeline_options(mistral_key)
-    markdown_pipeline_opts = build_markdown_pipeline_options(mistral_key)
-
-    register_mistral_ocr_plugin(
-        allow_external_plugins=pdf_pipeline_opts.allow_external_plugins
-    )
-    register_mistral_picture_description_plugin(
-        allow_external_plugins=pdf_pipeline_opts.allow_external_plugins
-    )
-
-    converter = DocumentConverter(
-        allowed_formats=[
-            InputFormat.PDF,
-            InputFormat.IMAGE,
-            InputFormat.DOCX,
-            InputFormat.HTML,
-            InputFormat.PPTX,
-            InputFormat.ASCIIDOC,
-            InputFormat.CSV,
-            InputFormat.MD,
-        ],
-        format_options={
-            InputFormat.PDF: PdfFormatOption(pipeline_options=pdf_pipeline_opts),
-            InputFormat.IMAGE: ImageFormatOption(pipeline_options=image_pipeline_opts),
-            InputFormat.PPTX: PowerpointFormatOption(
-                pipeline_options=pptx_pipeline_opts
-            ),
-            InputFormat.DOCX: WordFormatOption(pipeline_options=docx_pipeline_opts),
-            InputFormat.HTML: HTMLFormatOption(pipeline_options=html_pipeline_opts),
-            InputFormat.ASCIIDOC: AsciiDocFormatOption(
-                pipeline_options=asciidoc_pipeline_opts
-            ),
-            InputFormat.CSV: CsvFormatOption(pipeline_options=csv_pipeline_opts),
-            InputFormat.MD: MarkdownFormatOption(
-                pipeline_options=markdown_pipeline_opts
-            ),
-        },
-    )
+    plan = policy.plan(source)
+    do_ocr = plan.needs_ocr
+    clear_ocr_failures(source)
+
+    if OCR_DIRECT_MARKDOWN and is_fully_scanned(source, plan):
+        print(
+            f"OCR policy: fully scanned ({plan.page_count} pages); "
+            f"using OCR markdown directly for {source} (profile={extraction_profile.name})"
+        )
+        markdown = get_scanned_extractor(mistral_key).extract(
+            source,
+            page_count=plan.page_count,
+            describe_pictures=extraction_profile.describe_pictures,
+        )
+        _print_run_report(source)
+        return markdown
+
+    if plan.ocr_all or not plan.page_count:
+        print(f"OCR policy: do_ocr={do_ocr} for {source} (profile={extraction_profile.name})")
+    else:
+        print(
+            f"OCR policy: do_ocr={do_ocr} "
+            f"({len(plan.ocr_pages)}/{plan.page_count} pages) for {source} "
+            f"(profile={extraction_profile.name})"
+        )
 
-    print(f"OCR policy: do_ocr={do_ocr} for {source}")
-    result = converter.convert(source)
+    conversion = None
+    if EXTRACTION_WORKERS > 1 and plan.page_count >= max(1, PARALLEL_MIN_PAGES):
+        try:
+            conversion = get_parallel_extractor(
+                mistral_key, workers=EXTRACTION_WORKERS, do_ocr=do_ocr
+            ).convert(
+                source,
+                plan=plan,
+                do_ocr=do_ocr,
+                pages_per_range=PAGES_PER_RANGE,
+                profile=extraction_profile,
+            )
+        except BrokenProcessPool:
+            # Nothing from the finished ranges was merged yet; convert it here.
+            _log.warning("Falling back to in-process conversion for %s", source)
+
+    if conversion is not None:
+        document, confidence = conversion.document, conversion.confidence
+    else:
+        converter = get_document_converter(
+            mistral_key, do_ocr=do_ocr, profile=extraction_profile
+        )
+        register_ocr_plan(source, plan)
+        try:
+            result = converter.convert(source)
+        finally:
+            release_ocr_plan(source)
+        document, confidence = result.document, result.confidence
 
     serializer = MarkdownDocSerializer(
-        doc=result.document,
+        doc=document,
         picture_serializer=CommentPictureSerializer(),
         params=MarkdownParams(),
     )
     markdown = serializer.serialize().text
 
-    print(f"Mean_grade: {result.confidence.mean_grade.value}")
-    print(mistral_cost_tracker.format_report())
+    print(f"Mean_grade: {confidence.mean_grade.value}")
+    _print_run_report(source)
 
     return markdown
 
 
-def main_extraction(source: str) -> str:
+def main_extraction(source: str, *, profile: Optional[str] = None) -> str:
     """Wrapper that returns the extracted Markdown string."""
-    return run_extraction(source)
+    return run_extraction(source, profile=profile)
@@ -0,0 +1,117 @@
+"""Merge Docling documents converted from consecutive page ranges of one PDF.
+
+A single conversion lets Docling's reading-order model join paragraphs and
+lists that continue on the next page. When a PDF is converted in page ranges
+that model never sees the pages on both sides of a range boundary, so before
+the range documents are concatenated the first body item of each range is
+stitched to the last body item of the previous one:
+
+- a paragraph or heading that does not end a sentence and continues in
+  lowercase is joined into one item (same label, and same level for headings);
+- a list that ends one range and starts the next becomes one list.
+
+Page numbers stay absolute because every range is converted with Docling's
+`page_range` on the full PDF.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+from docling_core.types.doc import (
+    ContentLayer,
+    DocItemLabel,
+    DoclingDocument,
+    ListGroup,
+    ListItem,
+    NodeItem,
+    SectionHeaderItem,
+    TextItem,
+)
+
+_JOINABLE_LABELS = {
+    DocItemLabel.TEXT,
+    DocItemLabel.PARAGRAPH,
+    DocItemLabel.SECTION_HEADER,
+    DocItemLabel.TITLE,
+}
+_SENTENCE_END = (".", "!", "?", ":", ";", '"', "”", ")", "]")
+
+
+def _body_items(doc: DoclingDocument) -> List[NodeItem]:
+    items = [ref.resolve(doc) for ref in doc.body.children]
+    return [item for item in items if item.content_layer == ContentLayer.BODY]
+
+
+def _continues(tail: str, head: str) -> bool:
+    tail, head = tail.rstrip(), head.lstrip()
+    return bool(tail and head) and not tail.endswith(_SENTENCE_END) and head[0].islower()
+
+
+def _joinable(tail: NodeItem, head: NodeItem) -> bool:
+    if not isinstance(tail, TextItem) or isinstance(tail, ListItem):
+        return False
+    if type(tail) is not type(head) or tail.label != head.label:
+        return False
+    if tail.label not in _JOINABLE_LABELS:
+        return False
+    if isinstance(tail, SectionHeaderItem) and tail.level != head.level:
+        return False
+    return _continues(tail.text, head.text)
+
+
+def _join_text(tail: TextItem, head: TextItem) -> None:
+    """Append `head` to `tail` like Docling's cross-page merge does."""
+
+    offset = len(tail.text) + 1
+    for prov in head.prov:
+        start, end = prov.charspan
+        tail.prov.append(
+            prov.model_copy(update={"charspan": (offset + start, offset + end)})
+        )
+    tail.text = f"{tail.text} {head.text}"
+    tail.orig = f"{tail.orig} {head.orig}"
+
+
+def stitch_range_boundary(previous: DoclingDocument, following: DoclingDocument) -> Optional[str]:
+    """Join the item split across the boundary of two ranges, in place.
+
+    Returns what was stitched ("text", "heading" or "list"), or None.
+    """
+
+    previous_items = _body_items(previous)
+    following_items = _body_items(following)
+    if not previous_items or not following_items:
+        return None
+    tail, head = previous_items[-1], following_items[0]
+
+    if isinstance(tail, ListGroup) and isinstance(head, ListGroup):
+        children = [ref.resolve(following) for ref in head.children]
+        if not children:
+            return None
+        previous.add_node_items(node_items=children, doc=following, parent=tail)
+        following.delete_items(node_items=[head])
+        return "list"
+
+    if _joinable(tail, head):
+        _join_text(tail, head)
+        following.delete_items(node_items=[head])
+        return "text" if tail.label in (DocItemLabel.TEXT, DocItemLabel.PARAGRAPH) else "heading"
+
+    return None
+
+
+def merge_range_documents(docs: Sequence[DoclingDocument], *, name: str) -> DoclingDocument:
+    """Concatenate range documents (in page order) into one document."""
+
+    if not docs:
+        return DoclingDocument(name=name)
+    for previous, following in zip(docs, docs[1:]):
+        stitch_range_boundary(previous, following)
+    merged = DoclingDocument.concatenate(docs)
+    merged.name = name
+    merged.origin = docs[0].origin
+    return merged
+
+
+__all__ = ["merge_range_documents", "stitch_range_boundary"]
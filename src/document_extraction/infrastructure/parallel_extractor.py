@@ -0,0 +1,264 @@
+"""Convert large PDFs as page ranges in a pool of worker processes.
+
+Docling's layout and table models are CPU-bound and a single conversion is
+limited to one process. Here a PDF is split into consecutive page ranges that
+are converted with `page_range` in a `ProcessPoolExecutor`; every worker keeps
+its converters (and their initialized pipelines) warm across ranges and
+documents. The range documents are merged back in page order, stitching
+paragraphs, headings and lists cut by a range boundary (see `document_merge`).
+
+Mistral usage, image payload totals and OCR page failures are recorded in the
+worker processes and handed back with each range, so the run report covers
+the whole document. The circuit breaker is per process.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from docling.datamodel.base_models import ConfidenceReport, InputFormat, PageConfidenceScores
+from docling_core.types.doc import DoclingDocument
+
+from src.cost_management.infrastructure.mistral_cost_tracker import (
+    mistral_cost_tracker,
+)
+from src.document_extraction.domain.ocr_policy import OcrPagePlan
+from src.document_extraction.infrastructure.adapter.ocr_failures import (
+    OcrPageFailure,
+    clear_ocr_failures,
+    ocr_failures_for,
+    restore_ocr_failures,
+)
+from src.document_extraction.infrastructure.adapter.ocr_page_plan import (
+    register_ocr_plan,
+    release_ocr_plan,
+)
+from src.document_extraction.infrastructure.adapter.utils import image_payload_stats
+from src.document_extraction.infrastructure.converter_pool import (
+    get_document_converter,
+    options_fingerprint,
+)
+from src.document_extraction.infrastructure.document_merge import (
+    merge_range_documents,
+)
+from src.document_extraction.infrastructure.pipeline_option import (
+    ExtractionProfile,
+    get_extraction_profile,
+    share_threads,
+)
+
+
+_log = logging.getLogger(__name__)
+
+PageRange = Tuple[int, int]  # 1-based, inclusive, like Docling's page_range
+
+
+def split_page_ranges(page_count: int, pages_per_range: int) -> List[PageRange]:
+    """Split `page_count` pages into consecutive ranges of `pages_per_range` pages."""
+
+    size = max(1, pages_per_range)
+    return [
+        (start, min(start + size - 1, page_count))
+        for start in range(1, page_count + 1, size)
+    ]
+
+
+@dataclass(frozen=True)
+class _RangeTask:
+    source: str
+    page_range: PageRange
+    do_ocr: bool
+    plan: OcrPagePlan
+    profile: str
+
+
+@dataclass
+class _RangeResult:
+    page_range: PageRange
+    document: DoclingDocument
+    confidence_pages: Dict[int, PageConfidenceScores]
+    usage: Dict[str, Any] = field(default_factory=dict)
+    payloads: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    failures: List[OcrPageFailure] = field(default_factory=list)
+
+
+@dataclass
+class ParallelConversion:
+    document: DoclingDocument
+    confidence: ConfidenceReport
+
+
+# --- worker process -------------------------------------------------------------------
+
+_worker_key: Optional[str] = None
+
+
+def _init_worker(mistral_key: str, workers: int, do_ocr: bool) -> None:
+    global _worker_key
+    _worker_key = mistral_key
+    # Split the configured (or tuned) thread count between the workers, for
+    # Docling's models and for libraries that read OMP_NUM_THREADS.
+    os.environ["OMP_NUM_THREADS"] = str(share_threads(workers))
+    mistral_cost_tracker.configure_from_environment()
+    # Load the layout and table models now rather than on the first range.
+    get_document_converter(mistral_key, do_ocr=do_ocr).initialize_pipeline(InputFormat.PDF)
+
+
+def _convert_range(task: _RangeTask) -> _RangeResult:
+    if _worker_key is None:
+        raise RuntimeError("Worker process was not initialized with a Mistral key.")
+
+    mistral_cost_tracker.reset()
+    image_payload_stats.reset()
+    clear_ocr_failures(task.source)
+
+    converter = get_document_converter(
+        _worker_key, do_ocr=task.do_ocr, profile=get_extraction_profile(task.profile)
+    )
+    register_ocr_plan(task.source, task.plan)
+    try:
+        result = converter.convert(task.source, page_range=task.page_range)
+    finally:
+        release_ocr_plan(task.source)
+
+    return _RangeResult(
+        page_range=task.page_range,
+        document=result.document,
+        confidence_pages=dict(result.confidence.pages),
+        usage=mistral_cost_tracker.usage_snapshot(),
+        payloads=image_payload_stats.report(),
+        failures=ocr_failures_for(task.source),
+    )
+
+
+# --- parent process -------------------------------------------------------------------
+
+
+class ParallelPdfExtractor:
+    """Convert a PDF as page ranges across `workers` processes."""
+
+    def __init__(self, mistral_key: str, *, workers: int, do_ocr: bool) -> None:
+        self.workers = max(1, workers)
+        self._initargs = (mistral_key, self.workers, do_ocr)
+        self._lock = Lock()
+        self._executor = self._new_executor()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # "spawn" keeps workers clear of the parent's loop and model threads.
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=self._initargs,
+        )
+
+    def _replace_broken_executor(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = self._new_executor()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def convert(
+        self,
+        source: str,
+        *,
+        plan: OcrPagePlan,
+        do_ocr: bool,
+        pages_per_range: int,
+        profile: ExtractionProfile,
+    ) -> ParallelConversion:
+        ranges = split_page_ranges(plan.page_count, pages_per_range)
+        tasks = [
+            _RangeTask(
+                source=source,
+                page_range=page_range,
+                do_ocr=do_ocr,
+                plan=plan,
+                profile=profile.name,
+            )
+            for page_range in ranges
+        ]
+        executor = self._executor
+        try:
+            # map() keeps the results in page order.
+            results = list(executor.map(_convert_range, tasks))
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory or a native crash in a model).
+            # Later documents get a fresh pool; the caller decides about this one.
+            _log.warning("Page-range worker pool broke while converting %s; restarting it", source)
+            self._replace_broken_executor(executor)
+            raise
+
+        confidence_pages: Dict[int, PageConfidenceScores] = {}
+        for result in results:
+            mistral_cost_tracker.merge_usage(result.usage)
+            image_payload_stats.merge(result.payloads)
+            restore_ocr_failures(source, result.failures)
+            confidence_pages.update(result.confidence_pages)
+
+        document = merge_range_documents(
+            [result.document for result in results], name=results[0].document.name
+        )
+        _log.info(
+            "Converted %s in %d page ranges across %d workers",
+            source,
+            len(ranges),
+            self.workers,
+        )
+        return ParallelConversion(
+            document=document, confidence=ConfidenceReport(pages=confidence_pages)
+        )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+_extractors: Dict[Tuple[str, int], ParallelPdfExtractor] = {}
+_extractors_lock = Lock()
+
+
+def get_parallel_extractor(
+    mistral_key: str, *, workers: int, do_ocr: bool
+) -> ParallelPdfExtractor:
+    """Return the process-wide worker pool for the current options.
+
+    `do_ocr` only selects which converter the workers warm up first; a pool
+    serves both OCR decisions and every extraction profile.
+    """
+
+    key = (options_fingerprint(mistral_key), max(1, workers))
+    with _extractors_lock:
+        extractor = _extractors.get(key)
+        if extractor is None:
+            extractor = ParallelPdfExtractor(mistral_key, workers=workers, do_ocr=do_ocr)
+            _extractors[key] = extractor
+        return extractor
+
+
+def shutdown_parallel_extractors() -> None:
+    """Stop every worker pool (their warm converters are dropped)."""
+
+    with _extractors_lock:
+        extractors = list(_extractors.values())
+        _extractors.clear()
+    for extractor in extractors:
+        extractor.shutdown()
+
+
+__all__ = [
+    "ParallelConversion",
+    "ParallelPdfExtractor",
+    "get_parallel_extractor",
+    "shutdown_parallel_extractors",
+    "split_page_ranges",
+]
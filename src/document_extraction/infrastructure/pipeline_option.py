@@ -1,16 +1,163 @@
-from docling.datamodel.pipeline_options import ConvertPipelineOptions, PdfPipelineOptions
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Type
+
+from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+from docling.datamodel.pipeline_options import (
+    ConvertPipelineOptions,
+    PdfPipelineOptions,
+    TableFormerMode,
+    TableStructureOptions,
+    ThreadedPdfPipelineOptions,
+)
+from docling.datamodel.settings import settings as docling_settings
+from docling.pipeline.base_pipeline import BasePipeline
+from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.pipeline.threaded_standard_pdf_pipeline import ThreadedStandardPdfPipeline
 
 from src.document_extraction.infrastructure.adapter import (
     MistralOcrOptions,
     MistralPictureDescriptionOptions,
 )
 from src.document_extraction.infrastructure.config import (
+    DEVICE,
+    EXTRACTION_PROFILE,
+    LAYOUT_BATCH_SIZE,
+    NUM_THREADS,
+    OCR_BATCH_SIZE,
+    OCR_CONCURRENCY,
     OCR_MODEL,
+    PAGE_BATCH_SIZE,
+    PDF_PIPELINE,
+    PICTURE_CONCURRENCY,
     PICTURE_MODEL,
     PICTURE_PROMPT,
+    TABLE_BATCH_SIZE,
 )
 
 
+# Thread count for this process, overriding EXTRACTION_NUM_THREADS; set by
+# page-range workers so they share the configured threads instead of each
+# using all of them.
+_process_threads: Optional[int] = None
+
+
+def share_threads(workers: int) -> int:
+    """Give this process its 1/`workers` share of the configured threads."""
+
+    global _process_threads
+    _process_threads = max(1, DoclingRuntime.from_settings().resolved_threads() // max(1, workers))
+    return _process_threads
+
+
+@dataclass(frozen=True)
+class DoclingRuntime:
+    """Device, CPU threads and page batching for Docling's PDF models.
+
+    `num_threads` 0 resolves to OMP_NUM_THREADS, else every core. With the
+    "standard" pipeline pages go through all stages `page_batch_size` at a
+    time; "threaded" overlaps the stages, each with its own batch size.
+    """
+
+    device: str = "auto"
+    num_threads: int = 0
+    pdf_pipeline: str = "standard"
+    page_batch_size: int = 4
+    layout_batch_size: int = 4
+    ocr_batch_size: int = 4
+    table_batch_size: int = 4
+
+    @classmethod
+    def from_settings(cls) -> "DoclingRuntime":
+        return cls(
+            device=DEVICE,
+            num_threads=_process_threads or NUM_THREADS,
+            pdf_pipeline=PDF_PIPELINE,
+            page_batch_size=PAGE_BATCH_SIZE,
+            layout_batch_size=LAYOUT_BATCH_SIZE,
+            ocr_batch_size=OCR_BATCH_SIZE,
+            table_batch_size=TABLE_BATCH_SIZE,
+        )
+
+    @property
+    def threaded(self) -> bool:
+        return self.pdf_pipeline.strip().lower() == "threaded"
+
+    def resolved_threads(self) -> int:
+        if self.num_threads > 0:
+            return self.num_threads
+        try:
+            omp_threads = int(os.getenv("OMP_NUM_THREADS", ""))
+        except ValueError:
+            omp_threads = 0
+        return omp_threads if omp_threads > 0 else os.cpu_count() or 1
+
+    def accelerator_options(self) -> AcceleratorOptions:
+        try:
+            device = AcceleratorDevice(self.device.strip().lower())
+        except ValueError:
+            device = AcceleratorDevice.AUTO
+        return AcceleratorOptions(num_threads=self.resolved_threads(), device=device)
+
+
+def pdf_pipeline_cls(runtime: Optional[DoclingRuntime] = None) -> Type[BasePipeline]:
+    runtime = runtime or DoclingRuntime.from_settings()
+    return ThreadedStandardPdfPipeline if runtime.threaded else StandardPdfPipeline
+
+
+def apply_page_batch_size(runtime: Optional[DoclingRuntime] = None) -> None:
+    """Set Docling's process-wide page batch size (used by the standard pipeline)."""
+
+    runtime = runtime or DoclingRuntime.from_settings()
+    docling_settings.perf.page_batch_size = max(1, runtime.page_batch_size)
+
+
+@dataclass(frozen=True)
+class ExtractionProfile:
+    """Speed/quality trade-off applied to the pipeline options of every format.
+
+    `accurate` is the full pipeline; `fast` drops the table-structure model,
+    picture crops and picture descriptions for bulk backfills.
+    """
+
+    name: str
+    do_table_structure: bool = True
+    table_mode: TableFormerMode = TableFormerMode.ACCURATE
+    generate_picture_images: bool = True
+    images_scale: float = 2.0
+    describe_pictures: bool = True
+
+
+EXTRACTION_PROFILES: Dict[str, ExtractionProfile] = {
+    "fast": ExtractionProfile(
+        name="fast",
+        do_table_structure=False,
+        generate_picture_images=False,
+        images_scale=1.0,
+        describe_pictures=False,
+    ),
+    "balanced": ExtractionProfile(
+        name="balanced",
+        table_mode=TableFormerMode.FAST,
+        images_scale=1.5,
+    ),
+    "accurate": ExtractionProfile(name="accurate"),
+}
+
+
+def get_extraction_profile(name: Optional[str] = None) -> ExtractionProfile:
+    """Return the named profile, or the EXTRACTION_PROFILE default."""
+
+    key = (name or EXTRACTION_PROFILE).strip().lower()
+    profile = EXTRACTION_PROFILES.get(key)
+    if profile is None:
+        raise ValueError(
+            f"Unknown extraction profile {name!r}; "
+            f"expected one of: {', '.join(EXTRACTION_PROFILES)}"
+        )
+    return profile
+
+
 def _picture_description_options(api_key: str) -> MistralPictureDescriptionOptions:
     return MistralPictureDescriptionOptions(
         api_key=api_key,
@@ -18,71 +165,122 @@ def _picture_description_options(api_key: str) -> MistralPictureDescriptionOptio
         prompt=PICTURE_PROMPT,
         temperature=0.2,
         max_output_tokens=300,
-        concurrency=1,
+        concurrency=PICTURE_CONCURRENCY,
         timeout_seconds=60.0,
         base_url=None,
     )
 
 
-def _common_convert_options(api_key: str) -> ConvertPipelineOptions:
+def _common_convert_options(
+    api_key: str, *, profile: Optional[ExtractionProfile] = None
+) -> ConvertPipelineOptions:
+    profile = profile or get_extraction_profile()
     return ConvertPipelineOptions(
         allow_external_plugins=True,
         enable_remote_services=True,
-        do_picture_description=True,
+        do_picture_description=profile.describe_pictures,
         picture_description_options=_picture_description_options(api_key),
     )
 
 
-def _pdf_pipeline_options(api_key: str, *, do_ocr: bool) -> PdfPipelineOptions:
-    return PdfPipelineOptions(
+def _pdf_pipeline_options(
+    api_key: str,
+    *,
+    do_ocr: bool,
+    runtime: Optional[DoclingRuntime] = None,
+    profile: Optional[ExtractionProfile] = None,
+) -> PdfPipelineOptions:
+    runtime = runtime or DoclingRuntime.from_settings()
+    profile = profile or get_extraction_profile()
+    options_cls = ThreadedPdfPipelineOptions if runtime.threaded else PdfPipelineOptions
+    options = options_cls(
         do_ocr=do_ocr,
         allow_external_plugins=True,
         enable_remote_services=True,
-        generate_picture_images=True,
-        images_scale=2.0,
-        do_picture_description=True,
+        do_table_structure=profile.do_table_structure,
+        table_structure_options=TableStructureOptions(mode=profile.table_mode),
+        generate_picture_images=profile.generate_picture_images,
+        images_scale=profile.images_scale,
+        do_picture_description=profile.describe_pictures,
         picture_description_options=_picture_description_options(api_key),
-        ocr_options=MistralOcrOptions(api_key=api_key, model=OCR_MODEL),
+        ocr_options=MistralOcrOptions(
+            api_key=api_key,
+            model=OCR_MODEL,
+            concurrency=OCR_CONCURRENCY,
+        ),
+        accelerator_options=runtime.accelerator_options(),
     )
+    if isinstance(options, ThreadedPdfPipelineOptions):
+        options.layout_batch_size = max(1, runtime.layout_batch_size)
+        options.ocr_batch_size = max(1, runtime.ocr_batch_size)
+        options.table_batch_size = max(1, runtime.table_batch_size)
+    return options
 
 
 def create_picture_description_options(api_key: str) -> MistralPictureDescriptionOptions:
     return _picture_description_options(api_key)
 
 
-def build_pdf_pipeline_options(api_key: str, *, do_ocr: bool) -> PdfPipelineOptions:
-    return _pdf_pipeline_options(api_key, do_ocr=do_ocr)
+def build_pdf_pipeline_options(
+    api_key: str,
+    *,
+    do_ocr: bool,
+    runtime: Optional[DoclingRuntime] = None,
+    profile: Optional[ExtractionProfile] = None,
+) -> PdfPipelineOptions:
+    return _pdf_pipeline_options(api_key, do_ocr=do_ocr, runtime=runtime, profile=profile)
 
 
-def build_image_pipeline_options(api_key: str) -> PdfPipelineOptions:
-    return _pdf_pipeline_options(api_key, do_ocr=True)
+def build_image_pipeline_options(
+    api_key: str, *, profile: Optional[ExtractionProfile] = None
+) -> PdfPipelineOptions:
+    return _pdf_pipeline_options(api_key, do_ocr=True, profile=profile)
 
 
-def build_pptx_pipeline_options(api_key: str) -> ConvertPipelineOptions:
-    return _common_convert_options(api_key)
+def build_pptx_pipeline_options(
+    api_key: str, *, profile: Optional[ExtractionProfile] = None
+) -> ConvertPipelineOptions:
+    return _common_convert_options(api_key, profile=profile)
 
 
-def build_docx_pipeline_options(api_key: str) -> ConvertPipelineOptions:
-    return _common_convert_options(api_key)
+def build_docx_pipeline_options(
+    api_key: str, *, profile: Optional[ExtractionProfile] = None
+) -> ConvertPipelineOptions:
+    return _common_convert_options(api_key, profile=profile)
 
 
-def build_html_pipeline_options(api_key: str) -> ConvertPipelineOptions:
-    return _common_convert_options(api_key)
+def build_html_pipeline_options(
+    api_key: str, *, profile: Optional[ExtractionProfile] = None
+) -> ConvertPipelineOptions:
+    return _common_convert_options(api_key, profile=profile)
 
 
-def build_asciidoc_pipeline_options(api_key: str) -> ConvertPipelineOptions:
-    return _common_convert_options(api_key)
+def build_asciidoc_pipeline_options(
+    api_key: str, *, profile: Optional[ExtractionProfile] = None
+) -> ConvertPipelineOptions:
+    return _common_convert_options(api_key, profile=profile)
 
 
-def build_csv_pipeline_options(api_key: str) -> ConvertPipelineOptions:
-    return _common_convert_options(api_key)
+def build_csv_pipeline_options(
+    api_key: str, *, profile: Optional[ExtractionProfile] = None
+) -> ConvertPipelineOptions:
+    return _common_convert_options(api_key, profile=profile)
 
 
-def build_markdown_pipeline_options(api_key: str) -> ConvertPipelineOptions:
-    return _common_convert_options(api_key)
+def build_markdown_pipeline_options(
+    api_key: str, *, profile: Optional[ExtractionProfile] = None
+) -> ConvertPipelineOptions:
+    return _common_convert_options(api_key, profile=profile)
 
 
 __all__ = [
+    "DoclingRuntime",
+    "EXTRACTION_PROFILES",
+    "ExtractionProfile",
+    "get_extraction_profile",
+    "apply_page_batch_size",
+    "share_threads",
+    "pdf_pipeline_cls",
     "create_picture_description_options",
     "build_pdf_pipeline_options",
     "build_image_pipeline_options",
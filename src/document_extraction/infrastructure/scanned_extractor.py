@@ -0,0 +1,296 @@
+"""Markdown straight from Mistral OCR for fully scanned PDFs.
+
+When every page of a PDF needs OCR, Docling's layout and table models only
+re-segment a single full-page OCR cell per page, and they flatten the
+headings and tables Mistral already returns as markdown. This extractor skips
+Docling: it submits the PDF in slices, keeps Mistral's per-page markdown, and
+merges picture descriptions for the images Mistral extracts, as HTML comments
+like `CommentPictureSerializer` does.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from docling.datamodel.accelerator_options import AcceleratorOptions
+from mistralai import Mistral, models
+from PIL import Image
+
+from src.cost_management.infrastructure.mistral_cost_tracker import (
+    mistral_cost_tracker,
+)
+from src.document_extraction.domain.ocr_policy import OcrPagePlan, text_layer_pages
+from src.document_extraction.infrastructure.adapter import (
+    MistralPictureDescriptionModel,
+)
+from src.document_extraction.infrastructure.adapter.document_ocr import (
+    build_pdf_slices,
+    pdf_data_url,
+    pdf_page_digests,
+)
+from src.document_extraction.infrastructure.adapter.ocr_failures import (
+    record_page_failure,
+)
+from src.document_extraction.infrastructure.adapter.resilience import (
+    call_with_retries,
+    mistral_circuit_breaker,
+    mistral_retry_policy,
+)
+from src.document_extraction.infrastructure.adapter.result_cache import (
+    ResultCache,
+    ocr_cache_key,
+    open_result_cache,
+)
+from src.document_extraction.infrastructure.config import (
+    OCR_CACHE_MAX_MB,
+    OCR_CACHE_PATH,
+    OCR_CONCURRENCY,
+    OCR_MODEL,
+    OCR_PAGES_PER_REQUEST,
+    OCR_TIMEOUT_SECONDS,
+    PICTURE_MODEL,
+    PICTURE_PROMPT,
+)
+from src.document_extraction.infrastructure.converter_pool import options_fingerprint
+from src.document_extraction.infrastructure.pipeline_option import (
+    create_picture_description_options,
+)
+
+
+_log = logging.getLogger(__name__)
+
+_IMAGE_REF = re.compile(r"!\[[^\]]*\]\((?P<ref>[^)\s]+)\)")
+
+
+@dataclass
+class _OcrPage:
+    markdown: str
+    images: Dict[str, Image.Image] = field(default_factory=dict)
+
+
+def _decode_image(image_base64: Optional[str]) -> Optional[Image.Image]:
+    if not image_base64:
+        return None
+    payload = image_base64.split(",", 1)[1] if image_base64.startswith("data:") else image_base64
+    try:
+        image = Image.open(io.BytesIO(base64.b64decode(payload)))
+        image.load()
+    except Exception:
+        _log.debug("Unable to decode OCR image", exc_info=True)
+        return None
+    return image
+
+
+def merge_picture_descriptions(markdown: str, descriptions: Dict[str, str]) -> str:
+    """Insert `<!-- image description: ... -->` after each described image reference."""
+
+    def _replace(match: "re.Match[str]") -> str:
+        description = descriptions.get(match.group("ref"))
+        if not description:
+            return match.group(0)
+        return f"{match.group(0)}\n<!-- image description: {description} -->"
+
+    return _IMAGE_REF.sub(_replace, markdown)
+
+
+def is_fully_scanned(source: str, plan: OcrPagePlan) -> bool:
+    """Whether `source` may bypass Docling: every page needs OCR and none has text.
+
+    Re-checks the text layer so a document with any usable text keeps it.
+    """
+
+    if plan.ocr_all or not plan.fully_scanned:
+        return False
+    try:
+        text_pages = text_layer_pages(source)
+    except Exception:
+        _log.warning("Unable to probe the text layer of %s", source, exc_info=True)
+        return False
+    if text_pages:
+        _log.info(
+            "%s has a usable text layer on %d pages; not treating it as fully scanned",
+            source,
+            len(text_pages),
+        )
+        return False
+    return True
+
+
+class ScannedPdfExtractor:
+    """Build document markdown from Mistral OCR pages, without Docling models."""
+
+    def __init__(self, mistral_key: str) -> None:
+        self.client = Mistral(api_key=mistral_key)
+        self.model = OCR_MODEL
+        self._timeout_ms = int(OCR_TIMEOUT_SECONDS * 1000) if OCR_TIMEOUT_SECONDS else None
+        self._cache: Optional[ResultCache] = None
+        try:
+            self._cache = open_result_cache(OCR_CACHE_PATH, max_mb=OCR_CACHE_MAX_MB)
+        except Exception:  # pragma: no cover - OCR still works without the cache
+            _log.warning("Unable to open OCR cache at %s", OCR_CACHE_PATH, exc_info=True)
+        self._pictures = MistralPictureDescriptionModel(
+            enabled=True,
+            enable_remote_services=True,
+            artifacts_path=None,
+            options=create_picture_description_options(mistral_key),
+            accelerator_options=AcceleratorOptions(),
+        )
+        # Cached pages already carry their picture descriptions, so the key
+        # also covers the picture model and prompt.
+        prompt_digest = hashlib.sha256(PICTURE_PROMPT.encode("utf-8")).hexdigest()[:16]
+        self._page_kind = f"pdf-page-md:{PICTURE_MODEL}:{prompt_digest}"
+
+    def _ocr_slice(self, pdf_bytes: bytes, *, with_images: bool) -> models.OCRResponse:
+        return call_with_retries(
+            lambda: self.client.ocr.process(
+                model=self.model,
+                document={"type": "document_url", "document_url": pdf_data_url(pdf_bytes)},
+                include_image_base64=with_images,
+                timeout_ms=self._timeout_ms,
+            ),
+            policy=mistral_retry_policy,
+            breaker=mistral_circuit_breaker,
+        )
+
+    def _cached_pages(
+        self, pdf_bytes: bytes, page_nos: List[int], *, page_kind: str
+    ) -> Tuple[Dict[int, str], Dict[int, str]]:
+        """Return ({page_no: cache key}, {page_no: cached markdown})."""
+
+        if self._cache is None:
+            return {}, {}
+        keys = {
+            page_no: ocr_cache_key(self.model, page_kind, digest)
+            for page_no, digest in pdf_page_digests(pdf_bytes, page_nos).items()
+        }
+        hits = self._cache.get_many(list(keys.values()))
+        cached = {page_no: hits[key] for page_no, key in keys.items() if key in hits}
+        mistral_cost_tracker.record_ocr_cache(
+            self.model, hits=len(cached), misses=len(page_nos) - len(cached)
+        )
+        return keys, cached
+
+    def _run_ocr(
+        self, source: str, pdf_bytes: bytes, page_nos: List[int], *, with_images: bool
+    ) -> Dict[int, _OcrPage]:
+        pages: Dict[int, _OcrPage] = {}
+        if not page_nos:
+            return pages
+        slices = build_pdf_slices(pdf_bytes, page_nos, pages_per_request=OCR_PAGES_PER_REQUEST)
+        with ThreadPoolExecutor(max_workers=max(1, OCR_CONCURRENCY)) as executor:
+            futures = [
+                (slice_pages, executor.submit(self._ocr_slice, data, with_images=with_images))
+                for slice_pages, data in slices
+            ]
+            for slice_pages, future in futures:
+                try:
+                    resp = future.result()
+                except Exception as exc:  # pragma: no cover - surface SDK failures without crashing pipeline
+                    _log.warning(
+                        "Mistral OCR failed for pages %s-%s: %s",
+                        slice_pages[0],
+                        slice_pages[-1],
+                        exc,
+                    )
+                    for page_no in slice_pages:
+                        record_page_failure(source, page_no, exc)
+                    continue
+
+                usage_info = getattr(resp, "usage_info", None)
+                mistral_cost_tracker.record_ocr(
+                    self.model, getattr(usage_info, "pages_processed", None)
+                )
+                for ocr_page in resp.pages or []:
+                    if not 0 <= ocr_page.index < len(slice_pages):
+                        continue
+                    images = {}
+                    for ocr_image in ocr_page.images or []:
+                        image = _decode_image(getattr(ocr_image, "image_base64", None))
+                        if image is not None:
+                            images[ocr_image.id] = image
+                    pages[slice_pages[ocr_page.index]] = _OcrPage(
+                        markdown=ocr_page.markdown or "", images=images
+                    )
+        return pages
+
+    def _describe(self, pages: Dict[int, _OcrPage]) -> Dict[int, str]:
+        """Return the markdown of each page with picture descriptions merged in."""
+
+        refs: List[Tuple[int, str]] = []
+        images: List[Image.Image] = []
+        for page_no, page in pages.items():
+            for image_id, image in page.images.items():
+                refs.append((page_no, image_id))
+                images.append(image)
+
+        # One call for the whole document so repeated pictures are described once.
+        descriptions: Dict[int, Dict[str, str]] = {}
+        for (page_no, image_id), text in zip(refs, self._pictures.describe_images(images)):
+            if text:
+                descriptions.setdefault(page_no, {})[image_id] = text
+
+        return {
+            page_no: merge_picture_descriptions(page.markdown, descriptions.get(page_no, {}))
+            for page_no, page in pages.items()
+        }
+
+    def extract(self, source: str, *, page_count: int, describe_pictures: bool = True) -> str:
+        """Return the document markdown; `describe_pictures=False` skips image descriptions."""
+
+        pdf_bytes = Path(source).read_bytes()
+        page_nos = list(range(page_count))
+
+        page_kind = self._page_kind if describe_pictures else "pdf-page-md"
+        keys, markdown = self._cached_pages(pdf_bytes, page_nos, page_kind=page_kind)
+        pages = self._run_ocr(
+            source,
+            pdf_bytes,
+            [no for no in page_nos if no not in markdown],
+            with_images=describe_pictures,
+        )
+        if describe_pictures:
+            fresh = self._describe(pages)
+        else:
+            fresh = {page_no: page.markdown for page_no, page in pages.items()}
+        if self._cache is not None and fresh:
+            self._cache.put_many(
+                {keys[page_no]: text for page_no, text in fresh.items() if page_no in keys}
+            )
+        markdown.update(fresh)
+
+        return "\n\n".join(
+            markdown[page_no].strip() for page_no in page_nos if markdown.get(page_no, "").strip()
+        )
+
+
+_extractors: Dict[str, ScannedPdfExtractor] = {}
+_extractors_lock = Lock()
+
+
+def get_scanned_extractor(mistral_key: str) -> ScannedPdfExtractor:
+    """Return the process-wide extractor for the current options."""
+
+    key = options_fingerprint(mistral_key)
+    with _extractors_lock:
+        extractor = _extractors.get(key)
+        if extractor is None:
+            extractor = ScannedPdfExtractor(mistral_key)
+            _extractors[key] = extractor
+        return extractor
+
+
+__all__ = [
+    "ScannedPdfExtractor",
+    "get_scanned_extractor",
+    "is_fully_scanned",
+    "merge_picture_descriptions",
+]
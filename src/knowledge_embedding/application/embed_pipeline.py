@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 from src.document_chunking.domain.models import DocumentChunk
 from src.knowledge_embedding.domain.models import ChunkEmbeddingRecord
@@ -14,6 +14,11 @@ from src.knowledge_embedding.domain.services import (
 from src.cost_management.infrastructure.openai_cost_tracker import (
     openai_cost_tracker,
 )
+from src.knowledge_embedding.infrastructure.embedding_cache import (
+    CachedEmbedder,
+    RunEmbeddingStore,
+    open_embedding_cache,
+)
 from src.knowledge_embedding.infrastructure.openai_client import OpenAIEmbedder
 from src.shared.config import EmbeddingSettings
 
@@ -47,8 +52,15 @@ def embed_chunks(
     chunks: Iterable[Any],
     *,
     settings: EmbeddingSettings,
+    embedding_store: Optional[RunEmbeddingStore] = None,
+    workspace_id: str = "",
 ) -> List[Dict[str, Any]]:
-    """Attach embeddings to document chunks and return persistence-ready rows."""
+    """Attach embeddings to document chunks and return persistence-ready rows.
+
+    When `embedding_store` is the store the chunking stage wrote to, chunks whose
+    text matches an already-embedded sentence window reuse that vector. Row ids
+    are derived from `workspace_id`, the document name and the chunk content.
+    """
 
     chunk_list = [_coerce_chunk(chunk) for chunk in chunks]
     if not chunk_list:
@@ -57,10 +69,17 @@ def embed_chunks(
     openai_cost_tracker.reset()
     openai_cost_tracker.configure_from_environment()
 
-    inputs = prepare_embedding_inputs(chunk_list)
+    inputs = prepare_embedding_inputs(chunk_list, workspace_id=workspace_id)
     texts = [item.text for item in inputs]
 
     embedder = OpenAIEmbedder(settings)
+    cache = open_embedding_cache(settings)
+    if cache is not None:
+        cache.reset_stats()
+    if cache is not None or embedding_store is not None:
+        embedder = CachedEmbedder(
+            embedder, cache, run_store=embedding_store, stage="embedding"
+        )
     dense_vectors = [vec.tolist() for vec in embedder.embed_batch(texts)]
     now_ms = int(time.time() * 1000)
     records: List[ChunkEmbeddingRecord] = finalize_embeddings(
@@ -70,6 +89,10 @@ def embed_chunks(
     )
 
     print(openai_cost_tracker.format_report())
+    if embedding_store is not None:
+        print(embedding_store.format_report())
+    if cache is not None:
+        print(cache.format_report())
     return [record.to_dict() for record in records]
 
 
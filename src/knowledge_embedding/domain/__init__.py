@@ -1,11 +1,28 @@
 """Domain layer for knowledge_embedding."""
 
+from .batching import (
+    BatchLimits,
+    EmbeddingBatch,
+    estimate_tokens,
+    merge_piece_vectors,
+    plan_embedding_batches,
+)
 from .models import ChunkEmbeddingInput, ChunkEmbeddingRecord
-from .services import finalize_embeddings, prepare_embedding_inputs
+from .services import (
+    deterministic_chunk_id,
+    finalize_embeddings,
+    prepare_embedding_inputs,
+)
 
 __all__ = [
+    "BatchLimits",
+    "EmbeddingBatch",
     "ChunkEmbeddingInput",
     "ChunkEmbeddingRecord",
+    "deterministic_chunk_id",
+    "estimate_tokens",
     "finalize_embeddings",
+    "merge_piece_vectors",
+    "plan_embedding_batches",
     "prepare_embedding_inputs",
 ]
@@ -0,0 +1,215 @@
+"""Token-budgeted batch planning for embedding requests."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+OVERSIZE_POLICIES = ("split", "truncate", "error")
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> Optional[Any]:
+    """Return the cl100k tokenizer used by OpenAI embedding models, if installed."""
+
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Not installed, or the BPE file cannot be fetched: estimate instead.
+        return None
+
+
+def _estimate_by_script(text: str) -> int:
+    ascii_chars = sum(1 for char in text if char.isascii())
+    # Latin text averages about four characters per token, so a third
+    # overestimates it; Thai and other non-ASCII characters often take more
+    # than one cl100k token each, so they count as two.
+    return math.ceil(ascii_chars / 3) + 2 * (len(text) - ascii_chars)
+
+
+def estimate_tokens(text: str) -> int:
+    """Token count used to keep requests under provider limits.
+
+    Counts with the real tokenizer (tiktoken's cl100k_base) when it is
+    available; otherwise uses a per-script estimate that does not undercount
+    Thai.
+    """
+
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is not None:
+        return max(1, len(encoding.encode(text, disallowed_special=())))
+    return max(1, _estimate_by_script(text))
+
+
+@dataclass(frozen=True)
+class BatchLimits:
+    """Per-request limits enforced when packing embedding inputs."""
+
+    max_items: int
+    max_tokens: int
+    max_input_tokens: int
+    oversize_policy: str = "split"
+
+    def __post_init__(self) -> None:
+        if self.max_items < 1:
+            raise ValueError("max_items must be >= 1")
+        if self.max_input_tokens < 1:
+            raise ValueError("max_input_tokens must be >= 1")
+        if self.max_tokens < self.max_input_tokens:
+            raise ValueError("max_tokens must be >= max_input_tokens")
+        if self.oversize_policy not in OVERSIZE_POLICIES:
+            raise ValueError(
+                f"oversize_policy must be one of {', '.join(OVERSIZE_POLICIES)}"
+            )
+
+
+@dataclass
+class EmbeddingBatch:
+    """One provider request: the texts to send and the inputs they belong to."""
+
+    texts: List[str] = field(default_factory=list)
+    owners: List[int] = field(default_factory=list)
+    token_counts: List[int] = field(default_factory=list)
+
+    @property
+    def estimated_tokens(self) -> int:
+        return sum(self.token_counts)
+
+    def add(self, text: str, owner: int, tokens: int) -> None:
+        self.texts.append(text)
+        self.owners.append(owner)
+        self.token_counts.append(tokens)
+
+
+def _split_oversize(
+    text: str,
+    max_tokens: int,
+    estimate: Callable[[str], int],
+) -> List[str]:
+    pieces: List[str] = []
+    remaining = text
+    while remaining:
+        total = estimate(remaining)
+        if total <= max_tokens:
+            pieces.append(remaining)
+            break
+
+        cut = max(1, int(len(remaining) * max_tokens / total))
+        while cut > 1 and estimate(remaining[:cut]) > max_tokens:
+            cut = max(1, int(cut * 0.9))
+
+        # Prefer a whitespace boundary in the last fifth of the window.
+        boundary = remaining.rfind(" ", int(cut * 0.8), cut)
+        if boundary == -1:
+            boundary = remaining.rfind("\n", int(cut * 0.8), cut)
+        if boundary > 0:
+            cut = boundary + 1
+
+        piece = remaining[:cut].strip()
+        if piece:
+            pieces.append(piece)
+        remaining = remaining[cut:].lstrip()
+    return pieces
+
+
+def _fit_input(
+    text: str,
+    limits: BatchLimits,
+    estimate: Callable[[str], int],
+) -> List[str]:
+    if estimate(text) <= limits.max_input_tokens:
+        return [text]
+    if limits.oversize_policy == "error":
+        raise ValueError(
+            f"Embedding input of ~{estimate(text)} tokens exceeds the "
+            f"{limits.max_input_tokens}-token model limit"
+        )
+    pieces = _split_oversize(text, limits.max_input_tokens, estimate)
+    if limits.oversize_policy == "truncate":
+        return pieces[:1]
+    return pieces
+
+
+def plan_embedding_batches(
+    texts: Sequence[str],
+    limits: BatchLimits,
+    *,
+    estimate: Callable[[str], int] = estimate_tokens,
+) -> List[EmbeddingBatch]:
+    """Pack texts into requests capped by both item count and token budget.
+
+    Oversize inputs are split or truncated according to `limits.oversize_policy`;
+    each emitted piece remembers the index of the text it came from so callers can
+    reassemble one vector per input with `merge_piece_vectors`.
+    """
+
+    batches: List[EmbeddingBatch] = []
+    current = EmbeddingBatch()
+
+    for owner, text in enumerate(texts):
+        for piece in _fit_input(text, limits, estimate):
+            tokens = estimate(piece)
+            if current.texts and (
+                len(current.texts) >= limits.max_items
+                or current.estimated_tokens + tokens > limits.max_tokens
+            ):
+                batches.append(current)
+                current = EmbeddingBatch()
+            current.add(piece, owner, tokens)
+
+    if current.texts:
+        batches.append(current)
+    return batches
+
+
+def merge_piece_vectors(
+    batches: Sequence[EmbeddingBatch],
+    batch_vectors: Sequence[Sequence[np.ndarray]],
+    *,
+    input_count: int,
+) -> List[np.ndarray]:
+    """Collapse per-piece vectors back to one vector per original input.
+
+    Inputs that were split are represented by the token-weighted mean of their
+    pieces, re-normalized to unit length like the provider's own vectors.
+    """
+
+    collected: Dict[int, List[tuple[int, np.ndarray]]] = {}
+    for batch, vectors in zip(batches, batch_vectors):
+        if len(vectors) != len(batch.texts):
+            raise RuntimeError("Embedding count mismatch with planned batch")
+        for owner, tokens, vector in zip(batch.owners, batch.token_counts, vectors):
+            collected.setdefault(owner, []).append(
+                (max(tokens, 1), np.asarray(vector, dtype=np.float32))
+            )
+
+    out: List[np.ndarray] = []
+    for owner in range(input_count):
+        parts = collected.get(owner)
+        if not parts:
+            raise RuntimeError(f"No embedding produced for input {owner}")
+        if len(parts) == 1:
+            out.append(parts[0][1])
+            continue
+        merged = np.sum([vec * weight for weight, vec in parts], axis=0)
+        norm = float(np.linalg.norm(merged))
+        out.append((merged / norm if norm > 0 else merged).astype(np.float32))
+    return out
+
+
+__all__ = [
+    "BatchLimits",
+    "EmbeddingBatch",
+    "OVERSIZE_POLICIES",
+    "estimate_tokens",
+    "merge_piece_vectors",
+    "plan_embedding_batches",
+]
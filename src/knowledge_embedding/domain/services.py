@@ -4,18 +4,41 @@ from __future__ import annotations
 
 import time
 import uuid
-from typing import Iterable, List
+from typing import Dict, Iterable, List
 
 from src.document_chunking.domain.models import DocumentChunk
+from src.document_chunking.domain.services import (
+    chunk_content_key,
+    normalize_chunk_text,
+)
 
 from .models import ChunkEmbeddingInput, ChunkEmbeddingRecord
 
 
-def prepare_embedding_inputs(chunks: Iterable[DocumentChunk]) -> List[ChunkEmbeddingInput]:
-    """Normalize document chunks into embedding inputs."""
+_CHUNK_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "knowledge-pipeline-poc/chunk-id")
+
+
+def deterministic_chunk_id(workspace_id: str, doc_name: str, chunk_key: str) -> str:
+    """Return the UUID primary key of a chunk from its workspace, document and content key."""
+
+    name = "\x1f".join((workspace_id or "", doc_name, chunk_key))
+    return str(uuid.uuid5(_CHUNK_ID_NAMESPACE, name))
+
+
+def prepare_embedding_inputs(
+    chunks: Iterable[DocumentChunk],
+    *,
+    workspace_id: str = "",
+) -> List[ChunkEmbeddingInput]:
+    """Normalize document chunks into embedding inputs.
+
+    Chunk ids are derived from (workspace, doc_name, chunk content), so the same
+    chunk of the same document always maps to the same primary key.
+    """
 
     now_ms = int(time.time() * 1000)
     prepared: List[ChunkEmbeddingInput] = []
+    occurrences: Dict[str, int] = {}
 
     for chunk in chunks:
         record = chunk.to_record()
@@ -47,7 +70,17 @@ def prepare_embedding_inputs(chunks: Iterable[DocumentChunk]) -> List[ChunkEmbed
         metadata.setdefault("doc_hash", doc_hash)
         metadata.setdefault("doc_name", doc_name)
 
-        chunk_id = record.get("id") or str(uuid.uuid4())
+        chunk_key = metadata.get("chunk_key")
+        if not chunk_key:
+            normalized = normalize_chunk_text(text)
+            occurrence = occurrences.get(normalized, 0)
+            occurrences[normalized] = occurrence + 1
+            chunk_key = chunk_content_key(text, occurrence)
+            metadata["chunk_key"] = chunk_key
+
+        chunk_id = record.get("id") or deterministic_chunk_id(
+            workspace_id, str(doc_name), str(chunk_key)
+        )
         created_at = int(record.get("created_at") or now_ms)
 
         prepared.append(
@@ -94,4 +127,8 @@ def finalize_embeddings(
     return records
 
 
-__all__ = ["prepare_embedding_inputs", "finalize_embeddings"]
+__all__ = [
+    "deterministic_chunk_id",
+    "finalize_embeddings",
+    "prepare_embedding_inputs",
+]
@@ -1,11 +1,21 @@
 """Infrastructure adapters for knowledge_embedding."""
 
+from .embedding_cache import (
+    CachedEmbedder,
+    EmbeddingCache,
+    RunEmbeddingStore,
+    open_embedding_cache,
+)
 from .gemini_client import GeminiEmbedder, GeminiEmbeddings
 from .openai_client import OpenAIEmbedder, OpenAIEmbeddings
 
 __all__ = [
+    "CachedEmbedder",
+    "EmbeddingCache",
     "GeminiEmbedder",
     "GeminiEmbeddings",
     "OpenAIEmbedder",
     "OpenAIEmbeddings",
+    "RunEmbeddingStore",
+    "open_embedding_cache",
 ]
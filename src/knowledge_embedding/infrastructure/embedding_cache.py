@@ -0,0 +1,258 @@
+"""Persistent and in-run embedding caches in front of the embedding clients."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Protocol, Sequence
+
+import numpy as np
+
+from src.knowledge_embedding.domain.batching import (
+    BatchLimits,
+    estimate_tokens,
+    plan_embedding_batches,
+)
+from src.shared.config import EmbeddingSettings
+from src.shared.sqlite_cache import SqliteLruCache
+
+_DISABLED_PATHS = {"off", "none", "disabled", "false", "0"}
+_BYTES_PER_MB = 1024 * 1024
+
+
+class BatchEmbedder(Protocol):
+    provider: str
+    model: str
+    dimensions: Optional[int]
+    limits: BatchLimits
+
+    def embed_batch(self, texts: List[str]) -> List[np.ndarray]: ...
+
+
+def embedding_cache_key(
+    provider: str, model: str, dimensions: Optional[int], text: str
+) -> str:
+    """Return the cache key for `text` under a given provider/model/dimension."""
+
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{provider}:{model}:{dimensions or 0}:{digest}"
+
+
+class EmbeddingCache:
+    """Store embeddings as raw float32 blobs in a size-bounded SQLite LRU cache."""
+
+    def __init__(self, path: str | Path, *, max_bytes: int) -> None:
+        self._store = SqliteLruCache(path, max_bytes=max_bytes)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        return {
+            key: np.frombuffer(blob, dtype=np.float32).copy()
+            for key, blob in self._store.get_many(keys).items()
+        }
+
+    def put_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        self._store.put_many(
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in vectors.items()
+        )
+
+    def stats(self) -> Dict[str, float]:
+        return self._store.stats()
+
+    def reset_stats(self) -> None:
+        self._store.reset_stats()
+
+    def format_report(self) -> str:
+        stats = self.stats()
+        return (
+            "Embedding cache: "
+            f"{stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.1%} hit rate), {stats['evictions']} evicted, "
+            f"{stats['stored_bytes'] / _BYTES_PER_MB:.1f} MB stored"
+        )
+
+
+class RunEmbeddingStore:
+    """In-memory vectors shared by every embedding stage of one pipeline run.
+
+    The semantic chunker writes each sentence window it embeds; the final
+    embedding stage then reuses any chunk whose text matches a window exactly.
+    Reuse is tracked per stage; the first stage to look up vectors has no
+    earlier stage to reuse from, so only later stages are reported.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._stages: Dict[str, Dict[str, int]] = {}
+
+    def _stage(self, stage: str) -> Dict[str, int]:
+        return self._stages.setdefault(
+            stage, {"lookups": 0, "reused": 0, "reused_tokens_estimate": 0, "requests_avoided": 0}
+        )
+
+    def get_many(
+        self, keys: Sequence[str], texts: Sequence[str], *, stage: str = ""
+    ) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            counts = self._stage(stage)
+            for key, text in zip(keys, texts):
+                counts["lookups"] += 1
+                vector = self._vectors.get(key)
+                if vector is None:
+                    continue
+                found[key] = vector
+                counts["reused"] += 1
+                counts["reused_tokens_estimate"] += estimate_tokens(text)
+        return found
+
+    def record_requests_avoided(self, count: int, *, stage: str = "") -> None:
+        with self._lock:
+            self._stage(stage)["requests_avoided"] += count
+
+    def put_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            self._vectors.update(vectors)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._vectors)
+
+    def report(self) -> Dict[str, Dict[str, int]]:
+        """Return reuse counts for every stage after the first, by stage name."""
+
+        with self._lock:
+            later = list(self._stages.items())[1:]
+            return {stage: dict(counts) for stage, counts in later}
+
+    def format_report(self) -> str:
+        stages = self.report()
+        with self._lock:
+            stored = len(self._vectors)
+        if not stages:
+            return f"In-run embedding reuse: no later stage yet ({stored} vectors held)"
+        lines = [
+            f"In-run embedding reuse ({stage or 'default'}): "
+            f"{counts['reused']} of {counts['lookups']} inputs served from earlier stages, "
+            f"{counts['requests_avoided']} requests and "
+            f"~{counts['reused_tokens_estimate']} tokens not sent"
+            for stage, counts in stages.items()
+        ]
+        lines[-1] += f" ({stored} vectors held)"
+        return "\n".join(lines)
+
+
+class CachedEmbedder:
+    """Wrap an embedder so only texts unseen by the run store and cache reach the API.
+
+    Lookups go to the in-run store first, then to the persistent cache; vectors
+    computed or loaded here are written back to both layers.
+    """
+
+    def __init__(
+        self,
+        embedder: BatchEmbedder,
+        cache: Optional[EmbeddingCache] = None,
+        *,
+        run_store: Optional[RunEmbeddingStore] = None,
+        stage: str = "",
+    ) -> None:
+        self._embedder = embedder
+        self._cache = cache
+        self._run_store = run_store
+        self._stage = stage
+        self.provider = embedder.provider
+        self.model = embedder.model
+        self.dimensions = embedder.dimensions
+
+    def embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+        if not texts:
+            return []
+
+        keys = [
+            embedding_cache_key(self.provider, self.model, self.dimensions, text)
+            for text in texts
+        ]
+        found: Dict[str, np.ndarray] = {}
+        if self._run_store is not None:
+            found.update(self._run_store.get_many(keys, texts, stage=self._stage))
+        reused = dict(found)
+
+        remaining = [key for key in dict.fromkeys(keys) if key not in found]
+        loaded: Dict[str, np.ndarray] = {}
+        if self._cache is not None and remaining:
+            loaded = self._cache.get_many(remaining)
+            found.update(loaded)
+
+        # Deduplicate misses so repeated texts in one call are embedded once.
+        pending: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in pending:
+                pending[key] = text
+
+        if reused:
+            self._record_requests_avoided(keys, texts, reused, pending)
+
+        computed: Dict[str, np.ndarray] = {}
+        if pending:
+            fresh = self._embedder.embed_batch(list(pending.values()))
+            computed = dict(zip(pending.keys(), fresh))
+            if self._cache is not None:
+                self._cache.put_many(computed)
+            found.update(computed)
+
+        if self._run_store is not None and (loaded or computed):
+            self._run_store.put_many({**loaded, **computed})
+
+        return [found[key] for key in keys]
+
+    def _record_requests_avoided(
+        self,
+        keys: Sequence[str],
+        texts: Sequence[str],
+        reused: Dict[str, np.ndarray],
+        pending: Dict[str, str],
+    ) -> None:
+        """Count the provider requests the reused inputs would have added."""
+
+        served = {key: text for key, text in zip(keys, texts) if key in reused}
+        sent = list(pending.values())
+        limits = self._embedder.limits
+        avoided = len(plan_embedding_batches(sent + list(served.values()), limits)) - len(
+            plan_embedding_batches(sent, limits)
+        )
+        self._run_store.record_requests_avoided(max(0, avoided), stage=self._stage)
+
+
+_caches: Dict[str, EmbeddingCache] = {}
+_caches_lock = Lock()
+
+
+def open_embedding_cache(settings: EmbeddingSettings) -> Optional[EmbeddingCache]:
+    """Return the process-wide cache for `settings.cache_path`, or None if disabled."""
+
+    raw_path = (settings.cache_path or "").strip()
+    if not raw_path or raw_path.lower() in _DISABLED_PATHS:
+        return None
+
+    path = str(Path(raw_path).expanduser().resolve())
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = EmbeddingCache(
+                path, max_bytes=max(0, settings.cache_max_mb) * _BYTES_PER_MB
+            )
+            _caches[path] = cache
+        return cache
+
+
+__all__ = [
+    "BatchEmbedder",
+    "CachedEmbedder",
+    "EmbeddingCache",
+    "RunEmbeddingStore",
+    "embedding_cache_key",
+    "open_embedding_cache",
+]
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import logging
 import os
+import random
+import time
 from typing import List
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 import numpy as np
 from langchain_core.embeddings import Embeddings
 
@@ -13,19 +17,60 @@ from src.cost_management.infrastructure.gemini_cost_tracker import (
     EmbeddingPricing,
     gemini_cost_tracker,
 )
+from src.knowledge_embedding.domain.batching import (
+    BatchLimits,
+    EmbeddingBatch,
+    merge_piece_vectors,
+    plan_embedding_batches,
+)
+from src.knowledge_embedding.infrastructure.embedding_cache import BatchEmbedder
+from src.knowledge_embedding.infrastructure.rate_governor import (
+    dispatch_ordered,
+    get_rate_governor,
+)
 from src.shared.config import EmbeddingSettings
 
+_log = logging.getLogger(__name__)
+
 # Quiet noisy gRPC warnings about ALTS credentials when running outside GCP.
 os.environ.setdefault("GRPC_VERBOSITY", "NONE")
 os.environ.setdefault("GRPC_LOG_SEVERITY", "ERROR")
 os.environ.setdefault("ABSL_LOGGING_STDERR_THRESHOLD", "3")
 
+# batchEmbedContents accepts at most 100 requests of 2,048 tokens each; keep some
+# headroom on the token cap because planning relies on estimated counts.
+_MAX_INPUTS_PER_REQUEST = 100
+_MAX_INPUT_TOKENS = 2_000
+
 
 class GeminiEmbedder:
+    provider = "gemini"
+
     def __init__(self, settings: EmbeddingSettings):
         genai.configure(api_key=settings.ensure_api_key())
         self.model = settings.model
-        self.batch_size = settings.batch_size
+        self.dimensions = settings.dimensions
+        self.batch_size = min(max(1, settings.batch_size), _MAX_INPUTS_PER_REQUEST)
+        max_input_tokens = min(
+            settings.max_input_tokens or _MAX_INPUT_TOKENS, _MAX_INPUT_TOKENS
+        )
+        self.limits = BatchLimits(
+            max_items=self.batch_size,
+            max_tokens=max(
+                settings.max_tokens_per_request or self.batch_size * max_input_tokens,
+                max_input_tokens,
+            ),
+            max_input_tokens=max_input_tokens,
+            oversize_policy=settings.oversize_policy,
+        )
+        self.concurrency = max(1, settings.concurrency)
+        self.max_retries = max(0, settings.max_retries)
+        self.governor = get_rate_governor(
+            "gemini",
+            self.model,
+            requests_per_minute=settings.requests_per_minute,
+            tokens_per_minute=settings.tokens_per_minute,
+        )
         self.cost_tracker = gemini_cost_tracker
 
         override_price = getattr(settings, "embed_price_per_million_tokens", None)
@@ -39,27 +84,61 @@ class GeminiEmbedder:
         if not texts:
             return []
 
-        out: List[np.ndarray] = []
-        batch_size = self.batch_size
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            for item in batch:
-                resp = genai.embed_content(model=self.model, content=item)
-                embedding = resp["embedding"]
-                out.append(np.array(embedding, dtype=np.float32))
-
-                self.cost_tracker.record_embedding(
-                    self.model,
-                    response_usage=resp,
-                    text=item,
+        batches = plan_embedding_batches(texts, self.limits)
+        batch_vectors = dispatch_ordered(
+            batches, self._embed_request, concurrency=self.concurrency
+        )
+        return merge_piece_vectors(batches, batch_vectors, input_count=len(texts))
+
+    def _embed_request(self, batch: EmbeddingBatch) -> List[np.ndarray]:
+        attempt = 0
+        while True:
+            self.governor.acquire(batch.estimated_tokens)
+            try:
+                resp = genai.embed_content(
+                    model=self.model,
+                    content=batch.texts,
+                    output_dimensionality=self.dimensions,
                 )
-        return out
+            except google_exceptions.ResourceExhausted:
+                if attempt >= self.max_retries:
+                    raise
+                self.governor.record_rate_limited()
+            except (
+                google_exceptions.ServiceUnavailable,
+                google_exceptions.InternalServerError,
+                google_exceptions.DeadlineExceeded,
+            ) as exc:
+                if attempt >= self.max_retries:
+                    raise
+                delay = min(2**attempt, 30) * random.uniform(0.5, 1.0)
+                _log.warning("Gemini embeddings request failed (%s); retrying in %.1fs", exc, delay)
+                time.sleep(delay)
+            else:
+                break
+            attempt += 1
+
+        self.governor.record_success()
+        embeddings = resp["embedding"]
+        if len(embeddings) != len(batch.texts):
+            raise RuntimeError(
+                f"Gemini embeddings response returned {len(embeddings)} vectors "
+                f"for {len(batch.texts)} inputs"
+            )
+
+        # Batch responses carry no usage metadata; the tracker estimates from text.
+        self.cost_tracker.record_embedding(
+            self.model,
+            response_usage=resp,
+            text="\n".join(batch.texts),
+        )
+        return [np.array(embedding, dtype=np.float32) for embedding in embeddings]
 
 
 class GeminiEmbeddings(Embeddings):
     """LangChain-compatible embedding wrapper around `GeminiEmbedder`."""
 
-    def __init__(self, embedder: GeminiEmbedder):
+    def __init__(self, embedder: BatchEmbedder):
         self._embedder = embedder
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
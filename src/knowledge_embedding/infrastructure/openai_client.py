@@ -2,24 +2,95 @@
 
 from __future__ import annotations
 
-from typing import List
+import logging
+import random
+import time
+from typing import Any, List, Optional
 
 import numpy as np
 from langchain_core.embeddings import Embeddings
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 
 from src.cost_management.infrastructure.openai_cost_tracker import (
     EmbeddingPricing,
     openai_cost_tracker,
 )
+from src.knowledge_embedding.domain.batching import (
+    BatchLimits,
+    EmbeddingBatch,
+    merge_piece_vectors,
+    plan_embedding_batches,
+)
+from src.knowledge_embedding.infrastructure.embedding_cache import BatchEmbedder
+from src.knowledge_embedding.infrastructure.rate_governor import (
+    dispatch_ordered,
+    get_rate_governor,
+    parse_reset_duration,
+)
 from src.shared.config import EmbeddingSettings
 
+_log = logging.getLogger(__name__)
+
+# Documented per-request limits for the embeddings endpoint, with a little
+# headroom on the token caps because planning relies on estimated counts.
+_MAX_INPUTS_PER_REQUEST = 2048
+_MAX_TOKENS_PER_REQUEST = 280_000
+_MAX_INPUT_TOKENS = 8_000
+
+
+def _usage_token_count(usage: Any) -> Optional[int]:
+    if usage is None:
+        return None
+    if isinstance(usage, dict):
+        return (
+            usage.get("total_tokens")
+            or usage.get("prompt_tokens")
+            or usage.get("input_tokens")
+        )
+    return (
+        getattr(usage, "total_tokens", None)
+        or getattr(usage, "prompt_tokens", None)
+        or getattr(usage, "input_tokens", None)
+    )
+
 
 class OpenAIEmbedder:
+    provider = "openai"
+
     def __init__(self, settings: EmbeddingSettings):
-        self._client = OpenAI(api_key=settings.ensure_api_key())
+        # Retries are handled here so 429s feed the shared rate governor.
+        self._client = OpenAI(api_key=settings.ensure_api_key(), max_retries=0)
         self.model = settings.model
-        self.batch_size = max(1, settings.batch_size)
+        self.dimensions = settings.dimensions
+        self.batch_size = min(max(1, settings.batch_size), _MAX_INPUTS_PER_REQUEST)
+        max_input_tokens = min(
+            settings.max_input_tokens or _MAX_INPUT_TOKENS, _MAX_INPUT_TOKENS
+        )
+        self.limits = BatchLimits(
+            max_items=self.batch_size,
+            max_tokens=max(
+                min(
+                    settings.max_tokens_per_request or _MAX_TOKENS_PER_REQUEST,
+                    _MAX_TOKENS_PER_REQUEST,
+                ),
+                max_input_tokens,
+            ),
+            max_input_tokens=max_input_tokens,
+            oversize_policy=settings.oversize_policy,
+        )
+        self.concurrency = max(1, settings.concurrency)
+        self.max_retries = max(0, settings.max_retries)
+        self.governor = get_rate_governor(
+            "openai",
+            self.model,
+            requests_per_minute=settings.requests_per_minute,
+            tokens_per_minute=settings.tokens_per_minute,
+        )
         self.cost_tracker = openai_cost_tracker
 
         override_price = getattr(settings, "embed_price_per_million_tokens", None)
@@ -33,46 +104,70 @@ class OpenAIEmbedder:
         if not texts:
             return []
 
-        out: List[np.ndarray] = []
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i : i + self.batch_size]
-            for item in batch:
-                response = self._client.embeddings.create(
+        batches = plan_embedding_batches(texts, self.limits)
+        batch_vectors = dispatch_ordered(
+            batches, self._embed_request, concurrency=self.concurrency
+        )
+        return merge_piece_vectors(batches, batch_vectors, input_count=len(texts))
+
+    def _embed_request(self, batch: EmbeddingBatch) -> List[np.ndarray]:
+        attempt = 0
+        while True:
+            self.governor.acquire(batch.estimated_tokens)
+            try:
+                raw = self._client.embeddings.with_raw_response.create(
                     model=self.model,
-                    input=item,
+                    input=batch.texts,
+                    **({"dimensions": self.dimensions} if self.dimensions else {}),
                 )
-                embedding = response.data[0].embedding
-                out.append(np.array(embedding, dtype=np.float32))
-
-                usage = getattr(response, "usage", None)
-                token_count = None
-                if usage is not None:
-                    if isinstance(usage, dict):
-                        token_count = (
-                            usage.get("total_tokens")
-                            or usage.get("prompt_tokens")
-                            or usage.get("input_tokens")
-                        )
-                    else:
-                        token_count = (
-                            getattr(usage, "total_tokens", None)
-                            or getattr(usage, "prompt_tokens", None)
-                            or getattr(usage, "input_tokens", None)
-                        )
-
-                self.cost_tracker.record_embedding(
-                    self.model,
-                    response_usage=usage,
-                    token_count=token_count,
-                    text=item,
+            except RateLimitError as exc:
+                if attempt >= self.max_retries:
+                    raise
+                headers = getattr(exc.response, "headers", None)
+                self.governor.observe_headers(headers)
+                self.governor.record_rate_limited(
+                    parse_reset_duration((headers or {}).get("retry-after"))
                 )
-        return out
+            except (APIConnectionError, InternalServerError) as exc:
+                if attempt >= self.max_retries:
+                    raise
+                delay = min(2**attempt, 30) * random.uniform(0.5, 1.0)
+                _log.warning("OpenAI embeddings request failed (%s); retrying in %.1fs", exc, delay)
+                time.sleep(delay)
+            else:
+                break
+            attempt += 1
+
+        self.governor.observe_headers(raw.headers)
+        self.governor.record_success()
+        response = raw.parse()
+
+        # The API may return items out of order; realign them by `index`.
+        vectors: List[Optional[np.ndarray]] = [None] * len(batch.texts)
+        for item in response.data:
+            vectors[item.index] = np.array(item.embedding, dtype=np.float32)
+        if any(vec is None for vec in vectors):
+            raise RuntimeError(
+                f"OpenAI embeddings response returned {len(response.data)} vectors "
+                f"for {len(batch.texts)} inputs"
+            )
+
+        usage = getattr(response, "usage", None)
+        token_count = _usage_token_count(usage)
+        self.governor.settle(batch.estimated_tokens, token_count)
+        self.cost_tracker.record_embedding(
+            self.model,
+            response_usage=usage,
+            token_count=token_count,
+            text="\n".join(batch.texts),
+        )
+        return vectors  # type: ignore[return-value]
 
 
 class OpenAIEmbeddings(Embeddings):
     """LangChain-compatible embedding wrapper around `OpenAIEmbedder`."""
 
-    def __init__(self, embedder: OpenAIEmbedder):
+    def __init__(self, embedder: BatchEmbedder):
         self._embedder = embedder
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
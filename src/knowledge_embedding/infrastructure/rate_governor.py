@@ -0,0 +1,265 @@
+"""Token-bucket rate governor and ordered dispatcher for embedding requests."""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_SECONDS_PER_MINUTE = 60.0
+_MAX_BACKOFF_SECONDS = 60.0
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """Parse OpenAI-style reset hints such as `20ms`, `1s` or `6m0s` into seconds."""
+
+    if value is None:
+        return None
+    text = str(value).strip().lower()
+    if not text:
+        return None
+    try:
+        return max(float(text), 0.0)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(text)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: float, now: float) -> None:
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self.rate = float(per_minute) / _SECONDS_PER_MINUTE
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        elapsed = max(now - self.updated, 0.0)
+        self.level = min(self.capacity, self.level + elapsed * self.rate)
+        self.updated = now
+
+    def resize(self, per_minute: float, now: float) -> None:
+        self.refill(now)
+        self.capacity = float(per_minute)
+        self.level = min(self.level, self.capacity)
+        self.rate = float(per_minute) / _SECONDS_PER_MINUTE
+
+    def wait_for(self, amount: float) -> float:
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+
+class RateGovernor:
+    """Keep request and token throughput under per-minute provider limits.
+
+    Two token buckets (requests and tokens) gate every call. Rate-limit response
+    headers tighten the buckets when the provider reports less headroom than we
+    track locally, and 429 responses pause all callers with a growing, jittered
+    backoff that decays again after successful calls.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = Lock()
+        now = clock()
+        self._requests = (
+            _TokenBucket(requests_per_minute, now) if requests_per_minute > 0 else None
+        )
+        self._tokens = (
+            _TokenBucket(tokens_per_minute, now) if tokens_per_minute > 0 else None
+        )
+        self._paused_until = 0.0
+        self._backoff = 0.0
+
+    def update_limits(self, *, requests_per_minute: int, tokens_per_minute: int) -> None:
+        """Apply new per-minute limits; a limit of 0 or less disables that bucket."""
+
+        with self._lock:
+            now = self._clock()
+            self._requests = self._resized(self._requests, requests_per_minute, now)
+            self._tokens = self._resized(self._tokens, tokens_per_minute, now)
+
+    @staticmethod
+    def _resized(
+        bucket: Optional[_TokenBucket], per_minute: int, now: float
+    ) -> Optional[_TokenBucket]:
+        if per_minute <= 0:
+            return None
+        if bucket is None:
+            return _TokenBucket(per_minute, now)
+        if bucket.capacity != per_minute:
+            bucket.resize(per_minute, now)
+        return bucket
+
+    # --- admission --------------------------------------------------------------------
+    def acquire(self, tokens: int) -> None:
+        """Block until one request carrying `tokens` tokens may be sent."""
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                wait = max(self._paused_until - now, 0.0)
+                if wait <= 0:
+                    wait = self._reserve(now, tokens)
+                if wait <= 0:
+                    return
+            self._sleep(wait)
+
+    def _reserve(self, now: float, tokens: int) -> float:
+        wait = 0.0
+        if self._requests is not None:
+            self._requests.refill(now)
+            wait = max(wait, self._requests.wait_for(1))
+        token_cost = 0.0
+        if self._tokens is not None:
+            self._tokens.refill(now)
+            # A request larger than the whole bucket can still go once it is full.
+            token_cost = min(float(tokens), self._tokens.capacity)
+            wait = max(wait, self._tokens.wait_for(token_cost))
+        if wait > 0:
+            return wait
+        if self._requests is not None:
+            self._requests.level -= 1
+        if self._tokens is not None:
+            self._tokens.level -= token_cost
+        return 0.0
+
+    def settle(self, reserved_tokens: int, used_tokens: Optional[int]) -> None:
+        """Refund the gap between the estimate reserved and the tokens billed."""
+
+        if self._tokens is None or not used_tokens or used_tokens >= reserved_tokens:
+            return
+        with self._lock:
+            self._tokens.level = min(
+                self._tokens.capacity,
+                self._tokens.level + (reserved_tokens - used_tokens),
+            )
+
+    # --- feedback ---------------------------------------------------------------------
+    def observe_headers(self, headers: Optional[Mapping[str, str]]) -> None:
+        """Align local buckets with `x-ratelimit-*` headers from the provider."""
+
+        if not headers:
+            return
+        lowered = {str(key).lower(): value for key, value in headers.items()}
+        with self._lock:
+            now = self._clock()
+            for bucket, kind in ((self._requests, "requests"), (self._tokens, "tokens")):
+                remaining = lowered.get(f"x-ratelimit-remaining-{kind}")
+                if remaining is None:
+                    continue
+                try:
+                    remaining_value = float(remaining)
+                except (TypeError, ValueError):
+                    continue
+                if bucket is not None:
+                    bucket.refill(now)
+                    bucket.level = min(bucket.level, remaining_value)
+                if remaining_value <= 0:
+                    reset = parse_reset_duration(lowered.get(f"x-ratelimit-reset-{kind}"))
+                    if reset:
+                        self._paused_until = max(self._paused_until, now + reset)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._backoff /= 2
+            if self._backoff < 0.5:
+                self._backoff = 0.0
+
+    def record_rate_limited(self, retry_after: Optional[float] = None) -> float:
+        """Pause every caller after a 429 and return the chosen delay in seconds."""
+
+        with self._lock:
+            self._backoff = min(
+                max(self._backoff * 2, 1.0), _MAX_BACKOFF_SECONDS
+            )
+            delay = max(retry_after or 0.0, self._backoff)
+            delay += random.uniform(0, delay * 0.25)
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+        _log.warning("Embedding rate limit hit; pausing requests for %.1fs", delay)
+        return delay
+
+
+_governors: Dict[Tuple[str, str], RateGovernor] = {}
+_governors_lock = Lock()
+
+
+def get_rate_governor(
+    provider: str,
+    model: str,
+    *,
+    requests_per_minute: int,
+    tokens_per_minute: int,
+) -> RateGovernor:
+    """Return the process-wide governor for a provider/model pair.
+
+    Limits are enforced per organisation and model, so every embedder instance in
+    the process (chunking and final embedding alike) shares one governor. When a
+    caller passes different limits, the shared governor switches to them.
+    """
+
+    key = (provider, model)
+    with _governors_lock:
+        governor = _governors.get(key)
+        if governor is None:
+            governor = RateGovernor(
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+            )
+            _governors[key] = governor
+        else:
+            governor.update_limits(
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+            )
+        return governor
+
+
+def dispatch_ordered(
+    items: Sequence[T],
+    fn: Callable[[T], R],
+    *,
+    concurrency: int,
+) -> List[R]:
+    """Apply `fn` to every item with up to `concurrency` calls in flight.
+
+    Results come back in input order regardless of completion order.
+    """
+
+    if not items:
+        return []
+    workers = min(max(1, concurrency), len(items))
+    if workers == 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fn, items))
+
+
+__all__ = [
+    "RateGovernor",
+    "dispatch_ordered",
+    "get_rate_governor",
+    "parse_reset_duration",
+]
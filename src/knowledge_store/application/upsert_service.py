@@ -1,11 +1,23 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Set
 
+from src.document_chunking.domain.models import DocumentChunk
+from src.knowledge_embedding.domain.services import prepare_embedding_inputs
 from src.knowledge_store.infrastructure.milvus_store import MilvusStore
 from src.shared.config import MilvusSettings
 
 
+@dataclass
+class IncrementalUpsertPlan:
+    """Diff between a document's new chunks and the rows already stored for it."""
+
+    new_chunks: List[DocumentChunk] = field(default_factory=list)
+    refresh_rows: List[Dict[str, Any]] = field(default_factory=list)
+    removed_ids: Set[str] = field(default_factory=set)
+
+
 def main_upsert(
     rows: Iterable[Dict[str, Any]],
     *,
@@ -21,3 +33,38 @@ def main_upsert(
 
     milvus = MilvusStore(settings.ensure_ready())
     milvus.upsert(rows)
+
+
+def plan_incremental_upsert(
+    store: MilvusStore,
+    chunks: Iterable[DocumentChunk],
+    *,
+    doc_name: str,
+    workspace_id: str,
+) -> IncrementalUpsertPlan:
+    """Split `chunks` into those needing embeddings and those already stored.
+
+    Chunk ids are content-derived, so an id that is already stored means the
+    chunk's text is unchanged and its vector can be kept; stored ids that no
+    longer appear belong to removed or edited chunks.
+    """
+
+    # Blank chunks are dropped by prepare_embedding_inputs; drop them here too so
+    # chunks and inputs stay aligned.
+    chunk_list = [chunk for chunk in chunks if chunk.text.strip()]
+    stored_ids = store.stored_chunk_ids(doc_name=doc_name, workspace_id=workspace_id)
+    inputs = prepare_embedding_inputs(chunk_list, workspace_id=workspace_id)
+
+    plan = IncrementalUpsertPlan()
+    current_ids: Set[str] = set()
+    for chunk, item in zip(chunk_list, inputs):
+        current_ids.add(item.id)
+        if item.id in stored_ids:
+            plan.refresh_rows.append(asdict(item))
+        else:
+            plan.new_chunks.append(chunk)
+    plan.removed_ids = stored_ids - current_ids
+    return plan
+
+
+__all__ = ["IncrementalUpsertPlan", "main_upsert", "plan_incremental_upsert"]
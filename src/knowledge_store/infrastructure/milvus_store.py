@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, Iterable, List, Optional
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set
 
-from pymilvus import DataType, MilvusClient
+from pymilvus import DataType, MilvusClient, MilvusException
 
 from src.knowledge_store.infrastructure.bm25_function import (
     BM25_FUNCTION_NAME,
@@ -13,6 +14,14 @@ from src.knowledge_store.infrastructure.bm25_function import (
 )
 from src.shared.config import MilvusSettings
 
+# Rows per insert/upsert/delete/query call during incremental syncs.
+_WRITE_BATCH = 1000
+
+
+def _batched(items: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
 
 class MilvusStore:
     """Lazy-initialized Milvus client tailored to chunk storage."""
@@ -320,6 +329,221 @@ class MilvusStore:
 
         self._client.insert(collection_name=self._collection, data=prepared)
 
+    def stored_chunk_ids(
+        self,
+        *,
+        doc_name: str,
+        workspace_id: str | None,
+    ) -> Set[str]:
+        """Return the ids of every row stored for `doc_name` in the workspace."""
+
+        workspace = (workspace_id or self._settings.partition_key_value or "").strip()
+        if not workspace or not doc_name:
+            return set()
+        if not self._client.has_collection(collection_name=self._collection):
+            return set()
+
+        iterator = self._client.query_iterator(
+            collection_name=self._collection,
+            batch_size=_WRITE_BATCH,
+            filter=self._and_filters(
+                self._eq_expr(self._pk_field, workspace),
+                self._eq_expr("doc_name", doc_name),
+            ),
+            output_fields=["id"],
+            consistency_level=self._settings.consistency_level,
+        )
+        ids: Set[str] = set()
+        try:
+            while True:
+                batch = iterator.next()
+                if not batch:
+                    break
+                ids.update(str(row["id"]) for row in batch)
+        finally:
+            iterator.close()
+        return ids
+
+    def copy_document(
+        self,
+        *,
+        doc_hash: str,
+        doc_name: str,
+        workspace_id: str | None,
+        chunk_id: Callable[[str, str, str], str],
+        source: str | None = None,
+    ) -> int:
+        """Store an already-ingested document's chunks under a new name.
+
+        Rows of one stored document with `doc_hash` are streamed and rewritten
+        with the new name, ids and timestamps, so identical content uploaded
+        under another filename needs no extraction or embedding calls. Rows
+        previously stored under `doc_name` are replaced. Returns the number of
+        rows copied; 0 means no stored document has this content.
+
+        `chunk_id(workspace_id, doc_name, chunk_key)` derives the new primary
+        keys, the same way the embedding stage keys freshly ingested chunks.
+        """
+
+        workspace = (workspace_id or self._settings.partition_key_value or "").strip()
+        if not workspace or not doc_hash or not doc_name:
+            return 0
+        if not self._client.has_collection(collection_name=self._collection):
+            return 0
+
+        hash_filter = self._and_filters(
+            self._eq_expr(self._pk_field, workspace),
+            self._eq_expr("doc_hash", doc_hash),
+        )
+        sources = self._client.query(
+            collection_name=self._collection,
+            filter=hash_filter,
+            output_fields=["doc_name"],
+            limit=1,
+            consistency_level=self._settings.consistency_level,
+        )
+        if not sources:
+            return 0
+        source_name = str(sources[0]["doc_name"])
+        if source_name == doc_name:
+            return 0
+
+        previous_ids = self.stored_chunk_ids(doc_name=doc_name, workspace_id=workspace)
+        iterator = self._client.query_iterator(
+            collection_name=self._collection,
+            batch_size=_WRITE_BATCH,
+            filter=self._and_filters(hash_filter, self._eq_expr("doc_name", source_name)),
+            output_fields=[
+                "id",
+                self._pk_field,
+                "doc_hash",
+                "doc_name",
+                "chunk_index",
+                "total_chunks",
+                "text",
+                "dense_vector",
+                "metadata",
+            ],
+            consistency_level=self._settings.consistency_level,
+        )
+
+        now_ms = int(time.time() * 1000)
+        copied_ids: Set[str] = set()
+        try:
+            while True:
+                batch = iterator.next()
+                if not batch:
+                    break
+                rows = [
+                    self._renamed_row(
+                        row, doc_name=doc_name, chunk_id=chunk_id, source=source, now_ms=now_ms
+                    )
+                    for row in batch
+                ]
+                # Upsert: ids are content-derived and may already exist under this name.
+                self._client.upsert(collection_name=self._collection, data=rows)
+                copied_ids.update(row["id"] for row in rows)
+        finally:
+            iterator.close()
+
+        stale = sorted(previous_ids - copied_ids)
+        for chunk in _batched(stale, _WRITE_BATCH):
+            self._client.delete(collection_name=self._collection, ids=list(chunk))
+        return len(copied_ids)
+
+    def _renamed_row(
+        self,
+        row: Dict[str, Any],
+        *,
+        doc_name: str,
+        chunk_id: Callable[[str, str, str], str],
+        source: str | None,
+        now_ms: int,
+    ) -> Dict[str, Any]:
+        metadata = dict(row.get("metadata") or {})
+        metadata["doc_name"] = doc_name
+        if source:
+            metadata["source"] = source
+        workspace = str(row[self._pk_field])
+        chunk_key = metadata.get("chunk_key")
+        # Rows stored before content-derived ids have no chunk_key to rebuild from.
+        new_id = chunk_id(workspace, doc_name, str(chunk_key)) if chunk_key else str(uuid.uuid4())
+        return {
+            "id": new_id,
+            self._pk_field: workspace,
+            "doc_hash": str(row["doc_hash"]),
+            "doc_name": doc_name,
+            "chunk_index": int(row["chunk_index"]),
+            "total_chunks": int(row["total_chunks"]),
+            "text": row.get("text", ""),
+            "dense_vector": list(row["dense_vector"]),
+            "metadata": metadata,
+            "created_at": now_ms,
+            "updated_at": now_ms,
+        }
+
+    def sync_document(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        *,
+        refresh: Iterable[Dict[str, Any]] = (),
+        delete_ids: Iterable[str] = (),
+    ) -> Dict[str, int]:
+        """Apply an incremental document update.
+
+        `rows` are new, embedded chunks to insert; `refresh` rows already exist and
+        only get their scalar fields (doc_hash, chunk positions, metadata,
+        updated_at) rewritten; `delete_ids` are chunks that no longer exist.
+        New rows are written before stale ones are removed so readers never see
+        the document with chunks missing.
+        """
+
+        prepared = self._prepare_rows(rows)
+        if prepared:
+            self.ensure_collection(dense_dim=len(prepared[0]["dense_vector"]))
+            for batch in _batched(prepared, _WRITE_BATCH):
+                self._client.insert(collection_name=self._collection, data=list(batch))
+
+        refreshed = self._prepare_refresh_rows(refresh)
+        for batch in _batched(refreshed, _WRITE_BATCH):
+            self._refresh_batch(list(batch))
+
+        stale = sorted(set(delete_ids))
+        for batch in _batched(stale, _WRITE_BATCH):
+            self._client.delete(collection_name=self._collection, ids=list(batch))
+
+        return {
+            "inserted": len(prepared),
+            "refreshed": len(refreshed),
+            "deleted": len(stale),
+        }
+
+    def _refresh_batch(self, rows: List[Dict[str, Any]]) -> None:
+        try:
+            self._client.upsert(
+                collection_name=self._collection,
+                data=rows,
+                partial_update=True,
+            )
+            return
+        except MilvusException:
+            pass
+
+        # Servers without partial-update support: rewrite whole rows, reusing the
+        # stored text and vectors instead of re-embedding.
+        stored = self._client.query(
+            collection_name=self._collection,
+            ids=[row["id"] for row in rows],
+            output_fields=["id", "text", "dense_vector", "created_at"],
+            consistency_level=self._settings.consistency_level,
+        )
+        by_id = {str(row["id"]): row for row in stored}
+        full_rows = [
+            {**by_id[row["id"]], **row} for row in rows if row["id"] in by_id
+        ]
+        if full_rows:
+            self._client.upsert(collection_name=self._collection, data=full_rows)
+
     def load(self) -> None:
         """Explicitly load the Milvus collection for search readiness."""
         self._client.load_collection(collection_name=self._collection)
@@ -383,6 +607,39 @@ class MilvusStore:
 
         return prepared
 
+    def _prepare_refresh_rows(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        prepared: List[Dict[str, Any]] = []
+        now_ms = int(time.time() * 1000)
+
+        for row in rows:
+            if not row:
+                continue
+            metadata = dict(row.get("metadata") or row.get("meta") or {})
+            workspace_id = (
+                row.get(self._pk_field)
+                or metadata.get(self._pk_field)
+                or self._settings.partition_key_value
+            )
+            if not workspace_id:
+                raise ValueError("workspace_id is required for Milvus upsert")
+            if not row.get("id"):
+                raise ValueError("Each row must include id")
+
+            prepared.append(
+                {
+                    "id": str(row["id"]),
+                    self._pk_field: str(workspace_id),
+                    "doc_hash": str(row["doc_hash"]),
+                    "doc_name": str(row["doc_name"]),
+                    "chunk_index": int(row["chunk_index"]),
+                    "total_chunks": int(row["total_chunks"]),
+                    "metadata": metadata,
+                    "updated_at": int(row.get("updated_at") or now_ms),
+                }
+            )
+
+        return prepared
+
     @staticmethod
     def _eq_expr(field: str, value: str) -> str:
         escaped = str(value).replace('"', '\\"')
@@ -10,6 +10,9 @@ from dotenv import load_dotenv
 
 
 load_dotenv()
+# Host-specific Docling tuning written by script/autotune_docling.py; values
+# already set in the environment or .env take precedence.
+load_dotenv(os.getenv("EXTRACTION_TUNING_PATH", ".cache/docling_tuning.env"))
 
 
 def _str_env(key: str, default: str = "") -> str:
@@ -40,6 +43,13 @@ def _float_env(key: str, default: float) -> float:
         return default
 
 
+def _bool_env(key: str, default: bool) -> bool:
+    value = _str_env(key, "")
+    if not value:
+        return default
+    return value.lower() in {"1", "true", "yes", "on"}
+
+
 def _optional_float_env(key: str) -> Optional[float]:
     value = _str_env(key, "")
     if not value or value.lower() == "auto":
@@ -50,6 +60,16 @@ def _optional_float_env(key: str) -> Optional[float]:
         return None
 
 
+def _optional_int_env(key: str) -> Optional[int]:
+    value = _str_env(key, "")
+    if not value or value.lower() == "auto":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
 def _embedding_api_key_default() -> str:
     return _str_env("OPENAI_API_KEY") or _str_env("GEMINI_API_KEY")
 
@@ -79,6 +99,8 @@ class MilvusSettings:
     dense_metric: str = field(default_factory=lambda: _str_env("MILVUS_DENSE_METRIC", "COSINE"))
     sparse_metric: str = field(default_factory=lambda: _str_env("MILVUS_SPARSE_METRIC", "IP"))
     consistency_level: str = field(default_factory=lambda: _str_env("MILVUS_CONSISTENCY_LEVEL", "Bounded"))
+    # Diff chunk ids against stored rows and only embed/insert/delete what changed.
+    incremental_upsert: bool = field(default_factory=lambda: _bool_env("MILVUS_INCREMENTAL_UPSERT", True))
 
     def token(self) -> Optional[str]:
         if self.username and self.password:
@@ -102,7 +124,27 @@ class MilvusSettings:
 class EmbeddingSettings:
     api_key: str = field(default_factory=_embedding_api_key_default)
     model: str = field(default_factory=_embedding_model_default)
+    # Requested output dimensionality; None keeps the model's native size.
+    dimensions: Optional[int] = field(default_factory=lambda: _optional_int_env("EMBED_DIMENSIONS"))
     batch_size: int = field(default_factory=lambda: _int_env("BATCH_SIZE", 128))
+    # 0 means "use the provider's documented limit".
+    max_tokens_per_request: int = field(
+        default_factory=lambda: _int_env("EMBED_MAX_TOKENS_PER_REQUEST", 0)
+    )
+    max_input_tokens: int = field(default_factory=lambda: _int_env("EMBED_MAX_INPUT_TOKENS", 0))
+    oversize_policy: str = field(
+        default_factory=lambda: _str_env("EMBED_OVERSIZE_POLICY", "split").lower()
+    )
+    concurrency: int = field(default_factory=lambda: _int_env("EMBED_CONCURRENCY", 4))
+    # 0 disables the corresponding bucket in the rate governor.
+    requests_per_minute: int = field(default_factory=lambda: _int_env("EMBED_RPM", 3000))
+    tokens_per_minute: int = field(default_factory=lambda: _int_env("EMBED_TPM", 1_000_000))
+    max_retries: int = field(default_factory=lambda: _int_env("EMBED_MAX_RETRIES", 6))
+    # Set EMBED_CACHE_PATH=off to disable the persistent embedding cache.
+    cache_path: str = field(
+        default_factory=lambda: _str_env("EMBED_CACHE_PATH", ".cache/embeddings.sqlite3")
+    )
+    cache_max_mb: int = field(default_factory=lambda: _int_env("EMBED_CACHE_MAX_MB", 2048))
     milvus: MilvusSettings = field(default_factory=MilvusSettings)
     embed_price_per_million_tokens: Optional[float] = field(
         default_factory=_embedding_price_override_default
@@ -123,12 +165,18 @@ class ChunkingSettings:
     embedding: EmbeddingSettings = field(default_factory=EmbeddingSettings)
     presplit_min_chars: int = field(default_factory=lambda: _int_env("PRESPLIT_MIN_CHARS", 1200))
     presplit_overlap_chars: int = field(default_factory=lambda: _int_env("PRESPLIT_OVERLAP_CHARS", 0))
+    # Deepest header level (1-6) that starts a new structural section.
+    markdown_header_depth: int = field(default_factory=lambda: _int_env("MARKDOWN_HEADER_DEPTH", 3))
     min_chars_per_subchunk: int = field(default_factory=lambda: _int_env("MIN_CHARS", 400))
     semantic_buffer_size: int = field(default_factory=lambda: _int_env("SEMANTIC_BUFFER_SIZE", 1))
     semantic_breakpoint_type: str = field(default_factory=lambda: _str_env("SEMANTIC_BREAKPOINT_TYPE", "percentile"))
     semantic_breakpoint_amount: Optional[float] = field(
         default_factory=lambda: _optional_float_env("SEMANTIC_BREAKPOINT_AMOUNT")
     )
+    # auto | regex | thai
+    sentence_segmenter: str = field(default_factory=lambda: _str_env("SENTENCE_SEGMENTER", "auto"))
+    thai_sentence_engine: str = field(default_factory=lambda: _str_env("THAI_SENTENCE_ENGINE", "crfcut"))
+    max_sentence_chars: int = field(default_factory=lambda: _int_env("MAX_SENTENCE_CHARS", 1000))
 
 
 @dataclass
@@ -142,6 +190,68 @@ class ExtractionSettings:
         )
     )
     ocr_cost_per_page: float = field(default_factory=lambda: _float_env("MISTRAL_OCR_COST_PER_PAGE", 0.005))
+    # Pages of one Docling page batch OCR'd in parallel.
+    ocr_concurrency: int = field(default_factory=lambda: _int_env("MISTRAL_OCR_CONCURRENCY", 4))
+    # auto | page | document — "document" uploads scanned PDFs instead of page images.
+    ocr_submission: str = field(default_factory=lambda: _str_env("MISTRAL_OCR_SUBMISSION", "auto"))
+    ocr_pages_per_request: int = field(default_factory=lambda: _int_env("MISTRAL_OCR_PAGES_PER_REQUEST", 50))
+    # Build markdown straight from Mistral OCR (no Docling layout/table models)
+    # for PDFs whose every page needs OCR.
+    ocr_direct_markdown: bool = field(default_factory=lambda: _bool_env("MISTRAL_OCR_DIRECT_MARKDOWN", True))
+    # Default speed/quality profile (fast | balanced | accurate); see pipeline_option.
+    extraction_profile: str = field(default_factory=lambda: _str_env("EXTRACTION_PROFILE", "accurate"))
+    # Docling model runtime: device (auto | cpu | cuda | mps) and CPU threads
+    # (0 = OMP_NUM_THREADS, else every core).
+    device: str = field(default_factory=lambda: _str_env("EXTRACTION_DEVICE", "auto"))
+    num_threads: int = field(default_factory=lambda: _int_env("EXTRACTION_NUM_THREADS", 0))
+    # "standard" runs the PDF stages one page batch at a time; "threaded"
+    # overlaps them, with a batch size per stage.
+    pdf_pipeline: str = field(default_factory=lambda: _str_env("EXTRACTION_PDF_PIPELINE", "standard"))
+    page_batch_size: int = field(default_factory=lambda: _int_env("EXTRACTION_PAGE_BATCH_SIZE", 4))
+    layout_batch_size: int = field(default_factory=lambda: _int_env("EXTRACTION_LAYOUT_BATCH_SIZE", 4))
+    ocr_batch_size: int = field(default_factory=lambda: _int_env("EXTRACTION_OCR_BATCH_SIZE", 4))
+    table_batch_size: int = field(default_factory=lambda: _int_env("EXTRACTION_TABLE_BATCH_SIZE", 4))
+    # Convert PDFs of at least `parallel_min_pages` pages as page ranges in
+    # this many worker processes (0 or 1 converts in-process).
+    extraction_workers: int = field(default_factory=lambda: _int_env("EXTRACTION_WORKERS", 0))
+    parallel_min_pages: int = field(default_factory=lambda: _int_env("EXTRACTION_PARALLEL_MIN_PAGES", 100))
+    pages_per_range: int = field(default_factory=lambda: _int_env("EXTRACTION_PAGES_PER_RANGE", 50))
+    # Set MISTRAL_OCR_CACHE_PATH=off to disable the persistent OCR result cache.
+    ocr_cache_path: str = field(
+        default_factory=lambda: _str_env("MISTRAL_OCR_CACHE_PATH", ".cache/ocr.sqlite3")
+    )
+    ocr_cache_max_mb: int = field(default_factory=lambda: _int_env("MISTRAL_OCR_CACHE_MAX_MB", 512))
+    # Decorative-picture filter applied before picture description (sizes in page points).
+    picture_filter_enabled: bool = field(default_factory=lambda: _bool_env("PICTURE_FILTER_ENABLED", True))
+    picture_min_side: float = field(default_factory=lambda: _float_env("PICTURE_MIN_SIDE", 32.0))
+    picture_max_aspect_ratio: float = field(default_factory=lambda: _float_env("PICTURE_MAX_ASPECT_RATIO", 8.0))
+    picture_min_entropy_bits: float = field(default_factory=lambda: _float_env("PICTURE_MIN_ENTROPY_BITS", 0.25))
+    picture_min_colors: int = field(default_factory=lambda: _int_env("PICTURE_MIN_COLORS", 2))
+    # Picture description requests in flight per process (shared across documents).
+    picture_concurrency: int = field(default_factory=lambda: _int_env("MISTRAL_PICTURE_CONCURRENCY", 4))
+    # Set MISTRAL_PICTURE_CACHE_PATH=off to disable the persistent description cache.
+    picture_cache_path: str = field(
+        default_factory=lambda: _str_env(
+            "MISTRAL_PICTURE_CACHE_PATH", ".cache/picture_descriptions.sqlite3"
+        )
+    )
+    picture_cache_max_mb: int = field(default_factory=lambda: _int_env("MISTRAL_PICTURE_CACHE_MAX_MB", 64))
+    # Image payloads sent to the OCR and vision models: PNG | JPEG | WEBP,
+    # lossy quality, and the long edge (px) images are downscaled to (0 = as rendered).
+    ocr_image_format: str = field(default_factory=lambda: _str_env("MISTRAL_OCR_IMAGE_FORMAT", "JPEG"))
+    ocr_image_quality: int = field(default_factory=lambda: _int_env("MISTRAL_OCR_IMAGE_QUALITY", 90))
+    ocr_image_max_edge: int = field(default_factory=lambda: _int_env("MISTRAL_OCR_IMAGE_MAX_EDGE", 2048))
+    picture_image_format: str = field(default_factory=lambda: _str_env("MISTRAL_PICTURE_IMAGE_FORMAT", "JPEG"))
+    picture_image_quality: int = field(default_factory=lambda: _int_env("MISTRAL_PICTURE_IMAGE_QUALITY", 80))
+    picture_image_max_edge: int = field(default_factory=lambda: _int_env("MISTRAL_PICTURE_IMAGE_MAX_EDGE", 1024))
+    # Mistral call resilience: per-call OCR timeout, retries with jittered
+    # exponential backoff, and a circuit breaker shared by OCR and pictures.
+    ocr_timeout_seconds: float = field(default_factory=lambda: _float_env("MISTRAL_OCR_TIMEOUT_SECONDS", 120.0))
+    retry_attempts: int = field(default_factory=lambda: _int_env("MISTRAL_RETRY_ATTEMPTS", 3))
+    retry_base_delay: float = field(default_factory=lambda: _float_env("MISTRAL_RETRY_BASE_DELAY", 0.5))
+    retry_max_delay: float = field(default_factory=lambda: _float_env("MISTRAL_RETRY_MAX_DELAY", 8.0))
+    breaker_failure_threshold: int = field(default_factory=lambda: _int_env("MISTRAL_BREAKER_THRESHOLD", 5))
+    breaker_reset_seconds: float = field(default_factory=lambda: _float_env("MISTRAL_BREAKER_RESET_SECONDS", 30.0))
     picture_input_cost_per_million: float = field(
         default_factory=lambda: _float_env("MISTRAL_PICTURE_INPUT_COST_PER_MILLION", 1.8)
     )
@@ -0,0 +1,170 @@
+"""Size-bounded, LRU-evicting key/value cache persisted in SQLite."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+# Parameters per statement stay well below SQLite's default variable limit.
+_QUERY_CHUNK = 500
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SqliteLruCache:
+    """Persist opaque byte values keyed by strings, evicting least recently used.
+
+    Entries are evicted once the stored payload exceeds `max_bytes`; eviction
+    trims down to 90% of the budget so it does not run on every write. The
+    connection is shared across threads behind a lock, and WAL mode lets
+    several processes read the same file concurrently.
+    """
+
+    def __init__(self, path: str | Path, *, max_bytes: int) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = Lock()
+        self._stats = CacheStats()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access)"
+        )
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        self._total_bytes = int(row[0])
+
+    # --- access -----------------------------------------------------------------------
+    def get_many(self, keys: Sequence[str]) -> Dict[str, bytes]:
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+
+        found: Dict[str, bytes] = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(unique), _QUERY_CHUNK):
+                chunk = unique[start : start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM entries WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                found.update((key, bytes(value)) for key, value in rows)
+
+            if found:
+                self._conn.executemany(
+                    "UPDATE entries SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+            self._stats.hits += len(found)
+            self._stats.misses += len(unique) - len(found)
+        return found
+
+    def get(self, key: str) -> bytes | None:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: Mapping[str, bytes] | Iterable[Tuple[str, bytes]]) -> None:
+        pairs: List[Tuple[str, bytes]] = list(
+            items.items() if isinstance(items, Mapping) else items
+        )
+        if not pairs:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for key, value in pairs:
+                    previous = self._conn.execute(
+                        "SELECT size FROM entries WHERE key = ?", (key,)
+                    ).fetchone()
+                    if previous is not None:
+                        self._total_bytes -= int(previous[0])
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO entries(key, value, size, last_access) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, sqlite3.Binary(value), len(value), now),
+                    )
+                    self._total_bytes += len(value)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._stats.writes += len(pairs)
+            if self.max_bytes and self._total_bytes > self.max_bytes:
+                self._evict(int(self.max_bytes * 0.9))
+
+    def put(self, key: str, value: bytes) -> None:
+        self.put_many([(key, value)])
+
+    def _evict(self, target_bytes: int) -> None:
+        evicted = 0
+        while self._total_bytes > target_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access LIMIT ?",
+                (_QUERY_CHUNK,),
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+            doomed: List[str] = []
+            for key, size in rows:
+                if self._total_bytes <= target_bytes:
+                    break
+                doomed.append(key)
+                self._total_bytes -= int(size)
+            self._conn.executemany(
+                "DELETE FROM entries WHERE key = ?", [(key,) for key in doomed]
+            )
+            evicted += len(doomed)
+        self._stats.evictions += evicted
+
+    # --- reporting --------------------------------------------------------------------
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                **asdict(self._stats),
+                "hit_rate": self._stats.hit_rate,
+                "stored_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = CacheStats()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["CacheStats", "SqliteLruCache"]